@@ -0,0 +1,203 @@
+"""
+A module for auth in the app.api.api_v1.router package.
+"""
+
+import logging
+import time
+from typing import Annotated
+from uuid import UUID, uuid4
+
+from fastapi import APIRouter, Body, Depends, HTTPException, Response, status
+from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.routing import AppRoute
+from app.config.auth_settings import AuthSettings
+from app.config.config import get_auth_settings
+from app.core.enums.toke_type import TokenType
+from app.core.security.authentication import (
+	authenticate_user,
+	forget_token,
+	oauth2_scheme,
+	verify_token,
+)
+from app.core.security.jwt import create_access_token, create_refresh_token
+from app.core.security.refresh_token_store import (
+	RefreshTokenStore,
+	get_refresh_token_store,
+)
+from app.db.session import get_session
+from app.exceptions.exceptions import InvalidTokenError
+from app.models.structured import User
+from app.schemas.external.token import TokenResponse
+from app.schemas.external.token_payload import TokenPayload
+
+logger: logging.Logger = logging.getLogger(__name__)
+router: APIRouter = APIRouter(
+	prefix="/auth", tags=["auth"], route_class=AppRoute
+)
+
+
+def _credentials_exception(auth_settings: AuthSettings) -> HTTPException:
+	"""
+	Build the 401 response of a failed authentication
+
+	Args:
+		auth_settings (AuthSettings): The auth settings with the headers
+
+	Returns:
+		HTTPException: The exception to raise
+	"""
+	return HTTPException(
+		status_code=status.HTTP_401_UNAUTHORIZED,
+		detail=auth_settings.DETAIL,
+		headers=auth_settings.HEADERS,
+	)
+
+
+def _issue_tokens(
+	token_payload: TokenPayload,
+	refresh_jti: UUID,
+	auth_settings: AuthSettings,
+) -> TokenResponse:
+	"""
+	Sign a fresh access token and the refresh token of a session
+
+	Args:
+		token_payload (TokenPayload): The claims of the session
+		refresh_jti (UUID): The JTI of the refresh token
+		auth_settings (AuthSettings): The auth settings with the secret key
+
+	Returns:
+		TokenResponse: The signed token pair
+	"""
+	now: int = int(time.time())
+	access_payload: TokenPayload = token_payload.model_copy(
+		update={
+			"jti": uuid4(),
+			"iat": now,
+			"nbf": now,
+			"exp": now + int(auth_settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60),
+			"scope": TokenType.ACCESS_TOKEN,
+		}
+	)
+	return TokenResponse(
+		access_token=create_access_token(access_payload, auth_settings),
+		refresh_token=create_refresh_token(
+			access_payload.model_copy(update={"jti": refresh_jti}),
+			auth_settings,
+		),
+	)
+
+
+@router.post("/login", response_model=TokenResponse)
+async def login(
+	form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
+	auth_settings: Annotated[AuthSettings, Depends(get_auth_settings)],
+	token_store: Annotated[RefreshTokenStore, Depends(get_refresh_token_store)],
+	db: AsyncSession = Depends(get_session),
+) -> TokenResponse:
+	"""
+	**Log in with username and password to start a session.**
+
+	## Args:
+		form_data (OAuth2PasswordRequestForm): The username and password
+
+	## Returns:
+		TokenResponse: The access token and the refresh token
+	"""
+	user: User | None = await authenticate_user(
+		form_data.username, form_data.password, db
+	)
+	if user is None or not user.is_active:
+		logger.info("Failed login for %s", form_data.username)
+		raise _credentials_exception(auth_settings)
+	now: int = int(time.time())
+	sid: UUID = uuid4()
+	refresh_jti: UUID = uuid4()
+	token_payload: TokenPayload = TokenPayload(
+		iss=auth_settings.SERVER_URL,
+		sub=f"username:{user.id}",
+		aud=str(auth_settings.AUDIENCE),
+		exp=now,
+		nbf=now,
+		iat=now,
+		sid=sid,
+		email=user.email,
+		nickname=user.first_name,
+		preferred_username=user.username,
+	)
+	await token_store.open(sid, refresh_jti)
+	logger.info("User %s logged in with session %s", user.id, sid)
+	return _issue_tokens(token_payload, refresh_jti, auth_settings)
+
+
+@router.post("/refresh", response_model=TokenResponse)
+async def refresh(
+	refresh_token: Annotated[
+		str,
+		Body(
+			...,
+			embed=True,
+			title="Refresh token",
+			description="The refresh token of the session",
+			min_length=30,
+		),
+	],
+	auth_settings: Annotated[AuthSettings, Depends(get_auth_settings)],
+	token_store: Annotated[RefreshTokenStore, Depends(get_refresh_token_store)],
+) -> TokenResponse:
+	"""
+	**Exchange a refresh token for a new token pair.**
+
+	Each refresh token works once. Presenting one again revokes its session.
+
+	## Args:
+		refresh_token (str): The refresh token of the session
+
+	## Returns:
+		TokenResponse: The new access token and refresh token
+	"""
+	try:
+		token_payload: TokenPayload = verify_token(
+			refresh_token, auth_settings, TokenType.REFRESH_TOKEN
+		)
+	except InvalidTokenError as exc:
+		logger.info("Rejected refresh token: %s", exc)
+		raise _credentials_exception(auth_settings) from exc
+	forget_token(refresh_token)
+	next_jti: UUID = uuid4()
+	if (
+		token_payload.sid is None
+		or token_payload.jti is None
+		or not await token_store.rotate(
+			token_payload.sid, token_payload.jti, next_jti
+		)
+	):
+		raise _credentials_exception(auth_settings)
+	return _issue_tokens(token_payload, next_jti, auth_settings)
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(
+	token: Annotated[str, Depends(oauth2_scheme)],
+	auth_settings: Annotated[AuthSettings, Depends(get_auth_settings)],
+	token_store: Annotated[RefreshTokenStore, Depends(get_refresh_token_store)],
+) -> Response:
+	"""
+	**End the session of the access token.**
+
+	The refresh token stops working at once. The access token stays valid
+	until it expires.
+
+	## Returns:
+		Response: An empty response
+	"""
+	try:
+		token_payload: TokenPayload = verify_token(token, auth_settings)
+	except InvalidTokenError as exc:
+		logger.info("Rejected bearer token: %s", exc)
+		raise _credentials_exception(auth_settings) from exc
+	if token_payload.sid is not None:
+		await token_store.revoke(token_payload.sid)
+	return Response(status_code=status.HTTP_204_NO_CONTENT)
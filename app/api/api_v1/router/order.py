@@ -3,35 +3,48 @@ A module for order in the app.api.api_v1.router package.
 """
 
 import logging
-from typing import Annotated
+from typing import Annotated, Any
 from uuid import uuid4
 
 from fastapi import APIRouter, Body, Depends, HTTPException, Path, status
 from pydantic import UUID4
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.routing import AppRoute
+from app.core.content_negotiation import NegotiatedResponse
 from app.db.session import get_session
 from app.models.structured import Order
 from app.repositories.structured.order_repository import OrderRepository
 from app.schemas.order import OrderCreate, OrderResponse
+from app.utils.sparse_fieldsets import FieldSelector, dump_fields
 
 logger: logging.Logger = logging.getLogger(__name__)
-router: APIRouter = APIRouter(prefix="/order", tags=["order"])
+router: APIRouter = APIRouter(
+	prefix="/order", tags=["order"], route_class=AppRoute
+)
+order_response_columns: tuple[str, ...] = tuple(OrderResponse.model_fields)
+order_field_selector: FieldSelector = FieldSelector(OrderResponse)
 
 
 @router.get("", response_model=list[OrderResponse])
 async def get_all_orders(
+	fields: Annotated[tuple[str, ...] | None, Depends(order_field_selector)],
 	db: AsyncSession = Depends(get_session),
-) -> list[OrderResponse]:
+) -> NegotiatedResponse:
 	"""
 	**Retrieve all orders.**
 
+	## Args:
+		fields (str): Optional comma-separated fields to return
+
 	## Returns:
-		List[OrderResponse]: A list of orders including order items
+		List[OrderResponse]: A list of orders
 	"""
 	order_repository: OrderRepository = OrderRepository(session=db)
-	orders: list[Order] = await order_repository.get_all()
-	return [OrderResponse.model_validate(order) for order in orders]
+	orders: list[dict[str, Any]] = await order_repository.fetch_rows(
+		fields or order_response_columns
+	)
+	return NegotiatedResponse(orders)
 
 
 @router.get("/{order_id}", response_model=OrderResponse)
@@ -45,23 +58,27 @@ async def get_order_by_id(
 			example=uuid4(),
 		),
 	],
+	fields: Annotated[tuple[str, ...] | None, Depends(order_field_selector)],
 	db: AsyncSession = Depends(get_session),
-) -> OrderResponse:
+) -> OrderResponse | NegotiatedResponse:
 	"""
 	**Get an order by its UUID.**
 
 	## Args:
 		order_id (UUID4): Order ID
+		fields (str): Optional comma-separated fields to return
 
 	## Returns:
 		OrderResponse: The found order including its items
 	"""
 	order_repository: OrderRepository = OrderRepository(session=db)
-	order: Order | None = await order_repository.get(order_id)
+	order: Order | None = await order_repository.get(order_id, fields)
 	if not order:
 		msg: str = f"Order with ID {order_id} not found"
-		logger.error(msg)
+		logger.error("Order with ID %s not found", order_id)
 		raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=msg)
+	if fields:
+		return NegotiatedResponse(dump_fields(OrderResponse, fields, order))
 	return OrderResponse.model_validate(order)
 
 
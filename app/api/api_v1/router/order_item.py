@@ -10,6 +10,7 @@ from fastapi import APIRouter, Depends, HTTPException, Path, status
 from pydantic import UUID4
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.routing import AppRoute
 from app.db.session import get_session
 from app.models.structured import OrderItem
 from app.repositories.structured.order_item_repository import (
@@ -18,7 +19,9 @@ from app.repositories.structured.order_item_repository import (
 from app.schemas.order_item import OrderItemResponse
 
 logger: logging.Logger = logging.getLogger(__name__)
-router: APIRouter = APIRouter(prefix="/order-item", tags=["order-item"])
+router: APIRouter = APIRouter(
+	prefix="/order-item", tags=["order-item"], route_class=AppRoute
+)
 
 
 @router.get("/{item_id}", response_model=OrderItemResponse)
@@ -47,7 +50,7 @@ async def get_order_item_by_id(
 	item: OrderItem | None = await order_item_repository.get(item_id)
 	if not item:
 		msg: str = f"OrderItem with ID {item_id} not found"
-		logger.exception(msg)
+		logger.info("OrderItem with ID %s not found", item_id)
 		raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=msg)
 	return OrderItemResponse.model_validate(item)
 
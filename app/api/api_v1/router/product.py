@@ -3,21 +3,92 @@ A module for product in the app.api.api_v1.router package.
 """
 
 import logging
-from typing import Annotated
+from typing import Annotated, Any
 from uuid import uuid4
 
-from fastapi import APIRouter, Body, Depends, HTTPException, Path, status
+from fastapi import (
+	APIRouter,
+	Body,
+	Depends,
+	HTTPException,
+	Path,
+	Query,
+	status,
+)
 from fastapi.responses import ORJSONResponse
 from pydantic import UUID4
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.routing import AppRoute
+from app.config.config import setting
+from app.core.content_negotiation import NegotiatedResponse
+from app.core.deadline import request_timeout
+from app.core.entity_cache import (
+	EntityCache,
+	EntityCacheDependency,
+	get_many_through_cache,
+)
 from app.db.session import get_session
 from app.models.structured import Product
 from app.repositories.structured.product_repository import ProductRepository
+from app.schemas.batch import BatchResponse
 from app.schemas.product import ProductCreate, ProductResponse, ProductUpdate
+from app.utils.sparse_fieldsets import (
+	FieldSelector,
+	dump_fields,
+	select_fields,
+)
 
 logger: logging.Logger = logging.getLogger(__name__)
-router: APIRouter = APIRouter(prefix="/product", tags=["product"])
+router: APIRouter = APIRouter(
+	prefix="/product", tags=["product"], route_class=AppRoute
+)
+product_field_selector: FieldSelector = FieldSelector(ProductResponse)
+product_cache_dependency: EntityCacheDependency = EntityCacheDependency(
+	"product"
+)
+
+
+@router.get("", response_model=BatchResponse[ProductResponse])
+async def get_products_by_ids(
+	ids: Annotated[
+		list[UUID4],
+		Query(
+			...,
+			title="Product IDs",
+			description="IDs of the products to retrieve",
+			min_length=1,
+			max_length=setting.BATCH_MAX_IDS,
+		),
+	],
+	fields: Annotated[tuple[str, ...] | None, Depends(product_field_selector)],
+	cache: Annotated[EntityCache, Depends(product_cache_dependency)],
+	db: AsyncSession = Depends(get_session),
+) -> NegotiatedResponse:
+	"""
+	**Get several products by their IDs in a single request.**
+
+	## Args:
+		ids (list[UUID4]): IDs of the products, repeated as query parameter
+		fields (str): Optional comma-separated fields to return
+
+	## Returns:
+		BatchResponse[ProductResponse]: The products in request order
+	"""
+	product_repository: ProductRepository = ProductRepository(session=db)
+	items: list[dict[str, Any] | None] = await get_many_through_cache(
+		ids, cache, product_repository, ProductResponse
+	)
+	return NegotiatedResponse(
+		{
+			"items": [select_fields(item, fields) for item in items],
+			"not_found": [
+				_id
+				for _id, item in zip(ids, items, strict=True)
+				if item is None
+			],
+		}
+	)
 
 
 @router.get("/{product_id}", response_model=ProductResponse)
@@ -31,27 +102,35 @@ async def get_product(
 			example=uuid4(),
 		),
 	],
+	fields: Annotated[tuple[str, ...] | None, Depends(product_field_selector)],
 	db: AsyncSession = Depends(get_session),
-) -> ProductResponse:
+) -> ProductResponse | NegotiatedResponse:
 	"""
 	**Get a product by ID.**
 
 	## Args:
 		product_id (UUID4): UUID of the product
+		fields (str): Optional comma-separated fields to return
 
 	## Returns:
 		ProductResponse: The found product
 	"""
 	product_repository: ProductRepository = ProductRepository(session=db)
-	product: Product | None = await product_repository.get(product_id)
+	product: Product | None = await product_repository.get(product_id, fields)
 	if not product:
 		msg: str = f"The product with id: {product_id} has not been found on the system"
-		logger.error(msg)
+		logger.error(
+			"The product with id: %s has not been found on the system",
+			product_id,
+		)
 		raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=msg)
+	if fields:
+		return NegotiatedResponse(dump_fields(ProductResponse, fields, product))
 	return ProductResponse.model_validate(product)
 
 
 @router.get("/name/{name}", response_model=ProductResponse)
+@request_timeout(2.0)
 async def get_product_by_name(
 	name: Annotated[
 		str,
@@ -62,23 +141,27 @@ async def get_product_by_name(
 			example="product-name",
 		),
 	],
+	fields: Annotated[tuple[str, ...] | None, Depends(product_field_selector)],
 	db: AsyncSession = Depends(get_session),
-) -> ProductResponse:
+) -> ProductResponse | NegotiatedResponse:
 	"""
 	**Get a product by its name.**
 
 	## Args:
 		name (str): Name of the product
+		fields (str): Optional comma-separated fields to return
 
 	## Returns:
 		ProductResponse: The found product
 	"""
 	product_repository: ProductRepository = ProductRepository(session=db)
-	product: Product | None = await product_repository.get_by_name(name)
+	product: Product | None = await product_repository.get_by_name(name, fields)
 	if not product:
 		msg: str = f"Product {name} not found"
-		logger.error(msg)
+		logger.error("Product %s not found", name)
 		raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=msg)
+	if fields:
+		return NegotiatedResponse(dump_fields(ProductResponse, fields, product))
 	return ProductResponse.model_validate(product)
 
 
@@ -130,6 +213,7 @@ async def update_product(
 			description="Product data to update",
 		),
 	],
+	cache: Annotated[EntityCache, Depends(product_cache_dependency)],
 	db: AsyncSession = Depends(get_session),
 ) -> ProductResponse:
 	"""
@@ -146,11 +230,14 @@ async def update_product(
 	product: Product | None = await product_repository.get(product_id)
 	if not product:
 		msg: str = f"Product with ID {product_id} not found"
-		logger.error(msg)
+		logger.error("Product with ID %s not found", product_id)
 		raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=msg)
 	updated_product: Product = await product_repository.update(
 		product, product_in.model_dump(exclude_unset=True)
 	)
+	# A read before the commit would cache the old row again
+	await db.commit()
+	await cache.delete(product_id)
 	return ProductResponse.model_validate(updated_product)
 
 
@@ -165,6 +252,7 @@ async def set_product_as_inactive(
 			example=uuid4(),
 		),
 	],
+	cache: Annotated[EntityCache, Depends(product_cache_dependency)],
 	db: AsyncSession = Depends(get_session),
 ):
 	"""
@@ -178,9 +266,10 @@ async def set_product_as_inactive(
 	"""
 	product_repository: ProductRepository = ProductRepository(session=db)
 	success: bool = await product_repository.soft_delete(product_id)
+	await cache.delete(product_id)
 	if not success:
 		msg: str = f"Product with ID {product_id} not found"
-		logger.error(msg)
+		logger.error("Product with ID %s not found", product_id)
 		raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=msg)
 	return ORJSONResponse(
 		status_code=status.HTTP_204_NO_CONTENT, content={"deleted": success}
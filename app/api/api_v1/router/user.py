@@ -3,21 +3,155 @@ A module for user in the app.api.api_v1.router package.
 """
 
 import logging
-from typing import Annotated
+from collections.abc import Awaitable, Callable
+from typing import Annotated, Any, Final
 from uuid import uuid4
 
-from fastapi import APIRouter, Body, Depends, HTTPException, Path, status
+from fastapi import (
+	APIRouter,
+	Body,
+	Depends,
+	HTTPException,
+	Path,
+	Query,
+	status,
+)
 from fastapi.responses import ORJSONResponse
-from pydantic import UUID4
+from pydantic import UUID4, EmailStr
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.routing import AppRoute
+from app.config.config import setting
+from app.core.content_negotiation import NegotiatedResponse
+from app.core.entity_cache import (
+	EntityCache,
+	EntityCacheDependency,
+	get_many_through_cache,
+)
+from app.core.metrics import USER_AVAILABILITY_CHECKS
+from app.core.security.authentication import (
+	get_current_user,
+	invalidate_user,
+)
+from app.core.security.password import hash_password_async
+from app.core.user_identity_filter import (
+	UserIdentityFilter,
+	get_user_identity_filter,
+)
 from app.db.session import get_session
 from app.models.structured import User
 from app.repositories.structured.user_repository import UserRepository
-from app.schemas.user import UserCreate, UserResponse, UserUpdate
+from app.schemas.batch import BatchResponse
+from app.schemas.user import (
+	UserAvailability,
+	UserCreate,
+	UserResponse,
+	UserUpdate,
+)
+from app.utils.sparse_fieldsets import (
+	FieldSelector,
+	dump_fields,
+	select_fields,
+)
 
 logger: logging.Logger = logging.getLogger(__name__)
-router: APIRouter = APIRouter(prefix="/user", tags=["user"])
+router: APIRouter = APIRouter(
+	prefix="/user", tags=["user"], route_class=AppRoute
+)
+user_response_columns: tuple[str, ...] = tuple(UserResponse.model_fields)
+user_field_selector: FieldSelector = FieldSelector(UserResponse)
+user_cache_dependency: EntityCacheDependency = EntityCacheDependency("user")
+UNIQUE_VIOLATION: Final[str] = "23505"
+
+
+async def _is_taken(
+	field: str, might_exist: bool, confirm: Callable[[], Awaitable[bool]]
+) -> bool:
+	"""
+	Check whether a username or email is registered, querying the database
+	only when the identity filter cannot rule it out
+
+	Args:
+		field (str): The field name, for the metrics
+		might_exist (bool): The answer of the identity filter
+		confirm (Callable[[], Awaitable[bool]]): The database check
+
+	Returns:
+		bool: True if the value is registered
+	"""
+	if not might_exist:
+		USER_AVAILABILITY_CHECKS.labels(field=field, result="filtered").inc()
+		return False
+	taken: bool = await confirm()
+	USER_AVAILABILITY_CHECKS.labels(
+		field=field, result="taken" if taken else "free"
+	).inc()
+	return taken
+
+
+@router.get("/availability", response_model=UserAvailability)
+async def check_availability(
+	identity_filter: Annotated[
+		UserIdentityFilter, Depends(get_user_identity_filter)
+	],
+	username: Annotated[
+		str | None,
+		Query(
+			title="Username",
+			description="Username to check",
+			min_length=4,
+			max_length=15,
+		),
+	] = None,
+	email: Annotated[
+		EmailStr | None, Query(title="Email", description="Email to check")
+	] = None,
+	db: AsyncSession = Depends(get_session),
+) -> UserAvailability:
+	"""
+	**Check whether a username and an email are free to register.**
+
+	## Args:
+		username (str): Optional username to check
+		email (str): Optional email to check
+
+	## Returns:
+		UserAvailability: Whether each given value is free
+	"""
+	if username is None and email is None:
+		raise HTTPException(
+			status_code=status.HTTP_400_BAD_REQUEST,
+			detail="Give a username, an email or both",
+		)
+	user_repository: UserRepository = UserRepository(session=db)
+	availability: UserAvailability = UserAvailability()
+	if username is not None:
+		availability.username = not await _is_taken(
+			"username",
+			identity_filter.might_have_username(username),
+			lambda: user_repository.username_exists(username),
+		)
+	if email is not None:
+		availability.email = not await _is_taken(
+			"email",
+			identity_filter.might_have_email(email),
+			lambda: user_repository.email_exists(email),
+		)
+	return availability
+
+
+@router.get("/me", response_model=UserResponse)
+async def get_me(
+	current_user: Annotated[UserResponse, Depends(get_current_user)],
+) -> UserResponse:
+	"""
+	**Get the user the bearer token belongs to.**
+
+	## Returns:
+		UserResponse: The authenticated user
+	"""
+	return current_user
 
 
 @router.get("/{user_id}", response_model=UserResponse)
@@ -31,41 +165,79 @@ async def get_use_by_id(
 			example=uuid4(),
 		),
 	],
+	fields: Annotated[tuple[str, ...] | None, Depends(user_field_selector)],
 	db: AsyncSession = Depends(get_session),
-) -> UserResponse:
+) -> UserResponse | NegotiatedResponse:
 	"""
 	**Get a user by ID from the database.**
 
 	## Args:
 		user_id (UUID4): The user ID
+		fields (str): Optional comma-separated fields to return
 
 	## Returns:
 		UserResponse: The user data if found
 	"""
 	user_repository: UserRepository = UserRepository(session=db)
-	user: User | None = await user_repository.get(user_id)
+	user: User | None = await user_repository.get(user_id, fields)
 	if not user:
 		msg: str = (
 			f"The user with id: {user_id} has not been found on the system"
 		)
-		logger.error(msg)
+		logger.error(
+			"The user with id: %s has not been found on the system", user_id
+		)
 		raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=msg)
+	if fields:
+		return NegotiatedResponse(dump_fields(UserResponse, fields, user))
 	return UserResponse.model_validate(user)
 
 
-@router.get("", response_model=list[UserResponse])
+@router.get("", response_model=list[UserResponse] | BatchResponse[UserResponse])
 async def get_all_users(
+	fields: Annotated[tuple[str, ...] | None, Depends(user_field_selector)],
+	cache: Annotated[EntityCache, Depends(user_cache_dependency)],
+	ids: Annotated[
+		list[UUID4] | None,
+		Query(
+			title="User IDs",
+			description="IDs of the users to retrieve in a single request",
+			max_length=setting.BATCH_MAX_IDS,
+		),
+	] = None,
 	db: AsyncSession = Depends(get_session),
-):
+) -> NegotiatedResponse:
 	"""
-	**Retrieve all users from the system.**
+	**Retrieve all users from the system, or only the given IDs.**
+
+	## Args:
+		fields (str): Optional comma-separated fields to return
+		ids (list[UUID4]): Optional IDs, repeated as query parameter
 
 	## Returns:
 		List[UserResponse]: A list of all registered users
+		BatchResponse[UserResponse]: The users in request order, if ids
+		is given
 	"""
 	user_repository: UserRepository = UserRepository(session=db)
-	users: list[User] = await user_repository.get_all()
-	return [UserResponse.model_validate(user) for user in users]
+	if ids:
+		items: list[dict[str, Any] | None] = await get_many_through_cache(
+			ids, cache, user_repository, UserResponse
+		)
+		return NegotiatedResponse(
+			{
+				"items": [select_fields(item, fields) for item in items],
+				"not_found": [
+					_id
+					for _id, item in zip(ids, items, strict=True)
+					if item is None
+				],
+			}
+		)
+	users: list[dict[str, Any]] = await user_repository.fetch_rows(
+		fields or user_response_columns
+	)
+	return NegotiatedResponse(users)
 
 
 @router.post(
@@ -80,6 +252,9 @@ async def create_user(
 			description="User data to create",
 		),
 	],
+	identity_filter: Annotated[
+		UserIdentityFilter, Depends(get_user_identity_filter)
+	],
 	db: AsyncSession = Depends(get_session),
 ):
 	"""
@@ -92,8 +267,37 @@ async def create_user(
 		UserResponse: Created user object
 	"""
 	user_repository: UserRepository = UserRepository(session=db)
-	user: User = User(**user_create.model_dump())
-	new_user: User = await user_repository.create(user)
+	msg: str
+	if await _is_taken(
+		"username",
+		identity_filter.might_have_username(user_create.username),
+		lambda: user_repository.username_exists(user_create.username),
+	):
+		msg = "Username already registered"
+		logger.info(msg)
+		raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=msg)
+	if await _is_taken(
+		"email",
+		identity_filter.might_have_email(user_create.email),
+		lambda: user_repository.email_exists(user_create.email),
+	):
+		msg = "Email already registered"
+		logger.info(msg)
+		raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=msg)
+	user_data: dict[str, Any] = user_create.model_dump()
+	user_data["password"] = await hash_password_async(user_create.password)
+	user: User = User(**user_data)
+	try:
+		new_user: User = await user_repository.create(user)
+	except IntegrityError as exc:
+		if getattr(exc.orig, "sqlstate", None) != UNIQUE_VIOLATION:
+			raise
+		msg = "Username or email already registered"
+		logger.info(msg)
+		raise HTTPException(
+			status_code=status.HTTP_409_CONFLICT, detail=msg
+		) from exc
+	identity_filter.add(new_user.username, new_user.email)
 	return UserResponse.model_validate(new_user)
 
 
@@ -115,6 +319,7 @@ async def update_user(
 			description="User data to update",
 		),
 	],
+	cache: Annotated[EntityCache, Depends(user_cache_dependency)],
 	db: AsyncSession = Depends(get_session),
 ):
 	"""
@@ -136,12 +341,17 @@ async def update_user(
 	updated_user: User = await user_repository.update(
 		user, user_update.model_dump(exclude_unset=True)
 	)
+	# A read before the commit would cache the old row again
+	await db.commit()
+	await cache.delete(user_id)
+	invalidate_user(user_id)
 	return UserResponse.model_validate(updated_user)
 
 
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_user(
 	user_id: Annotated[UUID4, Path(title="User ID")],
+	cache: Annotated[EntityCache, Depends(user_cache_dependency)],
 	db: AsyncSession = Depends(get_session),
 ):
 	"""
@@ -155,6 +365,9 @@ async def delete_user(
 	"""
 	user_repository: UserRepository = UserRepository(session=db)
 	success: bool = await user_repository.delete(user_id)
+	await db.commit()
+	await cache.delete(user_id)
+	invalidate_user(user_id)
 	if not success:
 		msg: str = "User not found"
 		logger.error(msg)
@@ -0,0 +1,15 @@
+"""
+A module for routing in the app.api package.
+"""
+
+from app.core.content_negotiation import NegotiatedRoute
+from app.core.deadline import DeadlineRoute
+
+
+class AppRoute(DeadlineRoute, NegotiatedRoute):
+	"""
+	Route class shared by the API routers.
+
+	Each handler runs under the request deadline and negotiates between
+	JSON and MessagePack bodies.
+	"""
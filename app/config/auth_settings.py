@@ -4,18 +4,18 @@ A module for auth settings in the app.config package.
 
 from typing import Final
 
-from pydantic import AnyHttpUrl, PositiveInt, field_validator
+from pydantic import AnyHttpUrl, PositiveFloat, PositiveInt, field_validator
 from pydantic_core import MultiHostUrl
 from pydantic_core.core_schema import ValidationInfo
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic_settings import SettingsConfigDict
 
+from app.config.base_settings import SnapshotSettings
 
-class AuthSettings(BaseSettings):
+
+class AuthSettings(SnapshotSettings):
 	"""Settings class for authentication using JWT and Memcached"""
 
 	model_config = SettingsConfigDict(
-		env_file=".env",
-		env_file_encoding="utf-8",
 		case_sensitive=True,
 		extra="allow",
 	)
@@ -57,12 +57,20 @@ class AuthSettings(BaseSettings):
 	EMAIL_RESET_TOKEN_EXPIRE_HOURS: PositiveInt
 	AUDIENCE: AnyHttpUrl | None = None
 	STRICT_TRANSPORT_SECURITY_MAX_AGE: PositiveInt
+	BCRYPT_ROUNDS: PositiveInt = 12
+	PASSWORD_HASH_WORKERS: PositiveInt | None = None
+	PASSWORD_HASH_MAX_CONCURRENCY: PositiveInt = 8
+	PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS: PositiveFloat = 2.0
+	CLAIMS_CACHE_SIZE: PositiveInt = 10000
+	USER_CACHE_SIZE: PositiveInt = 10000
+	USER_CACHE_SECONDS: PositiveFloat = 30.0
 
 	MEMCACHED_HOST: str
 	MEMCACHED_PORT: PositiveInt
 	MEMCACHED_USERNAME: str
 	MEMCACHED_PASSWORD: str
 	MEMCACHED_URI: MultiHostUrl | None = None
+	MEMCACHED_SOCKET_TIMEOUT_SECONDS: PositiveFloat = 0.5
 
 	@field_validator("MEMCACHED_URI", mode="before")
 	def assemble_memcached_connection(
@@ -115,6 +123,5 @@ class AuthSettings(BaseSettings):
 		if info.config is None:
 			raise ValueError("info.config cannot be None")
 		return AnyHttpUrl(
-			f"{str(info.data.get('SERVER_URL'))[:-1]}:8000/"
-			f"{info.data.get('TOKEN_URL')}"
+			f"{str(info.data.get('SERVER_URL'))[:-1]}:8000/{cls.TOKEN_URL}"
 		)
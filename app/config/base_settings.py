@@ -0,0 +1,67 @@
+"""
+A module for base settings in the app.config package.
+"""
+
+from collections.abc import Mapping
+from typing import Any, Final
+
+from pydantic_settings import (
+	BaseSettings,
+	DotEnvSettingsSource,
+	PydanticBaseSettingsSource,
+)
+
+ENV_FILE: Final[str] = ".env"
+ENV_FILE_ENCODING: Final[str] = "utf-8"
+
+_env_file_snapshots: dict[tuple[Any, ...], Mapping[str, str | None]] = {}
+
+
+class SnapshotDotEnvSettingsSource(DotEnvSettingsSource):
+	"""
+	Dotenv settings source that parses each env file once per process.
+
+	Every settings class reading the same file shares the parsed snapshot,
+	so loading all the settings costs a single read of the file.
+	"""
+
+	def _load_env_vars(self) -> Mapping[str, str | None]:
+		key: tuple[Any, ...] = (
+			str(self.env_file),
+			self.env_file_encoding,
+			self.case_sensitive,
+			self.env_ignore_empty,
+			self.env_parse_none_str,
+		)
+		if key not in _env_file_snapshots:
+			_env_file_snapshots[key] = super()._load_env_vars()
+		return _env_file_snapshots[key]
+
+
+class SnapshotSettings(BaseSettings):
+	"""
+	Base settings class that reads the env file from a shared snapshot.
+
+	Subclasses must not set env_file in their model_config, otherwise
+	pydantic-settings parses the file again with its default source.
+	"""
+
+	@classmethod
+	def settings_customise_sources(
+		cls,
+		settings_cls: type[BaseSettings],
+		init_settings: PydanticBaseSettingsSource,
+		env_settings: PydanticBaseSettingsSource,
+		dotenv_settings: PydanticBaseSettingsSource,
+		file_secret_settings: PydanticBaseSettingsSource,
+	) -> tuple[PydanticBaseSettingsSource, ...]:
+		return (
+			init_settings,
+			env_settings,
+			SnapshotDotEnvSettingsSource(
+				settings_cls,
+				env_file=ENV_FILE,
+				env_file_encoding=ENV_FILE_ENCODING,
+			),
+			file_secret_settings,
+		)
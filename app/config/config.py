@@ -70,4 +70,3 @@ init_setting: InitSettings = get_init_settings()
 setting: Settings = get_settings()
 sql_db_setting: SQLDBSettings = get_sql_db_settings()
 auth_setting: AuthSettings = get_auth_settings()
-nosql_db_settings: NoSQLDatabaseSettings = get_nosql_db_settings()
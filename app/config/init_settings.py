@@ -7,8 +7,6 @@ from pathlib import Path
 from pydantic import DirectoryPath
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-from app.utils.image_utils import convert_image_to_base64
-
 
 class InitSettings(BaseSettings):
 	"""Init Settings class based on Pydantic Base Settings"""
@@ -42,12 +40,10 @@ class InitSettings(BaseSettings):
 	This backend project is a RESTful API developed with FastAPI. This project
 	serves as the backend to manager orders along with users
 	"""
-	img_b64: str = convert_image_to_base64(
-		IMAGES_DIRECTORY.resolve() / "project.png"
-	)
 	DESCRIPTION: str = f"""**FastAPI**, **SQLAlchemy** and **MemCached** helps
 	you do awesome stuff.
-	🚀\n\n<img src="{img_b64}" width="800px" height="400px"/>"""
+	🚀\n\n<img src="{ASSETS_DIR}/{IMAGES_SUBDIR}/project.png" width="800px"
+	height="400px"/>"""
 	LICENSE_INFO: dict[str, str] = {
 		"name": "MIT",
 		"identifier": "MIT",
@@ -5,19 +5,20 @@ A module for NoSQL db settings in the app.config package.
 from pydantic import MongoDsn, PositiveInt, field_validator
 from pydantic_core import MultiHostUrl
 from pydantic_core.core_schema import ValidationInfo
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic_settings import SettingsConfigDict
 
+from app.config.base_settings import SnapshotSettings
 
-class NoSQLDatabaseSettings(BaseSettings):
+
+class NoSQLDatabaseSettings(SnapshotSettings):
 	"""Settings class for NoSQL database configuration"""
 
 	model_config = SettingsConfigDict(
-		env_file=".env",
-		env_file_encoding="utf-8",
 		case_sensitive=True,
 		extra="allow",
 	)
 
+	MONGODB_ENABLED: bool = False
 	MONGODB_SCHEME: str
 	MONGODB_USERNAME: str
 	MONGODB_PASSWORD: str
@@ -2,25 +2,28 @@
 A module for settings in the app.config package.
 """
 
-from typing import Any
+from pathlib import Path
+from typing import Any, Literal
 
 from pydantic import (
 	AnyHttpUrl,
 	EmailStr,
 	IPvAnyAddress,
+	NonNegativeInt,
+	PositiveFloat,
 	PositiveInt,
 	field_validator,
 )
 from pydantic_core.core_schema import ValidationInfo
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic_settings import SettingsConfigDict
 
+from app.config.base_settings import SnapshotSettings
 
-class Settings(BaseSettings):
+
+class Settings(SnapshotSettings):
 	"""Settings class based on Pydantic Base Settings"""
 
 	model_config = SettingsConfigDict(
-		env_file=".env",
-		env_file_encoding="utf-8",
 		case_sensitive=True,
 		extra="allow",
 	)
@@ -92,3 +95,47 @@ class Settings(BaseSettings):
 		if info.data.get("CONTACT_EMAIL"):
 			contact["email"] = info.data.get("CONTACT_EMAIL")
 		return contact
+
+	ENTITY_CACHE_SECONDS: PositiveInt = 300
+	BATCH_MAX_IDS: PositiveInt = 100
+	ADMISSION_MAX_IN_FLIGHT: PositiveInt = 50
+	ADMISSION_MAX_QUEUE: NonNegativeInt = 100
+	ADMISSION_QUEUE_TIMEOUT_SECONDS: PositiveFloat = 2.0
+	ADMISSION_RETRY_AFTER_SECONDS: PositiveInt = 1
+	ADMISSION_BYPASS_PATHS: list[str] = ["/health", "/metrics"]
+	REQUEST_TIMEOUT_SECONDS: PositiveFloat = 10.0
+	EMAIL_TIMEOUT_SECONDS: PositiveFloat = 10.0
+	SERVER_WORKERS: PositiveInt | None = None
+	SERVER_MAX_REQUESTS: NonNegativeInt = 10000
+	SERVER_MAX_REQUESTS_JITTER: NonNegativeInt = 1000
+	SERVER_GRACEFUL_TIMEOUT_SECONDS: PositiveInt = 30
+	SERVER_KEEPALIVE_SECONDS: PositiveInt = 5
+	SHUTDOWN_DRAIN_TIMEOUT_SECONDS: PositiveFloat = 20.0
+	SHUTDOWN_STEP_TIMEOUT_SECONDS: PositiveFloat = 5.0
+	HEALTH_CHECK_INTERVAL_SECONDS: PositiveFloat = 5.0
+	HEALTH_CHECK_TIMEOUT_SECONDS: PositiveFloat = 2.0
+	LOG_QUEUE_SIZE: PositiveInt = 10000
+	LOG_SAMPLING_WINDOW_SECONDS: PositiveFloat = 1.0
+	LOG_SAMPLING_BURST: PositiveInt = 20
+	ACCESS_LOG: bool = False
+	RUNTIME_METRICS_INTERVAL_SECONDS: PositiveFloat = 1.0
+	LOOP_BLOCK_THRESHOLD_SECONDS: PositiveFloat = 0.1
+	LOOP_WATCHDOG_INTERVAL_SECONDS: PositiveFloat = 0.02
+	PROFILING_ENABLED: bool = False
+	PROFILING_MAX_VALIDITY_SECONDS: PositiveInt = 300
+	PROFILING_INTERVAL_SECONDS: PositiveFloat = 0.001
+	USER_FILTER_CAPACITY: PositiveInt = 1000000
+	USER_FILTER_ERROR_RATE: PositiveFloat = 0.001
+	USER_FILTER_REFRESH_SECONDS: PositiveFloat = 60.0
+	USER_FILTER_CHUNK_SIZE: PositiveInt = 10000
+	EMAIL_SENDER: Literal["resend", "log"] = "resend"
+	EMAIL_QUEUE_WORKERS: PositiveInt = 2
+	EMAIL_QUEUE_MAX_SIZE: PositiveInt = 10000
+	EMAIL_BATCH_WAIT_SECONDS: PositiveFloat = 0.2
+	EMAIL_MAX_ATTEMPTS: PositiveInt = 5
+	EMAIL_RETRY_BASE_SECONDS: PositiveFloat = 1.0
+	EMAIL_DRAIN_TIMEOUT_SECONDS: PositiveFloat = 3.0
+	EMAIL_DEAD_LETTER_PATH: Path = Path("dead_letters/emails.jsonl")
+	CAMPAIGN_CHUNK_SIZE: PositiveInt = 1000
+	CAMPAIGN_RATE_PER_SECOND: PositiveFloat = 100.0
+	CAMPAIGN_CHECKPOINT_DIR: Path = Path("campaigns")
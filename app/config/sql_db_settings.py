@@ -2,18 +2,24 @@
 A module for SQL db settings in the app.config package.
 """
 
-from pydantic import PositiveInt, PostgresDsn, field_validator
+from pydantic import (
+	NonNegativeInt,
+	PositiveFloat,
+	PositiveInt,
+	PostgresDsn,
+	field_validator,
+)
 from pydantic_core import MultiHostUrl
 from pydantic_core.core_schema import ValidationInfo
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic_settings import SettingsConfigDict
 
+from app.config.base_settings import SnapshotSettings
 
-class SQLDBSettings(BaseSettings):
+
+class SQLDBSettings(SnapshotSettings):
 	"""SQLDB settings class"""
 
 	model_config = SettingsConfigDict(
-		env_file=".env",
-		env_file_encoding="utf-8",
 		case_sensitive=True,
 		extra="allow",
 	)
@@ -24,6 +30,12 @@ class SQLDBSettings(BaseSettings):
 	POSTGRES_PORT: PositiveInt
 	POSTGRES_DB: str
 	DATABASE_URL: PostgresDsn | None = None
+	MIGRATE_ON_STARTUP: bool = False
+	SQL_ECHO: bool = False
+	POOL_SIZE: PositiveInt = 10
+	POOL_MAX_OVERFLOW: NonNegativeInt = 20
+	POOL_PREWARM: bool = True
+	POOL_PREWARM_TIMEOUT_SECONDS: PositiveFloat = 10.0
 
 	@field_validator("DATABASE_URL", mode="before")
 	def assemble_postgres_dsn(
@@ -0,0 +1,61 @@
+"""
+A module for bloom filter in the app.core package.
+"""
+
+import hashlib
+import math
+from collections.abc import Iterator
+
+from pydantic import PositiveFloat, PositiveInt
+
+
+class BloomFilter:
+	"""
+	Probabilistic set of strings without false negatives.
+
+	The bit array is sized for the expected number of items and false
+	positive rate. The bit indexes of an item are derived from a single
+	BLAKE2b digest by double hashing. Items cannot be removed.
+	"""
+
+	def __init__(self, capacity: PositiveInt, error_rate: PositiveFloat):
+		self.size: int = math.ceil(
+			-capacity * math.log(error_rate) / math.log(2) ** 2
+		)
+		self.hashes: int = max(1, round(self.size / capacity * math.log(2)))
+		self._bits: bytearray = bytearray((self.size + 7) // 8)
+
+	def _indexes(self, item: str) -> Iterator[int]:
+		"""
+		Compute the bit indexes of an item
+
+		Args:
+			item (str): The item
+
+		Yields:
+			Iterator[int]: The bit indexes
+		"""
+		digest: bytes = hashlib.blake2b(item.encode(), digest_size=16).digest()
+		first: int = int.from_bytes(digest[:8], "little")
+		step: int = int.from_bytes(digest[8:], "little") | 1
+		for i in range(self.hashes):
+			yield (first + i * step) % self.size
+
+	def add(self, item: str) -> None:
+		"""
+		Add an item
+
+		Args:
+			item (str): The item
+
+		Returns:
+			NoneType: None
+		"""
+		for index in self._indexes(item):
+			self._bits[index >> 3] |= 1 << (index & 7)
+
+	def __contains__(self, item: str) -> bool:
+		return all(
+			self._bits[index >> 3] & (1 << (index & 7))
+			for index in self._indexes(item)
+		)
@@ -0,0 +1,244 @@
+"""
+A module for content negotiation in the app.core package.
+"""
+
+import logging
+from collections.abc import Callable, Coroutine
+from contextvars import ContextVar, Token
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Final
+from uuid import UUID
+
+import msgpack
+from fastapi import Request, Response
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import APIRoute
+from starlette.types import Scope
+
+from app.core.request_timing import timing_span
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+MSGPACK_MEDIA_TYPE: Final[str] = "application/msgpack"
+MSGPACK_MEDIA_TYPES: Final[frozenset[str]] = frozenset(
+	{MSGPACK_MEDIA_TYPE, "application/x-msgpack", "application/vnd.msgpack"}
+)
+JSON_MEDIA_TYPES: Final[frozenset[str]] = frozenset(
+	{"application/json", "application/*", "*/*"}
+)
+UUID_EXT_CODE: Final[int] = 1
+
+prefers_msgpack: ContextVar[bool] = ContextVar("prefers_msgpack", default=False)
+
+
+def _msgpack_default(obj: Any) -> Any:
+	"""
+	Convert the types msgpack does not know into packable values.
+
+	UUIDs are packed as a 16-byte extension type. Timezone-aware datetimes
+	never reach this hook since msgpack packs them as native timestamps.
+
+	Args:
+		obj (Any): The object to convert
+
+	Returns:
+		Any: The packable value
+
+	Raises:
+		TypeError: If the object type is not supported
+	"""
+	if isinstance(obj, UUID):
+		return msgpack.ExtType(UUID_EXT_CODE, obj.bytes)
+	if isinstance(obj, datetime | date):
+		return obj.isoformat()
+	if isinstance(obj, Enum):
+		return obj.value
+	if isinstance(obj, Decimal):
+		return str(obj)
+	raise TypeError(f"Cannot serialize {type(obj).__name__} to MessagePack")
+
+
+def _msgpack_ext_hook(code: int, data: bytes) -> Any:
+	"""
+	Convert the extension types packed by this API back into objects.
+
+	Args:
+		code (int): The extension type code
+		data (bytes): The extension payload
+
+	Returns:
+		Any: The decoded object
+	"""
+	if code == UUID_EXT_CODE:
+		return UUID(bytes=data)
+	return msgpack.ExtType(code, data)
+
+
+def packb(content: Any) -> bytes:
+	"""
+	Serialize content to MessagePack.
+
+	Args:
+		content (Any): The content to serialize
+
+	Returns:
+		bytes: The MessagePack payload
+	"""
+	return msgpack.packb(  # type: ignore
+		content, default=_msgpack_default, datetime=True, use_bin_type=True
+	)
+
+
+def unpackb(payload: bytes) -> Any:
+	"""
+	Deserialize a MessagePack payload.
+
+	Args:
+		payload (bytes): The MessagePack payload
+
+	Returns:
+		Any: The decoded content
+	"""
+	return msgpack.unpackb(payload, ext_hook=_msgpack_ext_hook, timestamp=3)
+
+
+def accept_quality(accept: str, media_types: frozenset[str]) -> float:
+	"""
+	Get the highest quality factor an Accept-style header gives to values.
+
+	Works for Accept as well as Accept-Encoding, whose syntax is the same.
+
+	Args:
+		accept (str): The header value
+		media_types (frozenset[str]): The lowercase values to look for
+
+	Returns:
+		float: The quality factor, or 0 if none of them is accepted
+	"""
+	quality: float = 0.0
+	for media_range in accept.split(","):
+		media_type, *params = media_range.split(";")
+		if media_type.strip().lower() not in media_types:
+			continue
+		range_quality: float = 1.0
+		for param in params:
+			name, _, value = param.strip().partition("=")
+			if name == "q":
+				try:
+					range_quality = float(value)
+				except ValueError:
+					range_quality = 0.0
+		quality = max(quality, range_quality)
+	return quality
+
+
+def accepts_msgpack(accept: str | None) -> bool:
+	"""
+	Check whether the client prefers MessagePack over JSON.
+
+	Args:
+		accept (str | None): The Accept header value
+
+	Returns:
+		bool: True if MessagePack should be used for the response
+	"""
+	if not accept or "msgpack" not in accept:
+		return False
+	msgpack_quality: float = accept_quality(accept, MSGPACK_MEDIA_TYPES)
+	return msgpack_quality > 0 and msgpack_quality >= accept_quality(
+		accept, JSON_MEDIA_TYPES
+	)
+
+
+def is_msgpack(content_type: str | None) -> bool:
+	"""
+	Check whether a Content-Type header denotes MessagePack.
+
+	Args:
+		content_type (str | None): The Content-Type header value
+
+	Returns:
+		bool: True if the body is MessagePack
+	"""
+	if not content_type:
+		return False
+	return content_type.split(";")[0].strip().lower() in MSGPACK_MEDIA_TYPES
+
+
+class MsgPackResponse(Response):
+	"""Response serialized with MessagePack"""
+
+	media_type = MSGPACK_MEDIA_TYPE
+
+	def render(self, content: Any) -> bytes:
+		with timing_span("serialize"):
+			return packb(content)
+
+
+class NegotiatedResponse(ORJSONResponse):
+	"""ORJSON response that switches to MessagePack if the client prefers it"""
+
+	def render(self, content: Any) -> bytes:
+		with timing_span("serialize"):
+			if prefers_msgpack.get():
+				self.media_type = MSGPACK_MEDIA_TYPE
+				return packb(content)
+			return super().render(content)
+
+
+class MsgPackRequest(Request):
+	"""Request whose body is decoded from MessagePack instead of JSON"""
+
+	async def json(self) -> Any:
+		if not hasattr(self, "_json"):
+			self._json = unpackb(await self.body())
+		return self._json
+
+
+def _as_json_scope(scope: Scope) -> Scope:
+	"""
+	Copy a scope announcing a JSON body, so FastAPI parses it as such.
+
+	Args:
+		scope (Scope): The ASGI scope of the request
+
+	Returns:
+		Scope: The scope copy with a JSON Content-Type header
+	"""
+	headers: list[tuple[bytes, bytes]] = [
+		(name, b"application/json")
+		if name == b"content-type"
+		else (name, value)
+		for name, value in scope["headers"]
+	]
+	return {**scope, "headers": headers}
+
+
+class NegotiatedRoute(APIRoute):
+	"""API route that negotiates MessagePack request and response bodies"""
+
+	def get_route_handler(
+		self,
+	) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+		original_route_handler: Callable[
+			[Request], Coroutine[Any, Any, Response]
+		] = super().get_route_handler()
+
+		async def negotiated_route_handler(request: Request) -> Response:
+			token: Token[bool] = prefers_msgpack.set(
+				accepts_msgpack(request.headers.get("accept"))
+			)
+			if is_msgpack(request.headers.get("content-type")):
+				request = MsgPackRequest(
+					_as_json_scope(request.scope), request.receive
+				)
+			try:
+				response: Response = await original_route_handler(request)
+			finally:
+				prefers_msgpack.reset(token)
+			response.headers.add_vary_header("Accept")
+			return response
+
+		return negotiated_route_handler
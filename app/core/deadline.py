@@ -0,0 +1,123 @@
+"""
+A module for request deadlines in the app.core package.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable, Coroutine
+from contextvars import ContextVar, Token
+from typing import Any, Final
+
+from fastapi import HTTPException, Request, Response, status
+from fastapi.routing import APIRoute
+from pydantic import PositiveFloat
+
+from app.config.config import get_settings
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+REQUEST_TIMEOUT_ATTRIBUTE: Final[str] = "__request_timeout__"
+
+request_deadline: ContextVar[float | None] = ContextVar(
+	"request_deadline", default=None
+)
+
+
+def request_timeout[F: Callable[..., Any]](
+	seconds: PositiveFloat,
+) -> Callable[[F], F]:
+	"""
+	Override the request deadline of a single path operation.
+
+	Apply it below the router decorator so the route sees the attribute.
+
+	Args:
+		seconds (PositiveFloat): The time budget of the route in seconds
+
+	Returns:
+		Callable[[F], F]: The decorator that tags the endpoint
+	"""
+
+	def decorator(endpoint: F) -> F:
+		setattr(endpoint, REQUEST_TIMEOUT_ATTRIBUTE, seconds)
+		return endpoint
+
+	return decorator
+
+
+def remaining_seconds() -> float | None:
+	"""
+	Get the time left before the current request deadline.
+
+	Returns:
+		float | None: The seconds left, or None outside a request
+	"""
+	deadline: float | None = request_deadline.get()
+	if deadline is None:
+		return None
+	return deadline - time.monotonic()
+
+
+async def run_within_deadline[T](
+	awaitable: Awaitable[T], cap: PositiveFloat | None = None
+) -> T:
+	"""
+	Await an operation for no longer than the request deadline allows.
+
+	Args:
+		awaitable (Awaitable[T]): The operation to await
+		cap (PositiveFloat | None): An upper bound in seconds that also
+		applies outside a request. Default to None
+
+	Returns:
+		T: The result of the operation
+
+	Raises:
+		TimeoutError: If the deadline or the cap expires first
+	"""
+	timeouts: list[float] = [
+		timeout for timeout in (remaining_seconds(), cap) if timeout is not None
+	]
+	async with asyncio.timeout(min(timeouts) if timeouts else None):
+		return await awaitable
+
+
+class DeadlineRoute(APIRoute):
+	"""
+	API route that runs its handler under a deadline.
+
+	The deadline is published through a context variable so the database
+	session, the cache and outbound calls can bound their own waits. When
+	it expires, the handler is cancelled and the client gets a 504.
+	"""
+
+	def get_route_handler(
+		self,
+	) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+		original_route_handler: Callable[
+			[Request], Coroutine[Any, Any, Response]
+		] = super().get_route_handler()
+		timeout: PositiveFloat = getattr(
+			self.endpoint,
+			REQUEST_TIMEOUT_ATTRIBUTE,
+			get_settings().REQUEST_TIMEOUT_SECONDS,
+		)
+
+		async def deadline_route_handler(request: Request) -> Response:
+			token: Token[float | None] = request_deadline.set(
+				time.monotonic() + timeout
+			)
+			try:
+				async with asyncio.timeout(timeout):
+					return await original_route_handler(request)
+			except TimeoutError:
+				msg: str = f"Request deadline of {timeout}s exceeded"
+				logger.warning("%s on %s", msg, request.url.path)
+				raise HTTPException(
+					status_code=status.HTTP_504_GATEWAY_TIMEOUT, detail=msg
+				)
+			finally:
+				request_deadline.reset(token)
+
+		return deadline_route_handler
@@ -0,0 +1,205 @@
+"""
+A module for entity cache in the app.core package.
+"""
+
+import logging
+from collections.abc import Callable, Mapping, Sequence
+from functools import lru_cache
+from typing import Any
+from uuid import UUID
+
+from bmemcached import Client
+from bmemcached.exceptions import MemcachedException
+from pydantic import BaseModel, PositiveInt, ValidationError
+
+from app.config.config import get_settings
+from app.core.deadline import run_within_deadline
+from app.core.memcached_dependency import (
+	get_memcached_client,
+	run_memcached,
+)
+from app.core.request_timing import timing_span
+from app.repositories.base_sql_repository import BaseRepository
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class EntityCache:
+	"""
+	Memcached cache of entities serialized as JSON by their schema, keyed
+	by ID.
+
+	The Memcached client is synchronous, so every operation runs in a worker
+	thread, serialized with the other users of the client, and is bounded by
+	the request deadline. A failed or late operation is logged and treated
+	as a cache miss.
+	"""
+
+	def __init__(self, client: Client, namespace: str, expire: PositiveInt):
+		self.client: Client = client
+		self.namespace: str = namespace
+		self.expire: PositiveInt = expire
+
+	async def _run[T](self, operation: Callable[[], T]) -> T | None:
+		"""
+		Run a client operation off the event loop within the deadline
+
+		Args:
+			operation (Callable[[], T]): The client operation
+
+		Returns:
+			T | None: The result of the operation, or None if it failed
+		"""
+		try:
+			with timing_span("cache"):
+				return await run_within_deadline(run_memcached(operation))
+		except (MemcachedException, OSError, TimeoutError) as exc:
+			logger.warning(
+				"Entity cache operation failed on %s: %r", self.namespace, exc
+			)
+			return None
+
+	def _key(self, _id: UUID | str) -> str:
+		"""
+		Build the cache key for an entity ID
+
+		Args:
+			_id (UUID | str): The entity ID
+
+		Returns:
+			str: The namespaced cache key
+		"""
+		return f"{self.namespace}:{_id}"
+
+	async def get_many[M: BaseModel](
+		self, ids: Sequence[UUID], schema: type[M]
+	) -> dict[UUID, M]:
+		"""
+		Retrieve several entities with a single multi-get
+
+		Args:
+			ids (Sequence[UUID]): The entity IDs to look up
+			schema (type[M]): The schema the entities were stored with
+
+		Returns:
+			dict[UUID, M]: The cached entities found, keyed by ID. Those
+			that no longer match the schema are left out as misses
+		"""
+		keys: dict[str, UUID] = {self._key(_id): _id for _id in ids}
+		values: dict[str, bytes] | None = await self._run(
+			lambda: self.client.get_multi(list(keys))
+		)
+		if not values:
+			return {}
+		found: dict[UUID, M] = {}
+		for key, value in values.items():
+			try:
+				found[keys[key]] = schema.model_validate_json(value)
+			except ValidationError as exc:
+				logger.warning("Stale entity in cache at %s: %r", key, exc)
+		return found
+
+	async def set_many(self, entities: Mapping[UUID, BaseModel]) -> None:
+		"""
+		Store several entities with a single multi-set
+
+		Args:
+			entities (Mapping[UUID, BaseModel]): The entities to cache by ID
+
+		Returns:
+			NoneType: None
+		"""
+		if not entities:
+			return
+		mappings: dict[str, bytes] = {
+			self._key(_id): entity.model_dump_json().encode()
+			for _id, entity in entities.items()
+		}
+		await self._run(
+			lambda: self.client.set_multi(mappings, time=self.expire)
+		)
+
+	async def delete(self, _id: UUID) -> None:
+		"""
+		Invalidate a cached entity
+
+		Args:
+			_id (UUID): The entity ID
+
+		Returns:
+			NoneType: None
+		"""
+		await self._run(lambda: self.client.delete(self._key(_id)))
+
+
+@lru_cache
+def get_entity_cache(namespace: str) -> EntityCache:
+	"""
+	Get the process-wide entity cache for a namespace
+
+	Args:
+		namespace (str): The key namespace, usually the entity name
+
+	Returns:
+		EntityCache: The entity cache instance
+	"""
+	return EntityCache(
+		get_memcached_client(), namespace, get_settings().ENTITY_CACHE_SECONDS
+	)
+
+
+class EntityCacheDependency:
+	"""Dependency that provides the entity cache of a namespace"""
+
+	def __init__(self, namespace: str):
+		self.namespace: str = namespace
+
+	def __call__(self) -> EntityCache:
+		"""
+		Provide the entity cache
+
+		Returns:
+			EntityCache: The entity cache instance
+		"""
+		return get_entity_cache(self.namespace)
+
+
+async def get_many_through_cache(
+	ids: Sequence[UUID],
+	cache: EntityCache,
+	repository: BaseRepository[Any],
+	schema: type[BaseModel],
+) -> list[dict[str, Any] | None]:
+	"""
+	Resolve entities by ID, reading misses from the database in one query.
+
+	Cached and fresh rows both go through the response schema, so every
+	row has the same value types whichever way it was found.
+
+	Args:
+		ids (Sequence[UUID]): The requested IDs, possibly repeated
+		cache (EntityCache): The entity cache to read and populate
+		repository (BaseRepository[Any]): The repository for the misses
+		schema (type[BaseModel]): The response schema, whose fields are the
+		columns selected for the misses
+
+	Returns:
+		list[dict[str, Any] | None]: The rows in request order, with None
+		for every ID that does not exist
+	"""
+	unique_ids: list[UUID] = list(dict.fromkeys(ids))
+	found: dict[UUID, BaseModel] = await cache.get_many(unique_ids, schema)
+	missing: list[UUID] = [_id for _id in unique_ids if _id not in found]
+	if missing:
+		rows: list[dict[str, Any]] = await repository.fetch_rows_by_ids(
+			tuple(schema.model_fields), missing
+		)
+		fetched: dict[UUID, BaseModel] = {
+			row["id"]: schema.model_validate(row) for row in rows
+		}
+		await cache.set_many(fetched)
+		found.update(fetched)
+	return [
+		None if (entity := found.get(_id)) is None else entity.model_dump()
+		for _id in ids
+	]
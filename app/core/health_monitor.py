@@ -0,0 +1,165 @@
+"""
+A module for health monitor in the app.core package.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+
+from pydantic import PositiveFloat
+
+from app.core.metrics import DEPENDENCY_HEALTHY, DEPENDENCY_PROBE_LATENCY
+from app.schemas.health import DependencyHealth, HealthResponse
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class HealthMonitor:
+	"""
+	Probes the dependencies in the background and caches the results.
+
+	Health endpoints read the cached results, so a probe from an
+	orchestrator costs no I/O no matter how often it is sent. Only the
+	critical dependencies decide readiness, the others only degrade it.
+	"""
+
+	def __init__(self, interval: PositiveFloat, timeout: PositiveFloat):
+		self.interval: PositiveFloat = interval
+		self.timeout: PositiveFloat = timeout
+		self._probes: dict[str, tuple[Callable[[], Awaitable[None]], bool]] = {}
+		self.results: dict[str, DependencyHealth] = {}
+		self._task: asyncio.Task[None] | None = None
+
+	def add_probe(
+		self,
+		name: str,
+		probe: Callable[[], Awaitable[None]],
+		critical: bool = True,
+	) -> None:
+		"""
+		Register a dependency probe that raises when it is unhealthy
+
+		Args:
+			name (str): The dependency name
+			probe (Callable[[], Awaitable[None]]): The probe coroutine
+			critical (bool): Whether readiness depends on it. Default to
+			True
+
+		Returns:
+			NoneType: None
+		"""
+		self._probes[name] = (probe, critical)
+
+	async def _probe(
+		self, name: str, probe: Callable[[], Awaitable[None]], critical: bool
+	) -> None:
+		"""
+		Run a probe within the timeout and store its result
+
+		Args:
+			name (str): The dependency name
+			probe (Callable[[], Awaitable[None]]): The probe coroutine
+			critical (bool): Whether readiness depends on it
+
+		Returns:
+			NoneType: None
+		"""
+		error: str | None = None
+		started_at: float = time.perf_counter()
+		try:
+			async with asyncio.timeout(self.timeout):
+				await probe()
+		except Exception as exc:
+			error = repr(exc)
+		latency: float = time.perf_counter() - started_at
+		previous: DependencyHealth | None = self.results.get(name)
+		if error and (previous is None or previous.healthy):
+			logger.warning("Dependency %s is unhealthy: %s", name, error)
+		elif not error and previous is not None and not previous.healthy:
+			logger.info("Dependency %s recovered", name)
+		self.results[name] = DependencyHealth(
+			healthy=error is None,
+			critical=critical,
+			latency_ms=latency * 1000,
+			error=error,
+			checked_at=datetime.now(UTC),
+		)
+		DEPENDENCY_HEALTHY.labels(dependency=name).set(error is None)
+		DEPENDENCY_PROBE_LATENCY.labels(dependency=name).set(latency)
+
+	async def probe_all(self) -> None:
+		"""
+		Probe every dependency concurrently
+
+		Returns:
+			NoneType: None
+		"""
+		await asyncio.gather(
+			*(
+				self._probe(name, probe, critical)
+				for name, (probe, critical) in self._probes.items()
+			)
+		)
+
+	async def _run(self) -> None:
+		"""
+		Probe the dependencies forever on the interval
+
+		Returns:
+			NoneType: None
+		"""
+		while True:
+			await asyncio.sleep(self.interval)
+			await self.probe_all()
+
+	def start(self) -> None:
+		"""
+		Start probing in the background
+
+		Returns:
+			NoneType: None
+		"""
+		self._task = asyncio.create_task(self._run(), name="health-monitor")
+
+	async def stop(self) -> None:
+		"""
+		Stop probing
+
+		Returns:
+			NoneType: None
+		"""
+		if self._task is None:
+			return
+		self._task.cancel()
+		await asyncio.gather(self._task, return_exceptions=True)
+		self._task = None
+
+	@property
+	def healthy(self) -> bool:
+		"""
+		Check whether every critical dependency passed its last probe
+
+		Returns:
+			bool: True if the critical dependencies are healthy
+		"""
+		return all(
+			result.healthy
+			for result in self.results.values()
+			if result.critical
+		)
+
+	def report(self) -> HealthResponse:
+		"""
+		Build the health report from the cached probe results
+
+		Returns:
+			HealthResponse: The overall status and the probe results
+		"""
+		status: str = "healthy"
+		if not self.healthy:
+			status = "unhealthy"
+		elif not all(result.healthy for result in self.results.values()):
+			status = "degraded"
+		return HealthResponse(status=status, dependencies=dict(self.results))
@@ -0,0 +1,38 @@
+"""
+Email sender interface module in app.core.interfaces.
+
+Defines an abstract base class for the providers that deliver emails.
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+
+from pydantic import PositiveInt
+
+from app.schemas.email import EmailMessage
+
+
+class IEmailSender(ABC):
+	"""
+	Abstract base class for email delivery providers.
+
+	Providers deliver whole batches, so the email queue can send many
+	messages per request.
+	"""
+
+	max_batch_size: PositiveInt = 1
+
+	@abstractmethod
+	async def send_batch(
+		self, messages: Sequence[EmailMessage], idempotency_key: str
+	) -> None:
+		"""
+		Deliver a batch of messages.
+
+		Args:
+			messages (Sequence[EmailMessage]): The messages to deliver.
+			idempotency_key (str): The same for every retry of the batch.
+
+		Raises:
+			EmailDeliveryError: If the batch was not delivered.
+		"""
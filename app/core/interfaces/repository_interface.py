@@ -5,7 +5,9 @@ Defines an abstract base class for CRUD operations using SQLAlchemy models.
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from typing import Any, TypeVar
+from uuid import UUID
 
 from app.models.base_class import Base
 
@@ -21,12 +23,16 @@ class IRepository[T: Base](ABC):
 	"""
 
 	@abstractmethod
-	async def get(self, _id: str) -> T | None:
+	async def get(
+		self, _id: UUID, fields: Sequence[str] | None = None
+	) -> T | None:
 		"""
 		Retrieve an object by its ID.
 
 		Args:
-			_id (str): The primary key of the object.
+			_id (UUID): The primary key of the object.
+			fields (Sequence[str] | None): The attributes to load. Default
+			to None, which loads every column.
 
 		Returns:
 			T | None: The found object or None if not found.
@@ -41,6 +47,18 @@ class IRepository[T: Base](ABC):
 			list[T]: A list of all objects.
 		"""
 
+	@abstractmethod
+	async def fetch_rows(self, columns: Sequence[str]) -> list[dict[str, Any]]:
+		"""
+		Retrieve plain rows with only the given columns.
+
+		Args:
+			columns (Sequence[str]): The column names to select.
+
+		Returns:
+			list[dict[str, Any]]: A list of mappings keyed by column name.
+		"""
+
 	@abstractmethod
 	async def create(self, obj: T) -> T:
 		"""
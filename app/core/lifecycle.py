@@ -2,45 +2,180 @@
 A module for lifecycle in the app.core package.
 """
 
+import asyncio
 import logging
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from functools import partial
+from logging.handlers import QueueListener
 from typing import Any
 
 from fastapi import FastAPI
 
-from app.config.config import get_auth_settings, get_init_settings, get_settings
+from app.config.config import (
+	get_auth_settings,
+	get_init_settings,
+	get_nosql_db_settings,
+	get_settings,
+	get_sql_db_settings,
+)
+from app.config.settings import Settings
+from app.config.sql_db_settings import SQLDBSettings
+from app.core.health_monitor import HealthMonitor
+from app.core.loop_watchdog import LoopWatchdog
+from app.core.memcached_dependency import (
+	close_memcached_client,
+	ping_memcached,
+	warm_up_memcached_client,
+)
+from app.core.openapi_artifact import load_openapi_artifact
+from app.core.runtime_metrics import RuntimeMonitor
+from app.core.security.password import get_password_hasher
+from app.core.shutdown import ShutdownCoordinator, get_shutdown_coordinator
+from app.core.startup_profiler import StartupProfiler
+from app.core.structured_logging import configure_logging, stop_logging
+from app.core.user_identity_filter import (
+	UserIdentityFilter,
+	get_user_identity_filter,
+)
 from app.db.init_db import init_db
-
-# from app.db.init_nosql_db import init_nosql_db
+from app.db.session import async_engine, ping_db
+from app.db.warmup import warm_up_pool
+from app.tasks.email_tasks.email_queue import EmailQueue, get_email_queue
+from app.tasks.email_tasks.template import precompile_templates
 
 logger: logging.Logger = logging.getLogger(__name__)
 
 
+async def warm_up(sql_db_settings: SQLDBSettings) -> None:
+	"""
+	Open the Postgres and Memcached connections before serving traffic.
+
+	Failures are logged and do not prevent the worker from starting, since
+	requests open any missing connection on demand.
+
+	Args:
+		sql_db_settings (SQLDBSettings): The SQL database settings
+
+	Returns:
+		NoneType: None
+	"""
+	try:
+		async with asyncio.timeout(
+			sql_db_settings.POOL_PREWARM_TIMEOUT_SECONDS
+		):
+			await asyncio.gather(
+				warm_up_pool(async_engine, sql_db_settings.POOL_SIZE),
+				warm_up_memcached_client(),
+			)
+	except Exception as exc:
+		logger.warning("Warm-up did not complete: %r", exc)
+
+
 @asynccontextmanager
 async def lifespan(application: FastAPI) -> AsyncGenerator[Any]:  # noqa: ARG001
 	"""
 	Handles the lifecycle of the FastAPI application.
 
+	Cleanup steps are registered right after the resource they release is
+	opened and run in reverse order at shutdown, once the server drained
+	the requests.
+
 	Args:
 		application (FastAPI): The FastAPI application
 
 	Returns:
 		AsyncGenerator[Any]: An async generator yielding the lifecycle.
 	"""
-	logger.info("Starting API...")
+	profiler: StartupProfiler = StartupProfiler()
+	coordinator: ShutdownCoordinator = get_shutdown_coordinator()
+	# A previous run of the lifespan in this process left it draining
+	coordinator.draining = False
+	application.state.ready = False
 	try:
-		application.state.settings = get_settings()
-		application.state.init_settings = get_init_settings()
-		application.state.auth_settings = get_auth_settings()
+		with profiler.phase("settings"):
+			settings: Settings = get_settings()
+			application.state.settings = settings
+			application.state.init_settings = get_init_settings()
+			log_listener: QueueListener = configure_logging(
+				settings, application.state.init_settings
+			)
+			# Registered first so it runs last and flushes every log record
+			coordinator.register(
+				"logging",
+				partial(asyncio.to_thread, stop_logging, log_listener),
+			)
+			logger.info("Starting API...")
+			application.state.auth_settings = get_auth_settings()
+			mongodb_enabled: bool = get_nosql_db_settings().MONGODB_ENABLED
 		logger.info("Configuration settings loaded.")
-		await init_db()
+		with profiler.phase("openapi"):
+			application.state.openapi_artifact = load_openapi_artifact(
+				application,
+				application.state.init_settings.OPENAPI_FILE_PATH[1:],
+				settings.SERVER_RELOAD,
+			)
+		with profiler.phase("templates"):
+			await asyncio.to_thread(precompile_templates)
+		coordinator.register("postgresql", async_engine.dispose)
+		with profiler.phase("postgresql"):
+			await init_db()
 		logger.info("PostgreSQL initialized.")
-		# await init_nosql_db()
-		# logger.info("MongoDB initialized.")
+		coordinator.register("memcached", close_memcached_client)
+		coordinator.register("password hasher", get_password_hasher().close)
+		health_monitor: HealthMonitor = HealthMonitor(
+			settings.HEALTH_CHECK_INTERVAL_SECONDS,
+			settings.HEALTH_CHECK_TIMEOUT_SECONDS,
+		)
+		health_monitor.add_probe("postgresql", ping_db)
+		health_monitor.add_probe("memcached", ping_memcached, critical=False)
+		if mongodb_enabled:
+			# Beanie and PyMongo are only imported when MongoDB is enabled
+			from app.db.init_nosql_db import (
+				close_db,
+				init_nosql_db,
+				ping_nosql_db,
+			)
+
+			coordinator.register("mongodb", close_db)
+			with profiler.phase("mongodb"):
+				await init_nosql_db()
+			logger.info("MongoDB initialized.")
+			health_monitor.add_probe("mongodb", ping_nosql_db)
+		sql_db_settings: SQLDBSettings = get_sql_db_settings()
+		if sql_db_settings.POOL_PREWARM:
+			with profiler.phase("warmup"):
+				await warm_up(sql_db_settings)
+		with profiler.phase("health"):
+			await health_monitor.probe_all()
+		health_monitor.start()
+		application.state.health_monitor = health_monitor
+		coordinator.register("health monitor", health_monitor.stop)
+		user_identity_filter: UserIdentityFilter = get_user_identity_filter()
+		user_identity_filter.start()
+		coordinator.register("user identity filter", user_identity_filter.stop)
+		email_queue: EmailQueue = get_email_queue()
+		email_queue.start()
+		# Stopped before the pools, so queued emails are flushed first
+		coordinator.register("email queue", email_queue.stop)
+		runtime_monitor: RuntimeMonitor = RuntimeMonitor(
+			settings.RUNTIME_METRICS_INTERVAL_SECONDS
+		)
+		runtime_monitor.start()
+		coordinator.register("runtime monitor", runtime_monitor.stop)
+		loop_watchdog: LoopWatchdog = LoopWatchdog(
+			settings.LOOP_BLOCK_THRESHOLD_SECONDS,
+			settings.LOOP_WATCHDOG_INTERVAL_SECONDS,
+		)
+		loop_watchdog.start()
+		coordinator.register("loop watchdog", loop_watchdog.stop)
+		profiler.report()
+		application.state.ready = True
 		yield
 	except Exception as exc:
-		logger.error(f"Error during application startup: {exc}")
+		logger.error("Error during application startup: %s", exc)
 		raise
 	finally:
+		application.state.ready = False
+		await coordinator.shutdown()
 		logger.info("Application shutdown completed.")
@@ -0,0 +1,162 @@
+"""
+A module for loop watchdog in the app.core package.
+"""
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+from types import FrameType
+from typing import Final
+
+from pydantic import PositiveFloat
+
+from app.core.metrics import EVENT_LOOP_BLOCKED, EVENT_LOOP_BLOCK_DURATION
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# Frames of these modules are preferred as the culprit of a stall
+APP_MODULES: Final[tuple[str, ...]] = ("app.", "main")
+MAX_STACK_FRAMES: Final[int] = 30
+
+
+def describe_stack(frame: FrameType | None) -> tuple[str, str, list[str]]:
+	"""
+	Summarize the stack of a blocked thread
+
+	Args:
+		frame (FrameType | None): The innermost frame of the thread
+
+	Returns:
+		tuple[str, str, list[str]]: The module and function to blame,
+		preferring the innermost application frame, and the stack lines
+		from the outermost frame
+	"""
+	lines: list[str] = []
+	culprit: tuple[str, str] | None = None
+	innermost: tuple[str, str] = ("unknown", "unknown")
+	while frame is not None:
+		module: str = frame.f_globals.get("__name__", "unknown")
+		function: str = frame.f_code.co_name
+		if not lines:
+			innermost = (module, function)
+		if culprit is None and module.startswith(APP_MODULES):
+			culprit = (module, function)
+		if len(lines) < MAX_STACK_FRAMES:
+			lines.append(f"{module}:{function}:{frame.f_lineno}")
+		frame = frame.f_back
+	lines.reverse()
+	return *(culprit or innermost), lines
+
+
+class LoopWatchdog:
+	"""
+	Detects callbacks that block the event loop.
+
+	A task on the loop renews a heartbeat every half threshold. A thread
+	checks it and, when it is older than the threshold, logs the stack of
+	the loop thread and counts the stall by module and function. The stall
+	duration is recorded once the loop resumes.
+	"""
+
+	def __init__(self, threshold: PositiveFloat, interval: PositiveFloat):
+		self.threshold: PositiveFloat = threshold
+		self.interval: PositiveFloat = interval
+		self._heartbeat: float = time.monotonic()
+		self._loop_thread_id: int | None = None
+		self._stopped: threading.Event = threading.Event()
+		self._thread: threading.Thread | None = None
+		self._task: asyncio.Task[None] | None = None
+
+	async def _beat(self) -> None:
+		"""
+		Renew the heartbeat forever while the loop is responsive
+
+		Returns:
+			NoneType: None
+		"""
+		while True:
+			self._heartbeat = time.monotonic()
+			await asyncio.sleep(self.threshold / 2)
+
+	def _report(self, stalled_for: float) -> None:
+		"""
+		Log and count a stall with the stack of the loop thread
+
+		Args:
+			stalled_for (float): The seconds since the last heartbeat
+
+		Returns:
+			NoneType: None
+		"""
+		if self._loop_thread_id is None:
+			return
+		module, function, stack = describe_stack(
+			sys._current_frames().get(self._loop_thread_id)
+		)
+		EVENT_LOOP_BLOCKED.labels(module=module, function=function).inc()
+		logger.warning(
+			"Event loop blocked for %.0f ms in %s:%s\n  %s",
+			stalled_for * 1000,
+			module,
+			function,
+			"\n  ".join(stack),
+			extra={"blocked_module": module, "blocked_function": function},
+		)
+
+	def _watch(self) -> None:
+		"""
+		Check the heartbeat on the interval until stopped
+
+		Returns:
+			NoneType: None
+		"""
+		reported_heartbeat: float | None = None
+		while not self._stopped.wait(self.interval):
+			heartbeat: float = self._heartbeat
+			if (
+				reported_heartbeat is not None
+				and heartbeat != reported_heartbeat
+			):
+				EVENT_LOOP_BLOCK_DURATION.observe(
+					heartbeat - reported_heartbeat
+				)
+				reported_heartbeat = None
+			stalled_for: float = time.monotonic() - heartbeat
+			if reported_heartbeat is None and stalled_for > self.threshold:
+				self._report(stalled_for)
+				reported_heartbeat = heartbeat
+
+	def start(self) -> None:
+		"""
+		Start watching the running loop
+
+		Returns:
+			NoneType: None
+		"""
+		self._loop_thread_id = threading.get_ident()
+		self._heartbeat = time.monotonic()
+		self._stopped.clear()
+		self._task = asyncio.create_task(self._beat(), name="loop-heartbeat")
+		self._thread = threading.Thread(
+			target=self._watch, name="loop-watchdog", daemon=True
+		)
+		self._thread.start()
+
+	async def stop(self) -> None:
+		"""
+		Stop watching
+
+		Returns:
+			NoneType: None
+		"""
+		self._stopped.set()
+		if self._thread is not None:
+			await asyncio.to_thread(self._thread.join)
+			self._thread = None
+		if self._task is None:
+			return
+		self._task.cancel()
+		await asyncio.gather(self._task, return_exceptions=True)
+		self._task = None
@@ -16,7 +16,7 @@ from fastapi import Depends
 from pydantic import PositiveInt
 
 from app.config.auth_settings import AuthSettings
-from app.core.memcached_dependency import MemcachedDependency
+from app.core.memcached_dependency import MemcachedDependency, run_memcached
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -111,12 +111,12 @@ async def check_memcached_health(memcached: Client) -> bool:
 		MemcachedException: If the Memcached connection is not healthy.
 	"""
 	try:
-		memcached.set(b"health_check", b"ok")
-		value = memcached.get(b"health_check")
+		await run_memcached(lambda: memcached.set(b"health_check", b"ok"))
+		value = await run_memcached(lambda: memcached.get(b"health_check"))
 		if value != b"ok":
 			logger.error("Memcached connection error: Invalid value returned")
 			return False
 		return True
 	except MemcachedException as e:
-		logger.error(f"Memcached connection error: {e}")
+		logger.error("Memcached connection error: %s", e)
 		return False
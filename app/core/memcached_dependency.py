@@ -2,7 +2,11 @@
 A module for memcached dependency in the app.core package.
 """
 
+import asyncio
 import logging
+import threading
+from collections.abc import Callable
+from functools import lru_cache
 from typing import Annotated, Any
 
 from bmemcached import Client
@@ -14,6 +18,9 @@ from app.config.config import get_auth_settings
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+# The client is not thread-safe, so calls made from worker threads take turns
+_client_lock: threading.Lock = threading.Lock()
+
 
 class MemcachedDependency:
 	"""A class to handle Memcached connections as a FastAPI dependency."""
@@ -28,7 +35,10 @@ class MemcachedDependency:
 		username: str = _auth_settings.MEMCACHED_USERNAME
 		password: str = _auth_settings.MEMCACHED_PASSWORD
 		self._memcached: Client = Client(
-			servers=servers, username=username, password=password
+			servers=servers,
+			username=username,
+			password=password,
+			socket_timeout=_auth_settings.MEMCACHED_SOCKET_TIMEOUT_SECONDS,
 		)
 		self._memcached.enable_retry_delay(True)
 
@@ -61,3 +71,82 @@ async def get_memcached_dep(
 		Client: The Memcached client
 	"""
 	return memcached_dependency.get_client()
+
+
+@lru_cache
+def get_memcached_client() -> Client:
+	"""
+	Get the Memcached client shared by the whole process.
+
+	Returns:
+		Client: The process-wide Memcached client
+	"""
+	return MemcachedDependency().get_client()
+
+
+def _call_locked[T](operation: Callable[[], T]) -> T:
+	"""
+	Run a client operation while holding the client lock
+
+	Args:
+		operation (Callable[[], T]): The client operation
+
+	Returns:
+		T: The result of the operation
+	"""
+	with _client_lock:
+		return operation()
+
+
+async def run_memcached[T](operation: Callable[[], T]) -> T:
+	"""
+	Run a blocking client operation in a worker thread, one at a time
+
+	Args:
+		operation (Callable[[], T]): The client operation
+
+	Returns:
+		T: The result of the operation
+	"""
+	return await asyncio.to_thread(_call_locked, operation)
+
+
+async def close_memcached_client() -> None:
+	"""
+	Disconnect the process-wide Memcached client if it was ever created
+
+	Returns:
+		NoneType: None
+	"""
+	if not get_memcached_client.cache_info().currsize:
+		return
+	await run_memcached(get_memcached_client().disconnect_all)
+	get_memcached_client.cache_clear()
+
+
+async def warm_up_memcached_client() -> None:
+	"""
+	Open the connection of the process-wide Memcached client ahead of time
+
+	Returns:
+		NoneType: None
+	"""
+	await run_memcached(lambda: get_memcached_client().get("warmup"))
+
+
+async def ping_memcached() -> None:
+	"""
+	Check that every Memcached server answers
+
+	Returns:
+		NoneType: None
+
+	Raises:
+		ConnectionError: If a server does not answer
+	"""
+	stats: dict[str, dict[str, Any]] = await run_memcached(
+		get_memcached_client().stats
+	)
+	down: list[str] = [server for server, values in stats.items() if not values]
+	if down:
+		raise ConnectionError(f"Memcached unreachable: {', '.join(down)}")
@@ -0,0 +1,178 @@
+"""
+A module for metrics in the app.core package.
+"""
+
+import os
+from typing import Final
+
+from prometheus_client import (
+	CONTENT_TYPE_LATEST,
+	CollectorRegistry,
+	Counter,
+	Gauge,
+	Histogram,
+	generate_latest,
+	multiprocess,
+)
+
+# Latency buckets in seconds, finer below the 100 ms target of the API
+LATENCY_BUCKETS: Final[tuple[float, ...]] = (
+	0.005,
+	0.01,
+	0.025,
+	0.05,
+	0.075,
+	0.1,
+	0.25,
+	0.5,
+	1.0,
+	2.5,
+	5.0,
+	10.0,
+)
+
+HTTP_REQUESTS_TOTAL: Counter = Counter(
+	"http_requests",
+	"HTTP requests completed by route template and status class",
+	["method", "route", "status_class"],
+)
+HTTP_REQUEST_DURATION: Histogram = Histogram(
+	"http_request_duration_seconds",
+	"HTTP request latency by route template and status class",
+	["method", "route", "status_class"],
+	buckets=LATENCY_BUCKETS,
+)
+HTTP_REQUESTS_IN_FLIGHT: Gauge = Gauge(
+	"http_requests_in_flight",
+	"HTTP requests currently being processed",
+	["method"],
+	multiprocess_mode="livesum",
+)
+EVENT_LOOP_LAG: Gauge = Gauge(
+	"event_loop_lag_seconds",
+	"Delay of the last event loop lag probe past its scheduled time",
+	multiprocess_mode="liveall",
+)
+GC_PAUSE: Histogram = Histogram(
+	"gc_pause_seconds",
+	"Duration of the garbage collector runs by generation",
+	["generation"],
+	buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25),
+)
+EVENT_LOOP_BLOCKED: Counter = Counter(
+	"event_loop_blocked",
+	"Callbacks that held the event loop past the watchdog threshold",
+	["module", "function"],
+)
+EVENT_LOOP_BLOCK_DURATION: Histogram = Histogram(
+	"event_loop_block_duration_seconds",
+	"Duration of the event loop stalls caught by the watchdog",
+	buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+PASSWORD_HASH_DURATION: Histogram = Histogram(
+	"password_hash_duration_seconds",
+	"Duration of the bcrypt operations run on the process pool",
+	["operation"],
+	buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+PASSWORD_HASH_REJECTED: Counter = Counter(
+	"password_hash_rejected",
+	"bcrypt operations rejected after waiting for a process pool slot",
+)
+AUTH_CACHE_LOOKUPS: Counter = Counter(
+	"auth_cache_lookups",
+	"Lookups of the per-worker verified claims and user caches",
+	["cache", "result"],
+)
+REFRESH_TOKEN_REUSE: Counter = Counter(
+	"refresh_token_reuse",
+	"Refresh tokens presented after rotation, revoking their session",
+)
+USER_AVAILABILITY_CHECKS: Counter = Counter(
+	"user_availability_checks",
+	"Username and email checks by whether the Bloom filter or the database"
+	" answered them",
+	["field", "result"],
+)
+EMAIL_QUEUE_DEPTH: Gauge = Gauge(
+	"email_queue_depth",
+	"Emails waiting in the delivery queue",
+	multiprocess_mode="livesum",
+)
+EMAIL_DELIVERY_LATENCY: Histogram = Histogram(
+	"email_delivery_latency_seconds",
+	"Time from queueing an email to its delivery to the provider",
+	buckets=(0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0),
+)
+EMAILS_PROCESSED: Counter = Counter(
+	"emails_processed",
+	"Emails by delivery outcome: sent, retried or dead-lettered",
+	["result"],
+)
+PROCESS_RSS: Gauge = Gauge(
+	"process_rss_bytes",
+	"Resident set size of the worker process",
+	multiprocess_mode="liveall",
+)
+
+ADMISSION_IN_FLIGHT: Gauge = Gauge(
+	"admission_in_flight_requests",
+	"Requests currently admitted and being processed",
+	multiprocess_mode="livesum",
+)
+ADMISSION_QUEUE_DEPTH: Gauge = Gauge(
+	"admission_queue_depth",
+	"Requests waiting for an admission slot",
+	multiprocess_mode="livesum",
+)
+ADMISSION_SHED_TOTAL: Counter = Counter(
+	"admission_shed_requests",
+	"Requests rejected with 503 by the admission controller",
+	["reason"],
+)
+STARTUP_DURATION: Gauge = Gauge(
+	"startup_duration_seconds",
+	"Time the worker spent in the lifespan startup before serving",
+	multiprocess_mode="max",
+)
+STARTUP_PHASE_DURATION: Gauge = Gauge(
+	"startup_phase_duration_seconds",
+	"Time the worker spent in each lifespan startup phase",
+	["phase"],
+	multiprocess_mode="max",
+)
+DEPENDENCY_HEALTHY: Gauge = Gauge(
+	"dependency_healthy",
+	"Whether the last background probe of a dependency passed",
+	["dependency"],
+	multiprocess_mode="livemin",
+)
+DEPENDENCY_PROBE_LATENCY: Gauge = Gauge(
+	"dependency_probe_latency_seconds",
+	"Duration of the last background probe of a dependency",
+	["dependency"],
+	multiprocess_mode="livemax",
+)
+LOG_RECORDS_DROPPED: Counter = Counter(
+	"log_records_dropped",
+	"Log records dropped by sampling or because the log queue was full",
+	["reason"],
+)
+
+
+def render_metrics() -> tuple[bytes, str]:
+	"""
+	Render the registered metrics in the Prometheus text format.
+
+	With PROMETHEUS_MULTIPROC_DIR set, the metrics of every worker are read
+	from their memory-mapped files and aggregated, so any worker answering
+	the scrape reports the whole server.
+
+	Returns:
+		tuple[bytes, str]: The metrics payload and its content type
+	"""
+	if "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+		return generate_latest(), CONTENT_TYPE_LATEST
+	registry: CollectorRegistry = CollectorRegistry()
+	multiprocess.MultiProcessCollector(registry)  # type: ignore[no-untyped-call]
+	return generate_latest(registry), CONTENT_TYPE_LATEST
@@ -0,0 +1,139 @@
+"""
+A module for openapi artifact in the app.core package.
+"""
+
+import gzip
+import hashlib
+import logging
+from typing import Final
+
+import brotli
+from fastapi import FastAPI, Request, Response, status
+
+from app.core.content_negotiation import accept_quality
+from app.utils.openapi_utils import custom_openapi, serialize_schema
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+JSON_MEDIA_TYPE: Final[str] = "application/json"
+IDENTITY: Final[str] = "identity"
+# Preferred first when the client gives several encodings the same quality
+ENCODINGS: Final[tuple[str, ...]] = ("br", "gzip", IDENTITY)
+
+
+class OpenAPIArtifact:
+	"""
+	Prebuilt OpenAPI document served from memory.
+
+	The minified JSON is compressed once with Brotli and gzip. Every
+	variant gets its own strong ETag, so conditional requests are answered
+	with 304 without touching the body.
+	"""
+
+	def __init__(self, body: bytes):
+		digest: str = hashlib.sha256(body).hexdigest()[:32]
+		self.bodies: dict[str, bytes] = {
+			"br": brotli.compress(body, quality=11),
+			"gzip": gzip.compress(body, compresslevel=9, mtime=0),
+			IDENTITY: body,
+		}
+		self.etags: dict[str, str] = {
+			encoding: f'"{digest}"'
+			if encoding == IDENTITY
+			else f'"{digest}-{encoding}"'
+			for encoding in ENCODINGS
+		}
+		logger.info(
+			"OpenAPI artifact ready: %s",
+			", ".join(
+				f"{encoding}={len(content)}B"
+				for encoding, content in self.bodies.items()
+			),
+		)
+
+	def select_encoding(self, accept_encoding: str | None) -> str:
+		"""
+		Pick the best content coding the client accepts
+
+		Args:
+			accept_encoding (str | None): The Accept-Encoding header value
+
+		Returns:
+			str: The chosen content coding
+		"""
+		if not accept_encoding:
+			return IDENTITY
+		accept_encoding = accept_encoding.lower()
+		best_encoding: str = IDENTITY
+		best_quality: float = 0.0
+		for encoding in ENCODINGS[:-1]:
+			quality: float = accept_quality(
+				accept_encoding, frozenset({encoding, "*"})
+			)
+			if quality > best_quality:
+				best_encoding, best_quality = encoding, quality
+		return best_encoding
+
+	def response(self, request: Request) -> Response:
+		"""
+		Build the response for a request of the OpenAPI document
+
+		Args:
+			request (Request): The incoming request
+
+		Returns:
+			Response: The document, or 304 Not Modified on a matching ETag
+		"""
+		encoding: str = self.select_encoding(
+			request.headers.get("accept-encoding")
+		)
+		headers: dict[str, str] = {
+			"ETag": self.etags[encoding],
+			"Cache-Control": "no-cache",
+			"Vary": "Accept-Encoding",
+		}
+		if encoding != IDENTITY:
+			headers["Content-Encoding"] = encoding
+		if_none_match: str | None = request.headers.get("if-none-match")
+		if if_none_match and (
+			if_none_match.strip() == "*"
+			or self.etags[encoding]
+			in (
+				tag.strip().removeprefix("W/")
+				for tag in if_none_match.split(",")
+			)
+		):
+			return Response(
+				status_code=status.HTTP_304_NOT_MODIFIED, headers=headers
+			)
+		return Response(
+			self.bodies[encoding], media_type=JSON_MEDIA_TYPE, headers=headers
+		)
+
+
+def load_openapi_artifact(
+	app: FastAPI, file_path: str, regenerate: bool
+) -> OpenAPIArtifact:
+	"""
+	Load the prebuilt OpenAPI document into memory.
+
+	The document is generated from the routes instead when it was not built
+	or when regeneration is requested, as with auto-reload in development.
+
+	Args:
+		app (FastAPI): The FastAPI application instance
+		file_path (str): The path of the prebuilt document
+		regenerate (bool): Whether to ignore the prebuilt document
+
+	Returns:
+		OpenAPIArtifact: The artifact to serve
+	"""
+	if not regenerate:
+		try:
+			with open(file_path, mode="rb") as in_file:
+				return OpenAPIArtifact(in_file.read())
+		except FileNotFoundError:
+			logger.warning(
+				"No prebuilt OpenAPI document at %s, generating it", file_path
+			)
+	return OpenAPIArtifact(serialize_schema(custom_openapi(app)))
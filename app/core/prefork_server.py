@@ -0,0 +1,206 @@
+"""
+Production server that forks Uvicorn workers from a preloaded master.
+
+The master imports the application once and freezes the garbage collector
+before forking, so the imported code and objects stay in pages shared by
+every worker. Each worker then builds its own connection pools. The
+workers share their Prometheus metrics through memory-mapped files in
+PROMETHEUS_MULTIPROC_DIR, a fresh temporary directory unless it is set.
+
+Run it from the project root with:
+	python -m app.core.prefork_server
+
+Signals sent to the master:
+	HUP: start new workers and gracefully stop the old ones
+	TERM: graceful shutdown, new requests are refused and in-flight ones
+	are drained for up to SHUTDOWN_DRAIN_TIMEOUT_SECONDS
+	TTIN / TTOU: add or remove a worker
+	USR2 then QUIT to the old master: reload the code with no downtime
+"""
+
+import gc
+import logging
+import os
+import sys
+import tempfile
+from pathlib import Path
+from types import FrameType
+from typing import Any, Final
+
+from fastapi import FastAPI
+from gunicorn.app.base import BaseApplication
+from gunicorn.arbiter import Arbiter
+from gunicorn.workers.base import Worker
+from uvicorn import Server
+from uvicorn_worker import UvicornWorker
+
+from app.config.config import get_settings
+from app.config.settings import Settings
+from app.core.shutdown import get_shutdown_coordinator
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+MULTIPROC_DIR_ENV: Final[str] = "PROMETHEUS_MULTIPROC_DIR"
+
+
+def prepare_metrics_dir() -> Path:
+	"""
+	Give the workers an empty directory to share their metrics through.
+
+	prometheus_client reads the variable when it is imported, so this runs
+	before the application is loaded. Each worker writes its metrics to
+	memory-mapped files there, and a scrape of any worker aggregates them.
+
+	Returns:
+		Path: The metrics directory
+	"""
+	directory: Path = Path(
+		os.environ.get(MULTIPROC_DIR_ENV)
+		or tempfile.mkdtemp(prefix="fastorders-metrics-")
+	)
+	directory.mkdir(parents=True, exist_ok=True)
+	for stale_file in directory.glob("*.db"):
+		stale_file.unlink()
+	os.environ[MULTIPROC_DIR_ENV] = str(directory)
+	return directory
+
+
+def pre_fork(server: Arbiter, worker: Worker) -> None:  # noqa: ARG001
+	"""
+	Move every object of the master out of the collector's reach.
+
+	A collection in a worker would otherwise write to the reference
+	headers of the inherited objects and unshare their pages.
+
+	Args:
+		server (Arbiter): The Gunicorn master
+		worker (Worker): The worker about to be forked
+
+	Returns:
+		NoneType: None
+	"""
+	gc.freeze()
+
+
+def post_fork(server: Arbiter, worker: Worker) -> None:  # noqa: ARG001
+	"""
+	Drop the connection state inherited from the master.
+
+	Sockets must never be shared between processes, so each worker starts
+	with empty pools and creates its own connections on first use.
+
+	Args:
+		server (Arbiter): The Gunicorn master
+		worker (Worker): The forked worker
+
+	Returns:
+		NoneType: None
+	"""
+	from app.core.memcached_dependency import get_memcached_client
+	from app.db.session import async_engine
+
+	async_engine.sync_engine.dispose(close=False)
+	get_memcached_client.cache_clear()
+	logger.info("Worker %s forked with fresh connection pools", worker.pid)
+
+
+def child_exit(server: Arbiter, worker: Worker) -> None:  # noqa: ARG001
+	"""
+	Drop the live gauges of a worker that exited from the scrapes.
+
+	Args:
+		server (Arbiter): The Gunicorn master
+		worker (Worker): The worker that exited
+
+	Returns:
+		NoneType: None
+	"""
+	from prometheus_client import multiprocess
+
+	multiprocess.mark_process_dead(worker.pid)  # type: ignore[no-untyped-call]
+
+
+class DrainingServer(Server):
+	"""Uvicorn server that starts draining the worker on its stop signal"""
+
+	def handle_exit(self, sig: int, frame: FrameType | None) -> None:
+		"""
+		Refuse new requests, then let Uvicorn close its listeners and wait
+		for the in-flight requests
+
+		Args:
+			sig (int): The signal received
+			frame (FrameType | None): The frame interrupted by the signal
+
+		Returns:
+			NoneType: None
+		"""
+		get_shutdown_coordinator().start_draining()
+		super().handle_exit(sig, frame)
+
+
+class DrainingUvicornWorker(UvicornWorker):  # type: ignore[misc]
+	"""
+	Uvicorn worker that drains its requests when the master stops it.
+
+	Requests still running after the drain timeout are cancelled, so the
+	cleanup steps of the lifespan run before the graceful timeout of
+	Gunicorn kills the worker.
+	"""
+
+	def __init__(self, *args: Any, **kwargs: Any):
+		super().__init__(*args, **kwargs)
+		self.config.timeout_graceful_shutdown = int(
+			get_settings().SHUTDOWN_DRAIN_TIMEOUT_SECONDS
+		)
+
+	async def _serve(self) -> None:
+		"""
+		Serve the application with a draining server, as UvicornWorker does
+
+		Returns:
+			NoneType: None
+		"""
+		self.config.app = self.wsgi
+		server: DrainingServer = DrainingServer(config=self.config)
+		self._install_sigquit_handler()
+		await server.serve(sockets=self.sockets)
+		if not server.started:
+			sys.exit(Arbiter.WORKER_BOOT_ERROR)
+
+
+class PreforkServer(BaseApplication):  # type: ignore[misc]
+	"""Gunicorn application running the API with Uvicorn workers"""
+
+	def __init__(self, settings: Settings):
+		self.settings: Settings = settings
+		super().__init__()
+
+	def load_config(self) -> None:
+		options: dict[str, Any] = {
+			"bind": f"{self.settings.HOST}:{self.settings.PORT}",
+			"workers": self.settings.SERVER_WORKERS or os.cpu_count() or 1,
+			"worker_class": DrainingUvicornWorker,
+			"preload_app": True,
+			"max_requests": self.settings.SERVER_MAX_REQUESTS,
+			"max_requests_jitter": self.settings.SERVER_MAX_REQUESTS_JITTER,
+			"graceful_timeout": self.settings.SERVER_GRACEFUL_TIMEOUT_SECONDS,
+			"keepalive": self.settings.SERVER_KEEPALIVE_SECONDS,
+			"loglevel": self.settings.SERVER_LOG_LEVEL,
+			"pre_fork": pre_fork,
+			"post_fork": post_fork,
+			"child_exit": child_exit,
+		}
+		for key, value in options.items():
+			self.cfg.set(key, value)
+
+	def load(self) -> FastAPI:
+		from main import app
+
+		gc.collect()
+		return app
+
+
+if __name__ == "__main__":
+	prepare_metrics_dir()
+	PreforkServer(get_settings()).run()
@@ -0,0 +1,103 @@
+"""
+On-demand profiling of single requests.
+
+A request is profiled when it carries a bearer token of a superuser and an
+X-Profile header signed with the secret key for its method and path. The
+header is valid until the expiry it holds. Print one with:
+	python -m app.core.profiling GET /api/v1/product/ [seconds]
+"""
+
+import hashlib
+import hmac
+import sys
+import time
+from typing import Final
+
+from pydantic import PositiveInt
+
+PROFILE_HEADER: Final[str] = "X-Profile"
+DEFAULT_VALIDITY_SECONDS: Final[PositiveInt] = 300
+
+
+def _signature(secret_key: str, method: str, path: str, expires: int) -> str:
+	"""
+	Compute the signature of a profiling request
+
+	Args:
+		secret_key (str): The secret key of the application
+		method (str): The HTTP method of the request
+		path (str): The path of the request
+		expires (int): The Unix time the header expires at
+
+	Returns:
+		str: The hex HMAC-SHA256 signature
+	"""
+	message: bytes = f"{expires}:{method.upper()}:{path}".encode()
+	return hmac.new(secret_key.encode(), message, hashlib.sha256).hexdigest()
+
+
+def sign_profile_request(
+	secret_key: str,
+	method: str,
+	path: str,
+	validity: PositiveInt = DEFAULT_VALIDITY_SECONDS,
+) -> str:
+	"""
+	Build the X-Profile header value for a request
+
+	Args:
+		secret_key (str): The secret key of the application
+		method (str): The HTTP method of the request
+		path (str): The path of the request
+		validity (PositiveInt): The seconds the header stays valid. Default
+		to DEFAULT_VALIDITY_SECONDS
+
+	Returns:
+		str: The header value, the expiry and the signature
+	"""
+	expires: int = int(time.time()) + validity
+	return f"{expires}.{_signature(secret_key, method, path, expires)}"
+
+
+def verify_profile_request(
+	secret_key: str,
+	header: str,
+	method: str,
+	path: str,
+	max_validity: PositiveInt,
+) -> bool:
+	"""
+	Check the X-Profile header of a request
+
+	Args:
+		secret_key (str): The secret key of the application
+		header (str): The X-Profile header value
+		method (str): The HTTP method of the request
+		path (str): The path of the request
+		max_validity (PositiveInt): The longest validity accepted in seconds
+
+	Returns:
+		bool: True if the signature matches and the header did not expire
+	"""
+	expires_text, _, signature = header.partition(".")
+	if not expires_text.isdigit():
+		return False
+	expires: int = int(expires_text)
+	if not 0 <= expires - time.time() <= max_validity:
+		return False
+	return hmac.compare_digest(
+		signature, _signature(secret_key, method, path, expires)
+	)
+
+
+if __name__ == "__main__":
+	from app.config.config import get_auth_settings
+
+	print(
+		sign_profile_request(
+			get_auth_settings().SECRET_KEY,
+			sys.argv[1],
+			sys.argv[2],
+			int(sys.argv[3]) if len(sys.argv) > 3 else DEFAULT_VALIDITY_SECONDS,
+		)
+	)
@@ -0,0 +1,114 @@
+"""
+A module for request timing in the app.core package.
+"""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Final
+
+# The spans reported in the Server-Timing header, in this order
+SPANS: Final[tuple[str, ...]] = ("db", "cache", "serialize")
+
+
+class RequestTiming:
+	"""
+	Time spent by a request in each span, accumulated in seconds.
+
+	Spans of the same name add up, so a request with three queries reports
+	their total database time.
+	"""
+
+	def __init__(self, request_id: str):
+		self.request_id: str = request_id
+		self.started_at: float = time.perf_counter()
+		self.spans: dict[str, float] = dict.fromkeys(SPANS, 0.0)
+
+	@property
+	def total(self) -> float:
+		"""
+		Get the time since the request started
+
+		Returns:
+			float: The elapsed time in seconds
+		"""
+		return time.perf_counter() - self.started_at
+
+	def add(self, name: str, seconds: float) -> None:
+		"""
+		Add time to a span
+
+		Args:
+			name (str): The span name
+			seconds (float): The time spent in seconds
+
+		Returns:
+			NoneType: None
+		"""
+		self.spans[name] = self.spans.get(name, 0.0) + seconds
+
+	def milliseconds(self) -> dict[str, float]:
+		"""
+		Get the spans and the total in milliseconds
+
+		Returns:
+			dict[str, float]: The rounded durations by span name
+		"""
+		durations: dict[str, float] = {
+			name: round(seconds * 1000, 2)
+			for name, seconds in self.spans.items()
+		}
+		durations["total"] = round(self.total * 1000, 2)
+		return durations
+
+	def server_timing(self) -> str:
+		"""
+		Render the spans and the total as a Server-Timing header value
+
+		Returns:
+			str: The header value
+		"""
+		return ", ".join(
+			f"{name};dur={duration}"
+			for name, duration in self.milliseconds().items()
+		)
+
+
+request_timing: ContextVar[RequestTiming | None] = ContextVar(
+	"request_timing", default=None
+)
+
+
+def record_span(name: str, seconds: float) -> None:
+	"""
+	Add time to a span of the current request, if any
+
+	Args:
+		name (str): The span name
+		seconds (float): The time spent in seconds
+
+	Returns:
+		NoneType: None
+	"""
+	timing: RequestTiming | None = request_timing.get()
+	if timing is not None:
+		timing.add(name, seconds)
+
+
+@contextmanager
+def timing_span(name: str) -> Iterator[None]:
+	"""
+	Time a block into a span of the current request
+
+	Args:
+		name (str): The span name
+
+	Yields:
+		Iterator[None]: Control to the timed block
+	"""
+	started_at: float = time.perf_counter()
+	try:
+		yield
+	finally:
+		record_span(name, time.perf_counter() - started_at)
@@ -0,0 +1,106 @@
+"""
+A module for runtime metrics in the app.core package.
+"""
+
+import asyncio
+import gc
+import logging
+import os
+import time
+from typing import Any, Final
+
+from pydantic import PositiveFloat
+
+from app.core.metrics import EVENT_LOOP_LAG, GC_PAUSE, PROCESS_RSS
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+PAGE_SIZE: Final[int] = os.sysconf("SC_PAGE_SIZE")
+
+
+def read_rss() -> int | None:
+	"""
+	Read the resident set size of the current process from procfs
+
+	Returns:
+		int | None: The RSS in bytes, or None where procfs is unavailable
+	"""
+	try:
+		with open("/proc/self/statm", encoding="ascii") as statm:
+			return int(statm.read().split()[1]) * PAGE_SIZE
+	except OSError:
+		return None
+
+
+class RuntimeMonitor:
+	"""
+	Samples the event loop lag, GC pauses and RSS of the worker.
+
+	A task sleeps for the interval and reports how late it woke up, which
+	is the time other callbacks held the loop. Garbage collector runs are
+	timed through gc.callbacks, since they pause the loop too.
+	"""
+
+	def __init__(self, interval: PositiveFloat):
+		self.interval: PositiveFloat = interval
+		self._task: asyncio.Task[None] | None = None
+		self._gc_started_at: float = 0.0
+
+	def _on_gc(self, phase: str, info: dict[str, Any]) -> None:
+		"""
+		Time a garbage collector run
+
+		Args:
+			phase (str): Either "start" or "stop"
+			info (dict[str, Any]): The run details with its generation
+
+		Returns:
+			NoneType: None
+		"""
+		if phase == "start":
+			self._gc_started_at = time.perf_counter()
+			return
+		GC_PAUSE.labels(generation=str(info["generation"])).observe(
+			time.perf_counter() - self._gc_started_at
+		)
+
+	async def _run(self) -> None:
+		"""
+		Sample the loop lag and the RSS forever on the interval
+
+		Returns:
+			NoneType: None
+		"""
+		loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+		while True:
+			expected: float = loop.time() + self.interval
+			await asyncio.sleep(self.interval)
+			EVENT_LOOP_LAG.set(max(loop.time() - expected, 0.0))
+			rss: int | None = read_rss()
+			if rss is not None:
+				PROCESS_RSS.set(rss)
+
+	def start(self) -> None:
+		"""
+		Start sampling in the background
+
+		Returns:
+			NoneType: None
+		"""
+		gc.callbacks.append(self._on_gc)
+		self._task = asyncio.create_task(self._run(), name="runtime-monitor")
+
+	async def stop(self) -> None:
+		"""
+		Stop sampling
+
+		Returns:
+			NoneType: None
+		"""
+		if self._on_gc in gc.callbacks:
+			gc.callbacks.remove(self._on_gc)
+		if self._task is None:
+			return
+		self._task.cancel()
+		await asyncio.gather(self._task, return_exceptions=True)
+		self._task = None
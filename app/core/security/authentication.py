@@ -0,0 +1,294 @@
+"""
+A module for authentication in the app.core.security package.
+
+Verifying a bearer token costs an HMAC check and a Pydantic validation of
+its claims, and loading its user a database query. Both are cached in the
+worker: the claims by token hash until the token expires, the user by ID
+for USER_CACHE_SECONDS. User changes clear the local entry at once, while
+other workers may serve the old row until it expires. Logins resolve the
+username through a cached index, as usernames never change.
+"""
+
+import hashlib
+import logging
+import time
+from functools import lru_cache
+from typing import Annotated
+from uuid import UUID
+
+from authlib.jose import JoseError
+from fastapi import Depends, HTTPException, status
+from fastapi.security import OAuth2PasswordBearer
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config.auth_settings import AuthSettings
+from app.config.config import auth_setting, get_auth_settings
+from app.core.enums.toke_type import TokenType
+from app.core.metrics import AUTH_CACHE_LOOKUPS
+from app.core.security.jwt import decode_token
+from app.core.security.password import (
+	verify_dummy_password_async,
+	verify_password_async,
+)
+from app.core.ttl_cache import TTLCache
+from app.db.session import get_session
+from app.exceptions.exceptions import InvalidTokenError, ServiceException
+from app.models.structured.user import User
+from app.repositories.structured.user_repository import UserRepository
+from app.schemas.external.token_payload import TokenPayload
+from app.schemas.user import UserResponse
+
+logger: logging.Logger = logging.getLogger(__name__)
+oauth2_scheme: OAuth2PasswordBearer = OAuth2PasswordBearer(
+	tokenUrl=auth_setting.TOKEN_URL
+)
+user_response_columns: tuple[str, ...] = tuple(UserResponse.model_fields)
+login_columns: tuple[str, ...] = (
+	"id",
+	"username",
+	"email",
+	"first_name",
+	"password",
+	"is_active",
+)
+
+
+@lru_cache
+def get_claims_cache() -> TTLCache[bytes, TokenPayload]:
+	"""
+	Get the verified claims cache of the worker
+
+	Returns:
+		TTLCache[bytes, TokenPayload]: The claims keyed by token hash
+	"""
+	return TTLCache(get_auth_settings().CLAIMS_CACHE_SIZE)
+
+
+@lru_cache
+def get_user_cache() -> TTLCache[UUID, UserResponse]:
+	"""
+	Get the authenticated user cache of the worker
+
+	Returns:
+		TTLCache[UUID, UserResponse]: The users keyed by ID
+	"""
+	return TTLCache(get_auth_settings().USER_CACHE_SIZE)
+
+
+@lru_cache
+def get_username_index() -> TTLCache[str, UUID]:
+	"""
+	Get the username to user ID index of the worker
+
+	Returns:
+		TTLCache[str, UUID]: The user IDs keyed by username
+	"""
+	return TTLCache(get_auth_settings().USER_CACHE_SIZE)
+
+
+def _token_key(token: str) -> bytes:
+	"""
+	Hash a token for the claims cache, so tokens are not kept in memory
+
+	Args:
+		token (str): The encoded JWT
+
+	Returns:
+		bytes: The SHA-256 digest of the token
+	"""
+	return hashlib.sha256(token.encode()).digest()
+
+
+def verify_token(
+	token: str,
+	auth_settings: AuthSettings,
+	scope: TokenType = TokenType.ACCESS_TOKEN,
+) -> TokenPayload:
+	"""
+	Verify a JWT and validate its claims, through the claims cache
+
+	Args:
+		token (str): The encoded JWT
+		auth_settings (AuthSettings): The auth settings with the secret key
+		scope (TokenType): The scope the token must have. Default to
+		TokenType.ACCESS_TOKEN
+
+	Returns:
+		TokenPayload: The validated claims
+
+	Raises:
+		InvalidTokenError: If the signature, the claims or the scope are
+		invalid, or the token expired
+	"""
+	key: bytes = _token_key(token)
+	claims_cache: TTLCache[bytes, TokenPayload] = get_claims_cache()
+	payload: TokenPayload | None = claims_cache.get(key)
+	AUTH_CACHE_LOOKUPS.labels(
+		cache="claims", result="miss" if payload is None else "hit"
+	).inc()
+	if payload is None:
+		try:
+			payload = TokenPayload.model_validate(
+				decode_token(token, auth_settings)
+			)
+		except (JoseError, ValidationError, ServiceException) as exc:
+			raise InvalidTokenError(str(exc)) from exc
+		claims_cache.set(key, payload, payload.exp)
+	if payload.scope != scope:
+		raise InvalidTokenError(f"Expected a token of scope {scope}")
+	return payload
+
+
+def forget_token(token: str) -> None:
+	"""
+	Drop a token from the claims cache of the worker
+
+	Args:
+		token (str): The encoded JWT
+
+	Returns:
+		NoneType: None
+	"""
+	get_claims_cache().pop(_token_key(token))
+
+
+def user_id_from_sub(sub: str) -> UUID:
+	"""
+	Extract the user ID from the subject claim
+
+	Args:
+		sub (str): The subject, "username:" followed by the user ID
+
+	Returns:
+		UUID: The user ID
+	"""
+	return UUID(sub.removeprefix("username:"))
+
+
+async def load_user(
+	user_id: UUID, session: AsyncSession
+) -> UserResponse | None:
+	"""
+	Load a user through the user cache
+
+	Args:
+		user_id (UUID): The user ID
+		session (AsyncSession): The session to query on a cache miss
+
+	Returns:
+		UserResponse | None: The user, or None if it does not exist
+	"""
+	user_cache: TTLCache[UUID, UserResponse] = get_user_cache()
+	cached: UserResponse | None = user_cache.get(user_id)
+	AUTH_CACHE_LOOKUPS.labels(
+		cache="user", result="miss" if cached is None else "hit"
+	).inc()
+	if cached is not None:
+		return cached
+	user: User | None = await UserRepository(session).get(
+		user_id, user_response_columns
+	)
+	if user is None:
+		return None
+	user_response: UserResponse = UserResponse.model_validate(user)
+	user_cache.set(
+		user_id,
+		user_response,
+		time.time() + get_auth_settings().USER_CACHE_SECONDS,
+	)
+	return user_response
+
+
+def invalidate_user(user_id: UUID) -> None:
+	"""
+	Drop a user from the user cache of the worker after it changed
+
+	Args:
+		user_id (UUID): The user ID
+
+	Returns:
+		NoneType: None
+	"""
+	get_user_cache().pop(user_id)
+
+
+async def authenticate_user(
+	username: str, password: str, session: AsyncSession
+) -> User | None:
+	"""
+	Check the credentials of a user, storing a rehash of its password when
+	the hash is outdated
+
+	Args:
+		username (str): The username
+		password (str): The plain password
+		session (AsyncSession): The database session
+
+	Returns:
+		User | None: The user, or None if the credentials are wrong
+	"""
+	if not password:
+		return None
+	user_repository: UserRepository = UserRepository(session)
+	username_index: TTLCache[str, UUID] = get_username_index()
+	user_id: UUID | None = username_index.get(username)
+	user: User | None
+	if user_id is None:
+		user = await user_repository.get_by_username(username)
+	else:
+		user = await user_repository.get(user_id, login_columns)
+	if user is None:
+		username_index.pop(username)
+		await verify_dummy_password_async(password)
+		return None
+	username_index.set(
+		username, user.id, time.time() + get_auth_settings().CACHE_SECONDS
+	)
+	verified: bool
+	new_hash: str | None
+	verified, new_hash = await verify_password_async(user.password, password)
+	if not verified:
+		return None
+	if new_hash:
+		await user_repository.update(user, {"password": new_hash})
+	return user
+
+
+async def get_current_user(
+	token: Annotated[str, Depends(oauth2_scheme)],
+	auth_settings: Annotated[AuthSettings, Depends(get_auth_settings)],
+	db: Annotated[AsyncSession, Depends(get_session)],
+) -> UserResponse:
+	"""
+	Get the active user the bearer token of the request belongs to
+
+	Args:
+		token (str): The bearer token of the request
+		auth_settings (AuthSettings): Dependency method for cached auth
+		setting object
+		db (AsyncSession): The database session
+
+	Returns:
+		UserResponse: The authenticated user
+
+	Raises:
+		HTTPException: If the token is invalid or its user is missing or
+		inactive
+	"""
+	credentials_exception: HTTPException = HTTPException(
+		status_code=status.HTTP_401_UNAUTHORIZED,
+		detail=auth_settings.DETAIL,
+		headers=auth_settings.HEADERS,
+	)
+	try:
+		payload: TokenPayload = verify_token(token, auth_settings)
+		user_id: UUID = user_id_from_sub(payload.sub)
+	except (InvalidTokenError, ValueError) as exc:
+		logger.info("Rejected bearer token: %s", exc)
+		raise credentials_exception from exc
+	user: UserResponse | None = await load_user(user_id, db)
+	if user is None or not user.is_active:
+		logger.info("Rejected bearer token of user %s", user_id)
+		raise credentials_exception
+	return user
@@ -7,7 +7,7 @@ import logging
 from datetime import UTC, datetime, timedelta
 from typing import Annotated, Any
 
-from authlib.jose import JoseError, jwt
+from authlib.jose import JWTClaims, JoseError, JsonWebToken
 from fastapi import Depends
 from fastapi.encoders import jsonable_encoder
 from pydantic import NonNegativeFloat
@@ -18,6 +18,8 @@ from app.core.enums.toke_type import TokenType
 from app.schemas.external.token_payload import TokenPayload
 
 logger: logging.Logger = logging.getLogger(__name__)
+# Only the signing algorithm is accepted, never "none" or another one
+json_web_token: JsonWebToken = JsonWebToken([AuthSettings.ALGORITHM])
 
 
 def _generate_expiration_time(
@@ -84,9 +86,11 @@ def create_access_token(
 		payload = jsonable_encoder(token_payload)
 	header: dict[str, str] = {"alg": auth_settings.ALGORITHM}
 	try:
-		encoded_jwt: str = jwt.encode(header, payload, auth_settings.SECRET_KEY)
+		encoded_jwt: str = json_web_token.encode(
+			header, payload, auth_settings.SECRET_KEY
+		).decode()
 	except JoseError as exc:
-		logger.error(f"JWT encoding error: {exc}")
+		logger.error("JWT encoding error: %s", exc)
 		raise
 	logger.info("JWT created with JTI: %s", token_payload.jti)
 	return encoded_jwt
@@ -116,3 +120,30 @@ def create_refresh_token(
 		expires_delta=expires,
 	)
 	return token
+
+
+def decode_token(token: str, auth_settings: AuthSettings) -> dict[str, Any]:
+	"""
+	Decode a JWT signed with the configured algorithm and validate its
+	signature, issuer, audience and time claims
+
+	Args:
+		token (str): The encoded JWT
+		auth_settings (AuthSettings): The auth settings with the secret key
+
+	Returns:
+		dict[str, Any]: The claims of the token
+
+	Raises:
+		JoseError: If the token is invalid, expired or not meant for this API
+	"""
+	claims: JWTClaims = json_web_token.decode(
+		token,
+		auth_settings.SECRET_KEY,
+		claims_options={
+			"iss": {"essential": True, "value": str(auth_settings.SERVER_URL)},
+			"aud": {"essential": True, "value": str(auth_settings.AUDIENCE)},
+		},
+	)
+	claims.validate()
+	return dict(claims)
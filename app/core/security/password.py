@@ -3,11 +3,24 @@ This module handles password security functions such as hashing and
  verification.
 """
 
+import asyncio
 import logging
+import multiprocessing
+import os
+import secrets
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Any
 
 from passlib.context import CryptContext
+from pydantic import PositiveFloat, PositiveInt
 
-from app.exceptions.exceptions import SecurityException
+from app.config.auth_settings import AuthSettings
+from app.config.config import get_auth_settings
+from app.core.metrics import PASSWORD_HASH_DURATION, PASSWORD_HASH_REJECTED
+from app.exceptions.exceptions import SecurityException, ServiceException
 
 logger: logging.Logger = logging.getLogger(__name__)
 crypt_context: CryptContext = CryptContext(
@@ -63,3 +76,268 @@ def verify_password(hashed_password: str, plain_password: str) -> bool:
 	if not hashed_password:
 		_raise_custom_error("Hashed password cannot be empty or None")
 	return crypt_context.verify(plain_password, hashed_password)
+
+
+@lru_cache
+def _rounds_crypt_context(rounds: PositiveInt) -> CryptContext:
+	"""
+	Get a bcrypt context that flags any other cost factor for rehashing
+
+	Args:
+		rounds (PositiveInt): The bcrypt cost factor
+
+	Returns:
+		CryptContext: The crypt context of the worker process
+	"""
+	return CryptContext(
+		schemes=["bcrypt"],
+		deprecated="auto",
+		bcrypt__rounds=rounds,
+		bcrypt__min_rounds=rounds,
+		bcrypt__max_rounds=rounds,
+	)
+
+
+def _hash_in_worker(password: str, rounds: PositiveInt) -> str:
+	"""
+	Hash a password in a pool process
+
+	Args:
+		password (str): The password to hash
+		rounds (PositiveInt): The bcrypt cost factor
+
+	Returns:
+		str: The hashed password
+	"""
+	return str(_rounds_crypt_context(rounds).hash(password))
+
+
+def _verify_in_worker(
+	plain_password: str, hashed_password: str, rounds: PositiveInt
+) -> tuple[bool, str | None]:
+	"""
+	Verify a password in a pool process, rehashing it if outdated
+
+	Args:
+		plain_password (str): The plain text password
+		hashed_password (str): The stored hash
+		rounds (PositiveInt): The bcrypt cost factor
+
+	Returns:
+		tuple[bool, str | None]: Whether it matches, and the new hash when
+		the stored one used another cost factor
+	"""
+	valid, new_hash = _rounds_crypt_context(rounds).verify_and_update(
+		plain_password, hashed_password
+	)
+	return bool(valid), new_hash
+
+
+class PasswordHasher:
+	"""
+	Runs bcrypt on a process pool instead of the event loop.
+
+	Each call takes a slot first. When every slot stays busy for the queue
+	timeout, the call is rejected with 503, so a login storm cannot queue
+	up unbounded CPU work. The pool is only started on first use, in the
+	worker process, and its processes are spawned rather than forked.
+	"""
+
+	def __init__(
+		self,
+		workers: PositiveInt,
+		max_concurrency: PositiveInt,
+		queue_timeout: PositiveFloat,
+		rounds: PositiveInt,
+	):
+		self.workers: PositiveInt = workers
+		self.queue_timeout: PositiveFloat = queue_timeout
+		self.rounds: PositiveInt = rounds
+		self._slots: asyncio.Semaphore = asyncio.Semaphore(max_concurrency)
+		self._executor: ProcessPoolExecutor | None = None
+		self._dummy_hash: str | None = None
+
+	def _get_executor(self) -> ProcessPoolExecutor:
+		"""
+		Get the process pool, starting it on first use
+
+		Returns:
+			ProcessPoolExecutor: The process pool
+		"""
+		if self._executor is None:
+			self._executor = ProcessPoolExecutor(
+				max_workers=self.workers,
+				mp_context=multiprocessing.get_context("spawn"),
+			)
+		return self._executor
+
+	async def _run[T](
+		self, operation: str, function: Callable[..., T], *args: Any
+	) -> T:
+		"""
+		Run a bcrypt function on the pool within the concurrency limit
+
+		Args:
+			operation (str): The operation name for the metrics
+			function (Callable[..., T]): The module-level function to run
+			*args (Any): The arguments of the function
+
+		Returns:
+			T: The result of the function
+
+		Raises:
+			ServiceException: If no slot frees up within the queue timeout
+		"""
+		try:
+			async with asyncio.timeout(self.queue_timeout):
+				await self._slots.acquire()
+		except TimeoutError:
+			PASSWORD_HASH_REJECTED.inc()
+			raise ServiceException(
+				"Too many password operations, please retry later"
+			)
+		started_at: float = time.perf_counter()
+		try:
+			return await asyncio.get_running_loop().run_in_executor(
+				self._get_executor(), function, *args
+			)
+		finally:
+			self._slots.release()
+			PASSWORD_HASH_DURATION.labels(operation=operation).observe(
+				time.perf_counter() - started_at
+			)
+
+	async def hash(self, password: str) -> str:
+		"""
+		Hash a password
+
+		Args:
+			password (str): The password to hash
+
+		Returns:
+			str: The hashed password
+		"""
+		return await self._run("hash", _hash_in_worker, password, self.rounds)
+
+	async def verify(
+		self, hashed_password: str, plain_password: str
+	) -> tuple[bool, str | None]:
+		"""
+		Verify a password against its hash
+
+		Args:
+			hashed_password (str): The stored hash
+			plain_password (str): The plain text password
+
+		Returns:
+			tuple[bool, str | None]: Whether it matches, and the new hash to
+			store when the cost factor changed
+		"""
+		return await self._run(
+			"verify",
+			_verify_in_worker,
+			plain_password,
+			hashed_password,
+			self.rounds,
+		)
+
+	async def verify_dummy(self, plain_password: str) -> None:
+		"""
+		Verify a password against a hash no user has, so a login for an
+		unknown username costs as much as one with a wrong password
+
+		Args:
+			plain_password (str): The plain text password
+
+		Returns:
+			NoneType: None
+		"""
+		if self._dummy_hash is None:
+			self._dummy_hash = await self.hash(secrets.token_urlsafe())
+		await self.verify(self._dummy_hash, plain_password)
+
+	async def close(self) -> None:
+		"""
+		Stop the pool processes
+
+		Returns:
+			NoneType: None
+		"""
+		if self._executor is None:
+			return
+		await asyncio.to_thread(
+			self._executor.shutdown, wait=True, cancel_futures=True
+		)
+		self._executor = None
+
+
+@lru_cache
+def get_password_hasher() -> PasswordHasher:
+	"""
+	Get the password hasher of the worker process.
+
+	The pool defaults to one process per core available to the worker.
+
+	Returns:
+		PasswordHasher: The password hasher instance
+	"""
+	auth_settings: AuthSettings = get_auth_settings()
+	return PasswordHasher(
+		auth_settings.PASSWORD_HASH_WORKERS or os.process_cpu_count() or 1,
+		auth_settings.PASSWORD_HASH_MAX_CONCURRENCY,
+		auth_settings.PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS,
+		auth_settings.BCRYPT_ROUNDS,
+	)
+
+
+async def hash_password_async(password: str) -> str:
+	"""
+	Hash a password with bcrypt off the event loop
+
+	Args:
+		password (str): The password to hash
+
+	Returns:
+		str: The hashed password
+	"""
+	if not password:
+		_raise_custom_error("Password cannot be empty or None")
+	return await get_password_hasher().hash(password)
+
+
+async def verify_password_async(
+	hashed_password: str, plain_password: str
+) -> tuple[bool, str | None]:
+	"""
+	Verify a password off the event loop.
+
+	A hash made with another cost factor than BCRYPT_ROUNDS is rehashed
+	when the password matches, and the caller should store the new hash.
+
+	Args:
+		hashed_password (str): The stored hash
+		plain_password (str): The plain text password
+
+	Returns:
+		tuple[bool, str | None]: Whether the password matches, and the new
+		hash to store, if any
+	"""
+	if not plain_password:
+		_raise_custom_error("Plain password cannot be empty or None")
+	if not hashed_password:
+		_raise_custom_error("Hashed password cannot be empty or None")
+	return await get_password_hasher().verify(hashed_password, plain_password)
+
+
+async def verify_dummy_password_async(plain_password: str) -> None:
+	"""
+	Spend the time of a password verification when there is no user to
+	check, so the response time does not tell which usernames exist
+
+	Args:
+		plain_password (str): The plain text password
+
+	Returns:
+		NoneType: None
+	"""
+	await get_password_hasher().verify_dummy(plain_password)
@@ -0,0 +1,163 @@
+"""
+A module for refresh token store in the app.core.security package.
+"""
+
+import logging
+from collections.abc import Callable
+from functools import lru_cache
+from uuid import UUID
+
+from bmemcached import Client
+from bmemcached.exceptions import MemcachedException
+from pydantic import PositiveInt
+
+from app.config.config import get_auth_settings
+from app.core.deadline import run_within_deadline
+from app.core.memcached_dependency import (
+	get_memcached_client,
+	run_memcached,
+)
+from app.core.metrics import REFRESH_TOKEN_REUSE
+from app.core.request_timing import timing_span
+from app.exceptions.exceptions import ServiceException
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class RefreshTokenStore:
+	"""
+	Memcached record of the live refresh token of each login session.
+
+	A login opens a token family keyed by its session ID (sid) whose record
+	is the JTI of the only refresh token that may be used next. A refresh
+	swaps it for the JTI of the new token with compare-and-swap, so a token
+	that was already rotated, or two refreshes racing with the same token,
+	revoke the whole family. A failed store operation is a 503, since the
+	token cannot be checked without it.
+	"""
+
+	def __init__(self, client: Client, expire: PositiveInt):
+		self.client: Client = client
+		self.expire: PositiveInt = expire
+
+	@staticmethod
+	def _key(sid: UUID) -> str:
+		"""
+		Build the cache key of a token family
+
+		Args:
+			sid (UUID): The session ID of the family
+
+		Returns:
+			str: The namespaced cache key
+		"""
+		return f"refresh:{sid.hex}"
+
+	async def _run[T](self, operation: Callable[[], T]) -> T:
+		"""
+		Run a client operation off the event loop within the deadline
+
+		Args:
+			operation (Callable[[], T]): The client operation
+
+		Returns:
+			T: The result of the operation
+
+		Raises:
+			ServiceException: If the operation failed or timed out
+		"""
+		try:
+			with timing_span("cache"):
+				return await run_within_deadline(run_memcached(operation))
+		except (MemcachedException, OSError, TimeoutError) as exc:
+			logger.error("Refresh token store operation failed: %r", exc)
+			raise ServiceException("Session store unavailable") from exc
+
+	async def open(self, sid: UUID, jti: UUID) -> None:
+		"""
+		Start a token family with its first refresh token
+
+		Args:
+			sid (UUID): The session ID of the family
+			jti (UUID): The JTI of the refresh token
+
+		Returns:
+			NoneType: None
+		"""
+		await self._run(
+			lambda: self.client.set(self._key(sid), jti.hex, self.expire)
+		)
+
+	def _swap(self, sid: UUID, jti: UUID, next_jti: UUID) -> bool | None:
+		"""
+		Compare the live JTI of a family and swap it, holding the client
+
+		Args:
+			sid (UUID): The session ID of the family
+			jti (UUID): The JTI of the presented refresh token
+			next_jti (UUID): The JTI of the refresh token to issue
+
+		Returns:
+			bool | None: True if rotated, False if the token was reused and
+			the family revoked, None if the family does not exist
+		"""
+		key: str = self._key(sid)
+		live_jti: str | None
+		cas: int | None
+		live_jti, cas = self.client.gets(key)
+		if live_jti is None:
+			return None
+		if live_jti == jti.hex and self.client.cas(
+			key, next_jti.hex, cas, self.expire
+		):
+			return True
+		self.client.delete(key)
+		return False
+
+	async def rotate(self, sid: UUID, jti: UUID, next_jti: UUID) -> bool:
+		"""
+		Replace the live refresh token of a family with the next one
+
+		Args:
+			sid (UUID): The session ID of the family
+			jti (UUID): The JTI of the presented refresh token
+			next_jti (UUID): The JTI of the refresh token to issue
+
+		Returns:
+			bool: True if the presented token was the live one
+		"""
+		rotated: bool | None = await self._run(
+			lambda: self._swap(sid, jti, next_jti)
+		)
+		if rotated is False:
+			REFRESH_TOKEN_REUSE.inc()
+			logger.warning(
+				"Refresh token %s reused, revoked session %s", jti, sid
+			)
+		return bool(rotated)
+
+	async def revoke(self, sid: UUID) -> None:
+		"""
+		End a token family, so none of its refresh tokens work
+
+		Args:
+			sid (UUID): The session ID of the family
+
+		Returns:
+			NoneType: None
+		"""
+		await self._run(lambda: self.client.delete(self._key(sid)))
+
+
+@lru_cache
+def get_refresh_token_store() -> RefreshTokenStore:
+	"""
+	Get the process-wide refresh token store
+
+	Returns:
+		RefreshTokenStore: The refresh token store instance
+	"""
+	return RefreshTokenStore(
+		get_memcached_client(),
+		get_auth_settings().REFRESH_TOKEN_EXPIRE_MINUTES * 60,
+	)
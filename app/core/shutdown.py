@@ -0,0 +1,108 @@
+"""
+A module for shutdown in the app.core package.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import AsyncExitStack
+from functools import lru_cache
+
+from pydantic import PositiveFloat
+
+from app.config.config import get_settings
+from app.config.settings import Settings
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class ShutdownCoordinator:
+	"""
+	Coordinates the graceful shutdown of a worker.
+
+	The server drains the worker itself: on its stop signal it closes its
+	listeners and waits for the in-flight requests, so the coordinator is
+	only told to refuse the requests that still arrive on open connections.
+	Once the server is drained, the registered cleanup steps run in reverse
+	registration order. Resources are registered as they are opened at
+	startup, so consumers such as background queues are stopped before the
+	pools they depend on are disposed.
+	"""
+
+	def __init__(self, step_timeout: PositiveFloat):
+		self.step_timeout: PositiveFloat = step_timeout
+		self.draining: bool = False
+		self._stack: AsyncExitStack = AsyncExitStack()
+
+	def start_draining(self) -> None:
+		"""
+		Refuse new requests from now on, once the server is asked to stop
+
+		Returns:
+			NoneType: None
+		"""
+		if not self.draining:
+			logger.info("Draining, new requests are refused")
+		self.draining = True
+
+	def register(self, name: str, step: Callable[[], Awaitable[None]]) -> None:
+		"""
+		Register a cleanup step to run at shutdown
+
+		Args:
+			name (str): The step name used in the logs
+			step (Callable[[], Awaitable[None]]): The cleanup coroutine
+
+		Returns:
+			NoneType: None
+		"""
+		self._stack.push_async_callback(self._run_step, name, step)
+
+	async def _run_step(
+		self, name: str, step: Callable[[], Awaitable[None]]
+	) -> None:
+		"""
+		Run a cleanup step, isolating its failure from the next ones
+
+		Args:
+			name (str): The step name used in the logs
+			step (Callable[[], Awaitable[None]]): The cleanup coroutine
+
+		Returns:
+			NoneType: None
+		"""
+		started_at: float = time.perf_counter()
+		try:
+			async with asyncio.timeout(self.step_timeout):
+				await step()
+		except Exception as exc:
+			logger.error("Shutdown step %s failed: %r", name, exc)
+			return
+		logger.info(
+			"Shutdown step %s done in %.1f ms",
+			name,
+			(time.perf_counter() - started_at) * 1000,
+		)
+
+	async def shutdown(self) -> None:
+		"""
+		Refuse new requests and run the cleanup steps
+
+		Returns:
+			NoneType: None
+		"""
+		self.draining = True
+		await self._stack.aclose()
+
+
+@lru_cache
+def get_shutdown_coordinator() -> ShutdownCoordinator:
+	"""
+	Get the shutdown coordinator of the worker process
+
+	Returns:
+		ShutdownCoordinator: The process-wide shutdown coordinator
+	"""
+	settings: Settings = get_settings()
+	return ShutdownCoordinator(settings.SHUTDOWN_STEP_TIMEOUT_SECONDS)
@@ -0,0 +1,54 @@
+"""
+A module for startup profiler in the app.core package.
+"""
+
+import logging
+import time
+from collections.abc import Generator
+from contextlib import contextmanager
+
+from app.core.metrics import STARTUP_DURATION, STARTUP_PHASE_DURATION
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class StartupProfiler:
+	"""Records how long each lifespan phase of a worker takes"""
+
+	def __init__(self) -> None:
+		self.started_at: float = time.perf_counter()
+		self.phases: list[tuple[str, float]] = []
+
+	@contextmanager
+	def phase(self, name: str) -> Generator[None]:
+		"""
+		Time a startup phase
+
+		Args:
+			name (str): The phase name
+
+		Yields:
+			Generator[None]: Control to the phase body
+		"""
+		started_at: float = time.perf_counter()
+		try:
+			yield
+		finally:
+			elapsed: float = time.perf_counter() - started_at
+			self.phases.append((name, elapsed))
+			STARTUP_PHASE_DURATION.labels(phase=name).set(elapsed)
+
+	def report(self) -> float:
+		"""
+		Log the phase timings and export the total startup time
+
+		Returns:
+			float: The total startup time in seconds
+		"""
+		total: float = time.perf_counter() - self.started_at
+		STARTUP_DURATION.set(total)
+		breakdown: str = ", ".join(
+			f"{name}={elapsed * 1000:.1f}ms" for name, elapsed in self.phases
+		)
+		logger.info("Worker ready in %.1f ms (%s).", total * 1000, breakdown)
+		return total
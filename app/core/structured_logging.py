@@ -0,0 +1,238 @@
+"""
+A module for structured logging in the app.core package.
+"""
+
+import copy
+import logging
+import queue
+import sys
+import threading
+import time
+from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Final, TextIO
+
+import orjson
+from pydantic import PositiveFloat, PositiveInt
+
+from app.config.init_settings import InitSettings
+from app.config.settings import Settings
+from app.core.metrics import LOG_RECORDS_DROPPED
+
+JSON_LOG_FORMAT: Final[str] = "json"
+ACCESS_LOGGER: Final[str] = "app.access"
+# One record per request, sharing a template, that must not be sampled
+UNSAMPLED_LOGGERS: Final[frozenset[str]] = frozenset(
+	(ACCESS_LOGGER, "uvicorn.access")
+)
+# Uvicorn attaches its own blocking handlers to these loggers
+SERVER_LOGGERS: Final[tuple[str, ...]] = (
+	"uvicorn",
+	"uvicorn.error",
+	"uvicorn.access",
+)
+# Attributes of every record, anything else was passed through `extra`
+RECORD_ATTRIBUTES: Final[frozenset[str]] = frozenset(
+	(*vars(logging.makeLogRecord({})), "message", "asctime", "suppressed")
+)
+MAX_SAMPLED_MESSAGES: Final[int] = 1024
+
+
+class JSONFormatter(logging.Formatter):
+	"""Formatter that renders each record as a single JSON line"""
+
+	def format(self, record: logging.LogRecord) -> str:
+		payload: dict[str, Any] = {
+			"timestamp": datetime.fromtimestamp(record.created, UTC),
+			"level": record.levelname,
+			"logger": record.name,
+			"message": record.getMessage(),
+			"module": record.module,
+			"function": record.funcName,
+			"line": record.lineno,
+			"process": record.process,
+		}
+		payload.update(
+			(key, value)
+			for key, value in vars(record).items()
+			if key not in RECORD_ATTRIBUTES
+		)
+		if suppressed := getattr(record, "suppressed", None):
+			payload["suppressed"] = suppressed
+		if record.exc_info:
+			payload["exception"] = self.formatException(record.exc_info)
+		if record.stack_info:
+			payload["stack"] = self.formatStack(record.stack_info)
+		return orjson.dumps(payload, default=repr).decode()
+
+
+class TextFormatter(logging.Formatter):
+	"""Formatter for a logging format string that notes suppressed records"""
+
+	def format(self, record: logging.LogRecord) -> str:
+		text: str = super().format(record)
+		if suppressed := getattr(record, "suppressed", None):
+			text = f"{text} ({suppressed} similar suppressed)"
+		return text
+
+
+class SamplingFilter(logging.Filter):
+	"""
+	Rate limit for repetitive records below the error level.
+
+	Records sharing a logger, level and message template pass up to the
+	burst in each window, the rest are dropped. The first record of the next
+	window carries how many were suppressed. The access logs are never
+	sampled.
+	"""
+
+	def __init__(self, window: PositiveFloat, burst: PositiveInt):
+		super().__init__()
+		self.window: PositiveFloat = window
+		self.burst: PositiveInt = burst
+		self._windows: dict[tuple[str, int, str], list[float]] = {}
+		self._lock: threading.Lock = threading.Lock()
+
+	def _prune(self, now: float) -> None:
+		"""
+		Forget the expired windows once too many templates are tracked
+
+		Args:
+			now (float): The current monotonic time
+
+		Returns:
+			NoneType: None
+		"""
+		if len(self._windows) < MAX_SAMPLED_MESSAGES:
+			return
+		self._windows = {
+			key: window
+			for key, window in self._windows.items()
+			if now - window[0] < self.window
+		}
+		if len(self._windows) >= MAX_SAMPLED_MESSAGES:
+			self._windows.clear()
+
+	def filter(self, record: logging.LogRecord) -> bool:
+		if record.levelno >= logging.ERROR or record.name in UNSAMPLED_LOGGERS:
+			return True
+		key: tuple[str, int, str] = (
+			record.name,
+			record.levelno,
+			record.msg if isinstance(record.msg, str) else repr(record.msg),
+		)
+		now: float = time.monotonic()
+		with self._lock:
+			window: list[float] | None = self._windows.get(key)
+			if window is None or now - window[0] >= self.window:
+				if window is not None and window[1] > self.burst:
+					record.suppressed = int(window[1] - self.burst)
+				self._prune(now)
+				self._windows[key] = [now, 1]
+				return True
+			window[1] += 1
+			if window[1] <= self.burst:
+				return True
+		LOG_RECORDS_DROPPED.labels(reason="sampled").inc()
+		return False
+
+
+class NonBlockingQueueHandler(QueueHandler):
+	"""
+	Queue handler that leaves the formatting to the listener thread.
+
+	Only the message is merged with its arguments on the calling thread,
+	tracebacks and the output format are rendered by the listener. Records
+	are dropped and counted when the queue is full instead of blocking.
+	"""
+
+	def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+		record = copy.copy(record)
+		record.message = record.getMessage()
+		record.msg = record.message
+		record.args = None
+		return record
+
+	def enqueue(self, record: logging.LogRecord) -> None:
+		try:
+			self.queue.put_nowait(record)
+		except queue.Full:
+			LOG_RECORDS_DROPPED.labels(reason="queue_full").inc()
+
+
+def build_formatter(init_settings: InitSettings) -> logging.Formatter:
+	"""
+	Build the output formatter from the configured log format
+
+	Args:
+		init_settings (InitSettings): The init settings with LOG_FORMAT,
+		either "json" or a logging format string
+
+	Returns:
+		logging.Formatter: The formatter for the output handler
+	"""
+	if init_settings.LOG_FORMAT == JSON_LOG_FORMAT:
+		return JSONFormatter()
+	return TextFormatter(
+		init_settings.LOG_FORMAT, init_settings.DATETIME_FORMAT
+	)
+
+
+def configure_logging(
+	settings: Settings,
+	init_settings: InitSettings,
+	stream: TextIO = sys.stdout,
+) -> QueueListener:
+	"""
+	Route every log record through a queue to a background writer thread.
+
+	Call it in each worker process, after forking, since the listener thread
+	does not survive a fork.
+
+	Args:
+		settings (Settings): The settings with the level and sampling limits
+		init_settings (InitSettings): The init settings with the log format
+		stream (TextIO): The stream to write to. Default to sys.stdout
+
+	Returns:
+		QueueListener: The started listener, to stop at shutdown
+	"""
+	output_handler: logging.StreamHandler[TextIO] = logging.StreamHandler(
+		stream
+	)
+	output_handler.setFormatter(build_formatter(init_settings))
+	log_queue: queue.Queue[logging.LogRecord] = queue.Queue(
+		settings.LOG_QUEUE_SIZE
+	)
+	queue_handler: NonBlockingQueueHandler = NonBlockingQueueHandler(log_queue)
+	queue_handler.addFilter(
+		SamplingFilter(
+			settings.LOG_SAMPLING_WINDOW_SECONDS, settings.LOG_SAMPLING_BURST
+		)
+	)
+	root_logger: logging.Logger = logging.getLogger()
+	root_logger.handlers = [queue_handler]
+	root_logger.setLevel(settings.SERVER_LOG_LEVEL.upper())
+	for name in SERVER_LOGGERS:
+		server_logger: logging.Logger = logging.getLogger(name)
+		server_logger.handlers.clear()
+		server_logger.propagate = True
+	listener: QueueListener = QueueListener(
+		log_queue, output_handler, respect_handler_level=True
+	)
+	listener.start()
+	return listener
+
+
+def stop_logging(listener: QueueListener) -> None:
+	"""
+	Flush the queued records and write the next ones directly
+
+	Args:
+		listener (QueueListener): The listener returned at configuration
+
+	Returns:
+		NoneType: None
+	"""
+	listener.stop()
+	logging.getLogger().handlers = list(listener.handlers)
@@ -0,0 +1,86 @@
+"""
+A module for TTL cache in the app.core package.
+"""
+
+import time
+from collections import OrderedDict
+
+from pydantic import PositiveInt
+
+
+class TTLCache[K, V]:
+	"""
+	In-process LRU cache whose entries expire at a given Unix time.
+
+	Each worker keeps its own copy, so it only suits values that may be
+	stale for as long as they live. Expired entries are dropped when they
+	are looked up, and the least recently used one when the cache is full.
+	It is only used from the event loop thread, so it takes no lock.
+	"""
+
+	def __init__(self, maxsize: PositiveInt):
+		self.maxsize: PositiveInt = maxsize
+		self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+	def __len__(self) -> int:
+		return len(self._entries)
+
+	def get(self, key: K) -> V | None:
+		"""
+		Look up a live entry and mark it as recently used
+
+		Args:
+			key (K): The entry key
+
+		Returns:
+			V | None: The cached value, or None if missing or expired
+		"""
+		entry: tuple[float, V] | None = self._entries.get(key)
+		if entry is None:
+			return None
+		expires_at, value = entry
+		if expires_at <= time.time():
+			del self._entries[key]
+			return None
+		self._entries.move_to_end(key)
+		return value
+
+	def set(self, key: K, value: V, expires_at: float) -> None:
+		"""
+		Store an entry until the given time
+
+		Args:
+			key (K): The entry key
+			value (V): The value to cache
+			expires_at (float): The Unix time the entry expires at
+
+		Returns:
+			NoneType: None
+		"""
+		if expires_at <= time.time():
+			return
+		self._entries[key] = (expires_at, value)
+		self._entries.move_to_end(key)
+		if len(self._entries) > self.maxsize:
+			self._entries.popitem(last=False)
+
+	def pop(self, key: K) -> None:
+		"""
+		Drop an entry if present
+
+		Args:
+			key (K): The entry key
+
+		Returns:
+			NoneType: None
+		"""
+		self._entries.pop(key, None)
+
+	def clear(self) -> None:
+		"""
+		Drop every entry
+
+		Returns:
+			NoneType: None
+		"""
+		self._entries.clear()
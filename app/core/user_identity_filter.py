@@ -0,0 +1,176 @@
+"""
+A module for user identity filter in the app.core package.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any
+
+from pydantic import PositiveFloat, PositiveInt
+from sqlalchemy import ColumnElement
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.config.config import get_settings
+from app.config.settings import Settings
+from app.core.bloom_filter import BloomFilter
+from app.db.session import AsyncSessionLocal
+from app.models.structured.user import User
+from app.repositories.structured.user_repository import UserRepository
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class UserIdentityFilter:
+	"""
+	Bloom filters of the registered usernames and emails of the worker.
+
+	A name missing from the filter is free, so it is answered without a
+	query; only possible matches are confirmed on the database. The users
+	table is streamed in on start, then users created since the last load
+	are added on the refresh interval. Users created by this worker are
+	added at once, those of other workers within one interval. Until the
+	first load ends every name is a possible match.
+	"""
+
+	def __init__(
+		self,
+		capacity: PositiveInt,
+		error_rate: PositiveFloat,
+		refresh_interval: PositiveFloat,
+		chunk_size: PositiveInt,
+	):
+		self.refresh_interval: PositiveFloat = refresh_interval
+		self.chunk_size: PositiveInt = chunk_size
+		self.usernames: BloomFilter = BloomFilter(capacity, error_rate)
+		self.emails: BloomFilter = BloomFilter(capacity, error_rate)
+		self.ready: bool = False
+		self._loaded_until: datetime | None = None
+		self._task: asyncio.Task[None] | None = None
+
+	def add(self, username: str, email: str) -> None:
+		"""
+		Record a registered user
+
+		Args:
+			username (str): The username of the user
+			email (str): The email of the user
+
+		Returns:
+			NoneType: None
+		"""
+		self.usernames.add(username)
+		self.emails.add(email)
+
+	def might_have_username(self, username: str) -> bool:
+		"""
+		Check whether a username may be registered
+
+		Args:
+			username (str): The username
+
+		Returns:
+			bool: False only if the username is certainly free
+		"""
+		return not self.ready or username in self.usernames
+
+	def might_have_email(self, email: str) -> bool:
+		"""
+		Check whether an email may be registered
+
+		Args:
+			email (str): The email
+
+		Returns:
+			bool: False only if the email is certainly free
+		"""
+		return not self.ready or email in self.emails
+
+	async def load(self) -> int:
+		"""
+		Add the users created since the last load, or all on the first one
+
+		Returns:
+			int: The number of users read
+		"""
+		criteria: list[ColumnElement[bool]] = []
+		if self._loaded_until is not None:
+			# Overlap the previous load for transactions that committed late
+			criteria.append(
+				User.created_at
+				>= self._loaded_until - timedelta(seconds=self.refresh_interval)
+			)
+		count: int = 0
+		loaded_until: datetime | None = self._loaded_until
+		async with AsyncSessionLocal() as session:
+			rows: list[dict[str, Any]]
+			async for rows in UserRepository(session).stream_rows(
+				("username", "email", "created_at"),
+				*criteria,
+				chunk_size=self.chunk_size,
+			):
+				for row in rows:
+					self.add(row["username"], row["email"])
+					if loaded_until is None or row["created_at"] > loaded_until:
+						loaded_until = row["created_at"]
+				count += len(rows)
+		self._loaded_until = loaded_until
+		return count
+
+	async def _run(self) -> None:
+		"""
+		Load the users table, then the new users forever on the interval
+
+		Returns:
+			NoneType: None
+		"""
+		while True:
+			try:
+				count: int = await self.load()
+			except (SQLAlchemyError, OSError) as exc:
+				logger.warning("User identity filter load failed: %r", exc)
+			else:
+				if not self.ready:
+					logger.info("User identity filter loaded %d users", count)
+				self.ready = True
+			await asyncio.sleep(self.refresh_interval)
+
+	def start(self) -> None:
+		"""
+		Start loading in the background
+
+		Returns:
+			NoneType: None
+		"""
+		self._task = asyncio.create_task(self._run(), name="user-filter")
+
+	async def stop(self) -> None:
+		"""
+		Stop loading
+
+		Returns:
+			NoneType: None
+		"""
+		if self._task is None:
+			return
+		self._task.cancel()
+		await asyncio.gather(self._task, return_exceptions=True)
+		self._task = None
+
+
+@lru_cache
+def get_user_identity_filter() -> UserIdentityFilter:
+	"""
+	Get the user identity filter of the worker
+
+	Returns:
+		UserIdentityFilter: The user identity filter instance
+	"""
+	settings: Settings = get_settings()
+	return UserIdentityFilter(
+		settings.USER_FILTER_CAPACITY,
+		settings.USER_FILTER_ERROR_RATE,
+		settings.USER_FILTER_REFRESH_SECONDS,
+		settings.USER_FILTER_CHUNK_SIZE,
+	)
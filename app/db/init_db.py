@@ -4,28 +4,29 @@ Initialization of the database (PostgreSQL) script
 
 import logging
 
+from app.config.config import get_sql_db_settings
+from app.db.migrations.runner import apply_migrations, check_schema_version
 from app.db.session import async_engine
-from app.models.base_class import Base
 
 logger: logging.Logger = logging.getLogger(__name__)
 
 
 async def init_db() -> None:
 	"""
-	Initializes the database by dropping all tables and creating them again.
+	Verify the database schema before the worker accepts traffic.
 
-	This is typically used for development or testing environments only.
+	Migrations are applied by a separate deploy step. Set
+	MIGRATE_ON_STARTUP to apply them from the worker instead, which is
+	safe with several workers thanks to the migration advisory lock.
 
 	Returns:
 		NoneType: None
 	"""
 	try:
-		async with async_engine.begin() as conn:
-			logger.info("Dropping all tables...")
-			await conn.run_sync(Base.metadata.drop_all)
-			logger.info("Creating all tables...")
-			await conn.run_sync(Base.metadata.create_all)
-		logger.info("Database initialized successfully.")
+		if get_sql_db_settings().MIGRATE_ON_STARTUP:
+			await apply_migrations(async_engine)
+		version: int = await check_schema_version(async_engine)
+		logger.info("Database schema verified at version %s.", version)
 	except Exception as e:
 		logger.exception("Error initializing the database: %s", e)
 		raise
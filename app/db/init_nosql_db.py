@@ -3,6 +3,7 @@ A module for init NoSQL db in the app.db package.
 """
 
 from collections.abc import Mapping
+from functools import lru_cache
 from typing import Any
 
 from beanie import init_beanie
@@ -11,10 +12,16 @@ from pymongo import AsyncMongoClient
 from app.config.config import get_nosql_db_settings
 from app.models.unstructured import MLModelResult, ProductReview
 
-url: str = str(get_nosql_db_settings.BEANIE_DATABASE_URI)
-async_mongo_client: AsyncMongoClient[Mapping[str, Any] | Any] = (
-	AsyncMongoClient(url)
-)
+
+@lru_cache
+def get_mongo_client() -> AsyncMongoClient[Mapping[str, Any] | Any]:
+	"""
+	Get the process-wide MongoDB client, created on first use
+
+	Returns:
+		AsyncMongoClient[Mapping[str, Any] | Any]: The MongoDB client
+	"""
+	return AsyncMongoClient(str(get_nosql_db_settings().BEANIE_DATABASE_URI))
 
 
 async def init_nosql_db() -> None:
@@ -25,16 +32,28 @@ async def init_nosql_db() -> None:
 		NoneType: None
 	"""
 	await init_beanie(
-		database=async_mongo_client.db_name,
+		database=get_mongo_client()[get_nosql_db_settings().MONGODB_DB],
 		document_models=[ProductReview, MLModelResult],
 	)
 
 
 async def close_db() -> None:
 	"""
-	Close connection to MongoDB
+	Close connection to MongoDB if it was ever opened
+
+	Returns:
+		NoneType: None
+	"""
+	if get_mongo_client.cache_info().currsize:
+		await get_mongo_client().close()
+		get_mongo_client.cache_clear()
+
+
+async def ping_nosql_db() -> None:
+	"""
+	Check that MongoDB answers
 
 	Returns:
 		NoneType: None
 	"""
-	await async_mongo_client.close()
+	await get_mongo_client().admin.command("ping")
@@ -0,0 +1,3 @@
+"""
+Package app.db.migrations initialization.
+"""
@@ -0,0 +1,33 @@
+"""
+Apply the pending database migrations.
+
+Run it once per deploy, before the workers start, with:
+	python -m app.db.migrations
+"""
+
+import asyncio
+import logging
+
+from app.db.migrations.runner import apply_migrations
+from app.db.session import async_engine
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+async def main() -> None:
+	"""
+	Apply the migrations and release the engine
+
+	Returns:
+		NoneType: None
+	"""
+	try:
+		version: int = await apply_migrations(async_engine)
+		logger.info("Database schema at version %s", version)
+	finally:
+		await async_engine.dispose()
+
+
+if __name__ == "__main__":
+	logging.basicConfig(level=logging.INFO)
+	asyncio.run(main())
@@ -0,0 +1,287 @@
+"""
+A module for baseline in the app.db.migrations package.
+
+A frozen copy of the tables as they were at schema version 1. The models
+keep evolving through later migrations, so this snapshot must never be
+edited to follow them.
+"""
+
+from sqlalchemy import (
+	Boolean,
+	CheckConstraint,
+	Column,
+	Date,
+	Float,
+	ForeignKey,
+	Integer,
+	MetaData,
+	String,
+	Table,
+	Text,
+	text,
+)
+from sqlalchemy.dialects.postgresql import ENUM, TIMESTAMP, UUID
+
+baseline_metadata: MetaData = MetaData()
+
+Table(
+	"products",
+	baseline_metadata,
+	Column(
+		"id",
+		UUID(),
+		nullable=False,
+		primary_key=True,
+		index=True,
+		unique=True,
+		server_default=text("(gen_random_uuid())"),
+		comment="ID of the Product",
+	),
+	Column(
+		"name",
+		String(100),
+		nullable=False,
+		index=True,
+		comment="Name of the product",
+	),
+	Column(
+		"description",
+		Text,
+		nullable=True,
+		comment="Detailed description of the product",
+	),
+	Column(
+		"price",
+		Float,
+		nullable=False,
+		comment="Selling price of the product",
+	),
+	Column(
+		"stock",
+		Integer,
+		nullable=False,
+		server_default=text("0"),
+		comment="Available stock units of the product",
+	),
+	Column(
+		"category",
+		String(50),
+		nullable=True,
+		comment="Optional category label for grouping similar products",
+	),
+	Column(
+		"is_active",
+		Boolean,
+		nullable=False,
+		server_default=text("true"),
+		comment="True if the product is visible and active in the store",
+	),
+	Column(
+		"created_at",
+		TIMESTAMP(timezone=True),
+		nullable=False,
+		server_default=text("now()"),
+		comment="Timestamp when the product was created",
+	),
+	Column(
+		"updated_at",
+		TIMESTAMP(timezone=True),
+		nullable=True,
+		comment="Timestamp of the last update to the product details",
+	),
+	CheckConstraint("price >= 0", name="products_price_positive"),
+	CheckConstraint("stock >= 0", name="products_stock_positive"),
+)
+
+Table(
+	"users",
+	baseline_metadata,
+	Column(
+		"id",
+		UUID(),
+		nullable=False,
+		primary_key=True,
+		index=True,
+		unique=True,
+		server_default=text("(gen_random_uuid())"),
+		comment="ID of the User",
+	),
+	Column(
+		"username",
+		String(15),
+		nullable=False,
+		index=True,
+		unique=True,
+		comment="Unique username used for login and identification",
+	),
+	Column(
+		"email",
+		String(320),
+		nullable=False,
+		index=True,
+		unique=True,
+		comment="User's email address, used for contact and authentication",
+	),
+	Column(
+		"first_name",
+		String(50),
+		nullable=False,
+		comment="User's first name(s)",
+	),
+	Column(
+		"last_name",
+		String(100),
+		nullable=False,
+		comment="User's last name(s)",
+	),
+	Column(
+		"password",
+		String(60),
+		nullable=False,
+		comment="User's password (hashed)",
+	),
+	Column(
+		"gender",
+		ENUM("MALE", "FEMALE", "OTHER", name="gender"),
+		nullable=True,
+		comment="User's gender (optional)",
+	),
+	Column(
+		"birthdate",
+		Date,
+		nullable=True,
+		comment="User's date of birth (optional)",
+	),
+	Column(
+		"phone_number",
+		String(20),
+		nullable=True,
+		comment="User's contact phone number (optional)",
+	),
+	Column(
+		"is_active",
+		Boolean(),
+		nullable=False,
+		server_default=text("true"),
+		comment="Indicates whether the user account is active",
+	),
+	Column(
+		"is_superuser",
+		Boolean(),
+		nullable=False,
+		server_default=text("false"),
+		comment="True if the user has superuser privileges",
+	),
+	Column(
+		"created_at",
+		TIMESTAMP(timezone=True),
+		nullable=False,
+		server_default=text("now()"),
+		comment="Timestamp when the user was created",
+	),
+	Column(
+		"updated_at",
+		TIMESTAMP(timezone=True),
+		nullable=True,
+		comment="Timestamp when the user was last updated",
+	),
+	CheckConstraint("char_length(username) >= 4", name="users_username_length"),
+	CheckConstraint("char_length(email) >= 3", name="users_email_length"),
+	CheckConstraint("char_length(password) = 60", name="users_password_length"),
+	CheckConstraint(
+		"email ~* '^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\\.[A-Z|a-z]{2,}$'",
+		name="users_email_format",
+	),
+	CheckConstraint(
+		"char_length(first_name) >= 1", name="users_first_name_length"
+	),
+	CheckConstraint(
+		"char_length(last_name) >= 1", name="users_last_name_length"
+	),
+	CheckConstraint(
+		"phone_number ~ '^tel:\\+\\d{3}-\\d{2}-\\d{3}-\\d{4}$'",
+		name="users_phone_number_format",
+	),
+)
+
+Table(
+	"orders",
+	baseline_metadata,
+	Column(
+		"id",
+		UUID(),
+		nullable=False,
+		primary_key=True,
+		index=True,
+		unique=True,
+		server_default=text("(gen_random_uuid())"),
+		comment="ID of the Order",
+	),
+	Column(
+		"user_id",
+		UUID(),
+		ForeignKey("users.id", ondelete="CASCADE"),
+		nullable=False,
+		comment="Foreign key referencing the ID of the User who placed the order",
+	),
+	Column(
+		"total_amount",
+		Float,
+		nullable=False,
+		comment="Total cost of all products in the order",
+	),
+	Column(
+		"created_at",
+		TIMESTAMP(timezone=True),
+		nullable=False,
+		server_default=text("now()"),
+		comment="Timestamp when the order was placed",
+	),
+	CheckConstraint("total_amount >= 0", name="order_total_amount_positive"),
+)
+
+Table(
+	"order_items",
+	baseline_metadata,
+	Column(
+		"id",
+		UUID(),
+		nullable=False,
+		primary_key=True,
+		index=True,
+		unique=True,
+		server_default=text("(gen_random_uuid())"),
+		comment="ID of the Order Item",
+	),
+	Column(
+		"order_id",
+		UUID(),
+		ForeignKey("orders.id", ondelete="CASCADE"),
+		nullable=False,
+		comment="Foreign key to the related order",
+	),
+	Column(
+		"product_id",
+		UUID(),
+		ForeignKey("products.id", ondelete="CASCADE"),
+		nullable=False,
+		comment="Foreign key to the ordered product",
+	),
+	Column(
+		"quantity",
+		Integer,
+		nullable=False,
+		comment="Number of product units in the order item",
+	),
+	Column(
+		"price_at_purchase",
+		Float,
+		nullable=False,
+		comment="Unit price of the product at the time of the order",
+	),
+	CheckConstraint("quantity > 0", name="order_item_quantity_positive"),
+	CheckConstraint(
+		"price_at_purchase >= 0",
+		name="order_item_price_at_purchase_positive",
+	),
+)
@@ -0,0 +1,156 @@
+"""
+A module for runner in the app.db.migrations package.
+"""
+
+import logging
+from typing import Final
+
+from sqlalchemy import (
+	Column,
+	DateTime,
+	Integer,
+	MetaData,
+	String,
+	Table,
+	func,
+	insert,
+	select,
+	text,
+)
+from sqlalchemy.exc import ProgrammingError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from app.db.migrations.versions import MIGRATIONS, Migration
+from app.exceptions.exceptions import SchemaVersionException
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+MIGRATION_LOCK_KEY: Final[int] = 7_320_418_155
+LATEST_VERSION: Final[int] = max(migration.version for migration in MIGRATIONS)
+
+schema_version_table: Table = Table(
+	"schema_version",
+	MetaData(),
+	Column("version", Integer, primary_key=True),
+	Column("description", String(200), nullable=False),
+	Column(
+		"applied_at",
+		DateTime(timezone=True),
+		server_default=func.now(),
+		nullable=False,
+	),
+)
+
+
+async def _get_current_version(connection: AsyncConnection) -> int:
+	"""
+	Read the highest applied schema version
+
+	Args:
+		connection (AsyncConnection): The database connection
+
+	Returns:
+		int: The current version, or 0 on an empty schema_version table
+	"""
+	version: int | None = await connection.scalar(
+		select(func.max(schema_version_table.c.version))
+	)
+	return version or 0
+
+
+async def apply_migrations(engine: AsyncEngine) -> int:
+	"""
+	Apply every pending migration under a Postgres advisory lock.
+
+	Concurrent callers wait on the lock, then find nothing left to apply,
+	so several workers or deploy jobs can run this safely at once.
+
+	Args:
+		engine (AsyncEngine): The database engine
+
+	Returns:
+		int: The schema version after the migrations
+	"""
+	async with engine.connect() as connection:
+		await connection.execute(
+			text("SELECT pg_advisory_lock(:key)"), {"key": MIGRATION_LOCK_KEY}
+		)
+		await connection.commit()
+		try:
+			async with connection.begin():
+				await connection.run_sync(
+					schema_version_table.create, checkfirst=True
+				)
+				current_version: int = await _get_current_version(connection)
+			pending: list[Migration] = sorted(
+				(
+					migration
+					for migration in MIGRATIONS
+					if migration.version > current_version
+				),
+				key=lambda migration: migration.version,
+			)
+			if not pending:
+				logger.info(
+					"Schema is up to date at version %s", current_version
+				)
+			for migration in pending:
+				async with connection.begin():
+					await migration.apply(connection)
+					await connection.execute(
+						insert(schema_version_table).values(
+							version=migration.version,
+							description=migration.description,
+						)
+					)
+				current_version = migration.version
+				logger.info(
+					"Applied migration %s: %s",
+					migration.version,
+					migration.description,
+				)
+			return current_version
+		finally:
+			await connection.execute(
+				text("SELECT pg_advisory_unlock(:key)"),
+				{"key": MIGRATION_LOCK_KEY},
+			)
+			await connection.commit()
+
+
+async def check_schema_version(engine: AsyncEngine) -> int:
+	"""
+	Check that the database schema is at the version this code expects.
+
+	This is a single indexed read, cheap enough for every worker start.
+
+	Args:
+		engine (AsyncEngine): The database engine
+
+	Returns:
+		int: The current schema version
+
+	Raises:
+		SchemaVersionException: If migrations are missing or the database
+		is ahead of this code
+	"""
+	try:
+		async with engine.connect() as connection:
+			current_version: int = await _get_current_version(connection)
+	except ProgrammingError as exc:
+		raise SchemaVersionException(
+			"Database has no schema_version table",
+			"Run the migrations with: python -m app.db.migrations",
+		) from exc
+	if current_version < LATEST_VERSION:
+		raise SchemaVersionException(
+			f"Database schema is at version {current_version}, expected"
+			f" {LATEST_VERSION}",
+			"Run the migrations with: python -m app.db.migrations",
+		)
+	if current_version > LATEST_VERSION:
+		raise SchemaVersionException(
+			f"Database schema version {current_version} is newer than"
+			f" {LATEST_VERSION} supported by this release"
+		)
+	return current_version
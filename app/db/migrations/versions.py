@@ -0,0 +1,46 @@
+"""
+A module for versions in the app.db.migrations package.
+"""
+
+from collections.abc import Awaitable, Callable
+
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.db.migrations.baseline import baseline_metadata
+
+
+class Migration:
+	"""A versioned schema change applied once, in its own transaction"""
+
+	def __init__(
+		self,
+		version: int,
+		description: str,
+		apply: Callable[[AsyncConnection], Awaitable[None]],
+	):
+		self.version: int = version
+		self.description: str = description
+		self.apply: Callable[[AsyncConnection], Awaitable[None]] = apply
+
+
+async def create_baseline_schema(connection: AsyncConnection) -> None:
+	"""
+	Create the tables of the version 1 snapshot that do not exist yet.
+
+	Existing databases are adopted as they are, since tables are only
+	created when missing. The snapshot is frozen rather than read from the
+	models, so later schema changes must be added as explicit migrations.
+
+	Args:
+		connection (AsyncConnection): The connection in the migration
+		transaction
+
+	Returns:
+		NoneType: None
+	"""
+	await connection.run_sync(baseline_metadata.create_all)
+
+
+MIGRATIONS: tuple[Migration, ...] = (
+	Migration(1, "Baseline schema", create_baseline_schema),
+)
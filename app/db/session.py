@@ -3,9 +3,12 @@ Database session script
 """
 
 import logging
+import time
 from collections.abc import AsyncGenerator
+from typing import Any, Final
 
-from sqlalchemy import text
+from sqlalchemy import Connection, TextClause, event, text
+from sqlalchemy.engine import ExceptionContext
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import (
 	AsyncEngine,
@@ -13,20 +16,31 @@ from sqlalchemy.ext.asyncio import (
 	async_sessionmaker,
 	create_async_engine,
 )
+from sqlalchemy.orm import Session
 
 from app.config.config import get_sql_db_settings
+from app.config.sql_db_settings import SQLDBSettings
+from app.core.deadline import remaining_seconds
+from app.core.request_timing import record_span
 
 logger: logging.Logger = logging.getLogger(__name__)
 
-url: str = f"{get_sql_db_settings().DATABASE_URL}"
+QUERY_STARTS_KEY: Final[str] = "query_starts"
+# One statement text for every timeout, so it is prepared once per connection
+SET_STATEMENT_TIMEOUT: Final[TextClause] = text(
+	"SELECT set_config('statement_timeout', :timeout, true)"
+)
+
+sql_db_settings: SQLDBSettings = get_sql_db_settings()
+url: str = f"{sql_db_settings.DATABASE_URL}"
 
 async_engine: AsyncEngine = create_async_engine(
 	url,
 	pool_pre_ping=True,
 	future=True,
-	echo=True,
-	pool_size=10,
-	max_overflow=20,
+	echo=sql_db_settings.SQL_ECHO,
+	pool_size=sql_db_settings.POOL_SIZE,
+	max_overflow=sql_db_settings.POOL_MAX_OVERFLOW,
 )
 
 AsyncSessionLocal = async_sessionmaker(
@@ -37,6 +51,102 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 
+@event.listens_for(Session, "after_begin")
+def apply_statement_timeout(
+	session: Session,  # noqa: ARG001
+	transaction: Any,  # noqa: ARG001
+	connection: Connection,
+) -> None:
+	"""
+	Bound the statements of a new transaction by the request deadline.
+
+	Args:
+		session (Session): The session that began the transaction
+		transaction (Any): The session transaction
+		connection (Connection): The connection the transaction runs on
+
+	Returns:
+		NoneType: None
+	"""
+	remaining: float | None = remaining_seconds()
+	if remaining is None:
+		return
+	timeout_ms: int = max(int(remaining * 1000), 1)
+	connection.execute(SET_STATEMENT_TIMEOUT, {"timeout": str(timeout_ms)})
+
+
+@event.listens_for(async_engine.sync_engine, "before_cursor_execute")
+def start_query_timer(
+	connection: Connection,
+	cursor: Any,  # noqa: ARG001
+	statement: str,  # noqa: ARG001
+	parameters: Any,  # noqa: ARG001
+	context: Any,  # noqa: ARG001
+	executemany: bool,  # noqa: ARG001
+) -> None:
+	"""
+	Note when a statement starts, for the db span of the request.
+
+	Args:
+		connection (Connection): The connection running the statement
+		cursor (Any): The DBAPI cursor
+		statement (str): The SQL statement
+		parameters (Any): The statement parameters
+		context (Any): The execution context
+		executemany (bool): Whether it runs with several parameter sets
+
+	Returns:
+		NoneType: None
+	"""
+	connection.info.setdefault(QUERY_STARTS_KEY, []).append(time.perf_counter())
+
+
+@event.listens_for(async_engine.sync_engine, "after_cursor_execute")
+def stop_query_timer(
+	connection: Connection,
+	cursor: Any,  # noqa: ARG001
+	statement: str,  # noqa: ARG001
+	parameters: Any,  # noqa: ARG001
+	context: Any,  # noqa: ARG001
+	executemany: bool,  # noqa: ARG001
+) -> None:
+	"""
+	Add the duration of a statement to the db span of the request.
+
+	Args:
+		connection (Connection): The connection that ran the statement
+		cursor (Any): The DBAPI cursor
+		statement (str): The SQL statement
+		parameters (Any): The statement parameters
+		context (Any): The execution context
+		executemany (bool): Whether it ran with several parameter sets
+
+	Returns:
+		NoneType: None
+	"""
+	record_span(
+		"db", time.perf_counter() - connection.info[QUERY_STARTS_KEY].pop()
+	)
+
+
+@event.listens_for(async_engine.sync_engine, "handle_error")
+def discard_query_timer(context: ExceptionContext) -> None:
+	"""
+	Account for a failed statement, which never reaches after_cursor_execute.
+
+	Args:
+		context (ExceptionContext): The context of the error
+
+	Returns:
+		NoneType: None
+	"""
+	if context.connection is None:
+		return
+	starts: list[float] = context.connection.info.get(QUERY_STARTS_KEY, [])
+	if starts:
+		record_span("db", time.perf_counter() - starts.pop())
+
+
 async def get_session() -> AsyncGenerator[AsyncSession]:
 	"""
 	Yield an asynchronous session to the database.
@@ -76,3 +186,17 @@ async def check_db_health(session: AsyncSession) -> bool:
 	except SQLAlchemyError as e:
 		logger.error("Database connection error: %s", e)
 		return False
+
+
+async def ping_db() -> None:
+	"""
+	Check that PostgreSQL answers on a pooled connection.
+
+	Returns:
+		NoneType: None
+
+	Raises:
+		SQLAlchemyError: If the database cannot be reached.
+	"""
+	async with async_engine.connect() as connection:
+		await connection.execute(text("SELECT 1"))
@@ -0,0 +1,111 @@
+"""
+A module for warmup in the app.db package.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from contextlib import AsyncExitStack
+from typing import Any, Final
+from uuid import UUID
+
+from pydantic import PositiveInt
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+
+from app.repositories.structured.order_item_repository import (
+	OrderItemRepository,
+)
+from app.repositories.structured.order_repository import OrderRepository
+from app.repositories.structured.product_repository import ProductRepository
+from app.repositories.structured.user_repository import UserRepository
+from app.schemas.product import ProductResponse
+from app.schemas.user import UserResponse
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+NIL_UUID: Final[UUID] = UUID(int=0)
+
+# The statements behind the hot endpoints, run with parameters that match no
+# row. asyncpg caches a prepared statement per connection and SQL string, so
+# the first real request on each connection skips the prepare round trip.
+HOT_QUERIES: Final[tuple[Callable[[AsyncSession], Awaitable[Any]], ...]] = (
+	lambda session: ProductRepository(session).get(NIL_UUID),
+	lambda session: ProductRepository(session).get_by_name(""),
+	lambda session: ProductRepository(session).fetch_rows_by_ids(
+		tuple(ProductResponse.model_fields), []
+	),
+	lambda session: UserRepository(session).get(NIL_UUID),
+	lambda session: UserRepository(session).fetch_rows_by_ids(
+		tuple(UserResponse.model_fields), []
+	),
+	lambda session: OrderRepository(session).get(NIL_UUID),
+	lambda session: OrderRepository(session).get_by_user_id(NIL_UUID),
+	lambda session: OrderItemRepository(session).get(NIL_UUID),
+	lambda session: OrderItemRepository(session).get_items_for_order_id(
+		NIL_UUID
+	),
+)
+
+
+async def prime_connection(connection: AsyncConnection) -> None:
+	"""
+	Prepare the hot queries on a pooled connection
+
+	Args:
+		connection (AsyncConnection): The connection to prime
+
+	Returns:
+		NoneType: None
+	"""
+	async with AsyncSession(bind=connection) as session:
+		for query in HOT_QUERIES:
+			await query(session)
+		await session.rollback()
+
+
+async def warm_up_pool(engine: AsyncEngine, size: PositiveInt) -> int:
+	"""
+	Open and prime pool connections concurrently before serving traffic.
+
+	All the connections are held at the same time so the pool creates
+	distinct ones, then they are returned to the pool ready to use.
+
+	Args:
+		engine (AsyncEngine): The database engine
+		size (PositiveInt): The number of connections to open
+
+	Returns:
+		int: The number of connections opened and primed
+	"""
+	started_at: float = time.perf_counter()
+	async with AsyncExitStack() as stack:
+		results: list[AsyncConnection | BaseException] = await asyncio.gather(
+			*(stack.enter_async_context(engine.connect()) for _ in range(size)),
+			return_exceptions=True,
+		)
+		connections: list[AsyncConnection] = [
+			result for result in results if isinstance(result, AsyncConnection)
+		]
+		primed: list[None | BaseException] = await asyncio.gather(
+			*(prime_connection(connection) for connection in connections),
+			return_exceptions=True,
+		)
+	errors: list[BaseException] = [
+		error
+		for error in (*results, *primed)
+		if isinstance(error, BaseException)
+	]
+	if errors:
+		logger.warning(
+			"Pool warm-up had %s failures, first: %r", len(errors), errors[0]
+		)
+	warmed: int = primed.count(None)
+	logger.info(
+		"Warmed %s/%s pool connections with %s queries in %.1f ms",
+		warmed,
+		size,
+		len(HOT_QUERIES),
+		(time.perf_counter() - started_at) * 1000,
+	)
+	return warmed
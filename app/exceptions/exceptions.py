@@ -23,3 +23,34 @@ class SecurityException(HTTPException):
 		)
 		if note:
 			self.add_note(note)
+
+
+class SchemaVersionException(Exception):
+	"""Database Schema Version Exception class"""
+
+	def __init__(self, message: str, note: str | None = None):
+		super().__init__(message)
+		if note:
+			self.add_note(note)
+
+
+class InvalidTokenError(Exception):
+	"""Invalid, expired or wrongly scoped JWT Exception class"""
+
+	def __init__(self, message: str, note: str | None = None):
+		super().__init__(message)
+		if note:
+			self.add_note(note)
+
+
+class EmailDeliveryError(Exception):
+	"""Email Delivery Exception class"""
+
+	def __init__(
+		self, message: str, note: str | None = None, transient: bool = True
+	):
+		super().__init__(message)
+		# Whether a retry may succeed, unlike a rejection of the messages
+		self.transient: bool = transient
+		if note:
+			self.add_note(note)
@@ -0,0 +1,120 @@
+"""
+A module for admission control in the app.middlewares package.
+"""
+
+import asyncio
+import logging
+from collections.abc import Sequence
+
+import orjson
+from fastapi import status
+from pydantic import NonNegativeInt, PositiveFloat, PositiveInt
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.metrics import (
+	ADMISSION_IN_FLIGHT,
+	ADMISSION_QUEUE_DEPTH,
+	ADMISSION_SHED_TOTAL,
+)
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class AdmissionControlMiddleware:
+	"""
+	ASGI middleware that bounds the requests processed at the same time.
+
+	Requests beyond the in-flight limit wait in a bounded queue until a slot
+	frees up or the queue timeout expires. When the queue is full or the
+	wait times out, the request is shed right away with 503 and Retry-After
+	instead of piling up on the event loop. Bypass paths are never queued.
+	"""
+
+	def __init__(
+		self,
+		app: ASGIApp,
+		max_in_flight: PositiveInt,
+		max_queue: NonNegativeInt,
+		queue_timeout: PositiveFloat,
+		retry_after: PositiveInt,
+		bypass_paths: Sequence[str] = (),
+	) -> None:
+		self.app: ASGIApp = app
+		self.max_queue: NonNegativeInt = max_queue
+		self.queue_timeout: PositiveFloat = queue_timeout
+		self.retry_after: PositiveInt = retry_after
+		self.bypass_paths: tuple[str, ...] = tuple(bypass_paths)
+		self._slots: asyncio.Semaphore = asyncio.Semaphore(max_in_flight)
+		self._waiting: NonNegativeInt = 0
+
+	async def _acquire(self) -> bool:
+		"""
+		Wait for a free slot within the queue bounds
+
+		Returns:
+			bool: True if the request was admitted, False if it must be shed
+		"""
+		if not self._slots.locked():
+			await self._slots.acquire()
+			return True
+		if self._waiting >= self.max_queue:
+			ADMISSION_SHED_TOTAL.labels(reason="queue_full").inc()
+			return False
+		self._waiting += 1
+		ADMISSION_QUEUE_DEPTH.inc()
+		try:
+			async with asyncio.timeout(self.queue_timeout):
+				await self._slots.acquire()
+			return True
+		except TimeoutError:
+			ADMISSION_SHED_TOTAL.labels(reason="timeout").inc()
+			return False
+		finally:
+			self._waiting -= 1
+			ADMISSION_QUEUE_DEPTH.dec()
+
+	async def _shed(self, scope: Scope, send: Send) -> None:
+		"""
+		Reject the request with 503 Service Unavailable
+
+		Args:
+			scope (Scope): The ASGI scope of the request
+			send (Send): The ASGI send callable
+
+		Returns:
+			NoneType: None
+		"""
+		logger.warning("Request shed by admission control: %s", scope["path"])
+		body: bytes = orjson.dumps(
+			{"detail": "Server is overloaded, please retry later"}
+		)
+		await send(
+			{
+				"type": "http.response.start",
+				"status": status.HTTP_503_SERVICE_UNAVAILABLE,
+				"headers": [
+					(b"content-type", b"application/json"),
+					(b"content-length", str(len(body)).encode()),
+					(b"retry-after", str(self.retry_after).encode()),
+				],
+			}
+		)
+		await send({"type": "http.response.body", "body": body})
+
+	async def __call__(
+		self, scope: Scope, receive: Receive, send: Send
+	) -> None:
+		if scope["type"] != "http" or scope["path"].startswith(
+			self.bypass_paths
+		):
+			await self.app(scope, receive, send)
+			return
+		if not await self._acquire():
+			await self._shed(scope, send)
+			return
+		ADMISSION_IN_FLIGHT.inc()
+		try:
+			await self.app(scope, receive, send)
+		finally:
+			ADMISSION_IN_FLIGHT.dec()
+			self._slots.release()
@@ -0,0 +1,119 @@
+"""
+A module for metrics in the app.middlewares package.
+"""
+
+import time
+from typing import Final
+
+from prometheus_client import Counter, Gauge, Histogram
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import (
+	HTTP_REQUESTS_IN_FLIGHT,
+	HTTP_REQUESTS_TOTAL,
+	HTTP_REQUEST_DURATION,
+)
+
+UNMATCHED_ROUTE: Final[str] = "unmatched"
+OTHER_METHOD: Final[str] = "OTHER"
+# Any other method is reported as OTHER to bound the label values
+METHODS: Final[frozenset[str]] = frozenset(
+	{"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"}
+)
+
+
+def route_template(scope: Scope) -> str:
+	"""
+	Get the template of the route that handled a request.
+
+	Raw paths hold IDs, so labelling by template keeps the number of series
+	bounded by the number of routes.
+
+	Args:
+		scope (Scope): The ASGI scope after routing
+
+	Returns:
+		str: The route template, such as /api/v1/user/{user_id}
+	"""
+	if route := scope.get("route"):
+		return str(route.path_format)
+	if "endpoint" in scope and "app_root_path" in scope:
+		mount_path: str = scope["root_path"].removeprefix(
+			scope["app_root_path"]
+		)
+		return f"{mount_path}/{{path}}"
+	return UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+	"""
+	ASGI middleware that records the Prometheus request metrics.
+
+	It counts the requests in flight by method, and the completed requests
+	and their latency by method, route template and status class. The
+	labelled children are cached, so a request costs a dictionary lookup
+	and the metric updates.
+	"""
+
+	def __init__(self, app: ASGIApp) -> None:
+		self.app: ASGIApp = app
+		self._children: dict[
+			tuple[str, str, str], tuple[Counter, Histogram]
+		] = {}
+
+	def _observe(
+		self, method: str, route: str, status_code: int, duration: float
+	) -> None:
+		"""
+		Record a completed request
+
+		Args:
+			method (str): The HTTP method
+			route (str): The route template
+			status_code (int): The response status code
+			duration (float): The request latency in seconds
+
+		Returns:
+			NoneType: None
+		"""
+		key: tuple[str, str, str] = (method, route, f"{status_code // 100}xx")
+		children: tuple[Counter, Histogram] | None = self._children.get(key)
+		if children is None:
+			children = (
+				HTTP_REQUESTS_TOTAL.labels(*key),
+				HTTP_REQUEST_DURATION.labels(*key),
+			)
+			self._children[key] = children
+		children[0].inc()
+		children[1].observe(duration)
+
+	async def __call__(
+		self, scope: Scope, receive: Receive, send: Send
+	) -> None:
+		if scope["type"] != "http":
+			await self.app(scope, receive, send)
+			return
+		method: str = (
+			scope["method"] if scope["method"] in METHODS else OTHER_METHOD
+		)
+		status_code: int = 500
+
+		async def send_with_status(message: Message) -> None:
+			nonlocal status_code
+			if message["type"] == "http.response.start":
+				status_code = message["status"]
+			await send(message)
+
+		in_flight: Gauge = HTTP_REQUESTS_IN_FLIGHT.labels(method)
+		in_flight.inc()
+		started_at: float = time.perf_counter()
+		try:
+			await self.app(scope, receive, send_with_status)
+		finally:
+			in_flight.dec()
+			self._observe(
+				method,
+				route_template(scope),
+				status_code,
+				time.perf_counter() - started_at,
+			)
@@ -0,0 +1,219 @@
+"""
+A module for profiling in the app.middlewares package.
+"""
+
+import asyncio
+import logging
+
+import orjson
+from fastapi import status
+from pydantic import PositiveFloat, PositiveInt
+from sqlalchemy.exc import SQLAlchemyError
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config.config import get_auth_settings
+from app.core.enums.toke_type import TokenType
+from app.core.profiling import verify_profile_request
+from app.core.security.authentication import (
+	load_user,
+	user_id_from_sub,
+	verify_token,
+)
+from app.db.session import AsyncSessionLocal
+from app.exceptions.exceptions import InvalidTokenError
+from app.schemas.external.token_payload import TokenPayload
+from app.schemas.user import UserResponse
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+def _header(scope: Scope, name: bytes) -> str | None:
+	"""
+	Get a request header from the ASGI scope
+
+	Args:
+		scope (Scope): The ASGI scope of the request
+		name (bytes): The lowercase header name
+
+	Returns:
+		str | None: The header value, or None if it is missing
+	"""
+	for key, value in scope["headers"]:
+		if key == name:
+			return str(value.decode("latin-1"))
+	return None
+
+
+class ProfilingMiddleware:
+	"""
+	ASGI middleware that profiles a request on demand.
+
+	Requests without an X-Profile header go straight through. With a valid
+	signed header and the bearer token of a superuser, the request runs
+	under pyinstrument and the client gets the profile instead of the
+	response: HTML when it accepts text/html, speedscope JSON otherwise.
+	One request is profiled at a time.
+	"""
+
+	def __init__(
+		self,
+		app: ASGIApp,
+		secret_key: str,
+		max_validity: PositiveInt,
+		interval: PositiveFloat,
+	) -> None:
+		self.app: ASGIApp = app
+		self.secret_key: str = secret_key
+		self.max_validity: PositiveInt = max_validity
+		self.interval: PositiveFloat = interval
+		self._lock: asyncio.Lock = asyncio.Lock()
+
+	async def _is_superuser(self, scope: Scope) -> bool:
+		"""
+		Check the bearer token of the request belongs to a superuser
+
+		Args:
+			scope (Scope): The ASGI scope of the request
+
+		Returns:
+			bool: True if the token is valid and its user is a superuser
+		"""
+		authorization: str | None = _header(scope, b"authorization")
+		if not authorization or not authorization.startswith("Bearer "):
+			return False
+		try:
+			payload: TokenPayload = verify_token(
+				authorization.removeprefix("Bearer "),
+				get_auth_settings(),
+				TokenType.ACCESS_TOKEN,
+			)
+			async with AsyncSessionLocal() as session:
+				user: UserResponse | None = await load_user(
+					user_id_from_sub(payload.sub), session
+				)
+		except (InvalidTokenError, ValueError, SQLAlchemyError) as exc:
+			logger.warning("Profiling authorization failed: %r", exc)
+			return False
+		return user is not None and user.is_active and user.is_superuser
+
+	async def _reply(
+		self,
+		send: Send,
+		status_code: int,
+		body: bytes,
+		media_type: str = "application/json",
+		headers: list[tuple[bytes, bytes]] | None = None,
+	) -> None:
+		"""
+		Send a complete response
+
+		Args:
+			send (Send): The ASGI send callable
+			status_code (int): The response status code
+			body (bytes): The response body
+			media_type (str): The content type. Default to application/json
+			headers (list[tuple[bytes, bytes]] | None): Extra headers.
+			Default to None
+
+		Returns:
+			NoneType: None
+		"""
+		await send(
+			{
+				"type": "http.response.start",
+				"status": status_code,
+				"headers": [
+					(b"content-type", media_type.encode()),
+					(b"content-length", str(len(body)).encode()),
+					(b"cache-control", b"no-store"),
+					*(headers or []),
+				],
+			}
+		)
+		await send({"type": "http.response.body", "body": body})
+
+	async def _profile(
+		self, scope: Scope, receive: Receive, send: Send
+	) -> None:
+		"""
+		Run the request under the profiler and send the profile back
+
+		Args:
+			scope (Scope): The ASGI scope of the request
+			receive (Receive): The ASGI receive callable
+			send (Send): The ASGI send callable
+
+		Returns:
+			NoneType: None
+		"""
+		# Only imported when a request is actually profiled
+		from pyinstrument import Profiler
+		from pyinstrument.renderers import SpeedscopeRenderer
+
+		status_code: int = 500
+
+		async def discard(message: Message) -> None:
+			nonlocal status_code
+			if message["type"] == "http.response.start":
+				status_code = message["status"]
+
+		profiler: Profiler = Profiler(
+			interval=self.interval, async_mode="enabled"
+		)
+		profiler.start()
+		try:
+			await self.app(scope, receive, discard)
+		finally:
+			profiler.stop()
+		logger.info("Profiled %s %s", scope["method"], scope["path"])
+		extra_headers: list[tuple[bytes, bytes]] = [
+			(b"x-profiled-status", str(status_code).encode())
+		]
+		if "text/html" in (_header(scope, b"accept") or ""):
+			await self._reply(
+				send,
+				status.HTTP_200_OK,
+				profiler.output_html().encode(),
+				"text/html; charset=utf-8",
+				extra_headers,
+			)
+			return
+		await self._reply(
+			send,
+			status.HTTP_200_OK,
+			profiler.output(SpeedscopeRenderer()).encode(),
+			headers=extra_headers,
+		)
+
+	async def __call__(
+		self, scope: Scope, receive: Receive, send: Send
+	) -> None:
+		if scope["type"] != "http":
+			await self.app(scope, receive, send)
+			return
+		profile_header: str | None = _header(scope, b"x-profile")
+		if profile_header is None:
+			await self.app(scope, receive, send)
+			return
+		if not verify_profile_request(
+			self.secret_key,
+			profile_header,
+			scope["method"],
+			scope["path"],
+			self.max_validity,
+		) or not await self._is_superuser(scope):
+			await self._reply(
+				send,
+				status.HTTP_403_FORBIDDEN,
+				orjson.dumps({"detail": "Profiling is not allowed"}),
+			)
+			return
+		if self._lock.locked():
+			await self._reply(
+				send,
+				status.HTTP_409_CONFLICT,
+				orjson.dumps({"detail": "Another request is being profiled"}),
+			)
+			return
+		async with self._lock:
+			await self._profile(scope, receive, send)
@@ -189,9 +189,9 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
 				"data:",
 				"'unsafe-inline'",
 			]
-			logger.info("Applying Swagger UI specific CSP with dynamic nonce")
+			logger.debug("Applying Swagger UI specific CSP with dynamic nonce")
 		else:
 			csp_options = self.default_csp_options
-			logger.info("Applying default CSP")
+			logger.debug("Applying default CSP")
 		self._add_security_headers(response, max_age, csp_options, ct_max_age)
 		return response
@@ -0,0 +1,93 @@
+"""
+A module for server timing in the app.middlewares package.
+"""
+
+import logging
+import re
+from contextvars import Token
+from typing import Final
+from uuid import uuid4
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.request_timing import RequestTiming, request_timing
+from app.core.structured_logging import ACCESS_LOGGER
+
+access_logger: logging.Logger = logging.getLogger(ACCESS_LOGGER)
+
+REQUEST_ID_HEADER: Final[str] = "X-Request-ID"
+# Incoming IDs are echoed in headers and logs, so only safe ones are kept
+REQUEST_ID_PATTERN: Final[re.Pattern[str]] = re.compile(r"[\w.:-]{1,128}")
+
+
+def resolve_request_id(scope: Scope) -> str:
+	"""
+	Reuse the request ID sent by a proxy, or generate a new one
+
+	Args:
+		scope (Scope): The ASGI scope of the request
+
+	Returns:
+		str: The request ID
+	"""
+	for name, value in scope["headers"]:
+		if name == b"x-request-id":
+			request_id: str = value.decode("latin-1")
+			if REQUEST_ID_PATTERN.fullmatch(request_id):
+				return request_id
+			break
+	return uuid4().hex
+
+
+class ServerTimingMiddleware:
+	"""
+	ASGI middleware that reports where each request spent its time.
+
+	It publishes a RequestTiming through a context variable, which the
+	database, cache and serializers record their spans into. The response
+	carries them in a Server-Timing header along with an X-Request-ID, and
+	the access log, when enabled, holds the same breakdown.
+	"""
+
+	def __init__(self, app: ASGIApp, access_log: bool = False) -> None:
+		self.app: ASGIApp = app
+		self.access_log: bool = access_log
+
+	async def __call__(
+		self, scope: Scope, receive: Receive, send: Send
+	) -> None:
+		if scope["type"] != "http":
+			await self.app(scope, receive, send)
+			return
+		timing: RequestTiming = RequestTiming(resolve_request_id(scope))
+		token: Token[RequestTiming | None] = request_timing.set(timing)
+		status_code: int = 500
+
+		async def send_with_timing(message: Message) -> None:
+			nonlocal status_code
+			if message["type"] == "http.response.start":
+				status_code = message["status"]
+				headers: MutableHeaders = MutableHeaders(scope=message)
+				headers.append("Server-Timing", timing.server_timing())
+				headers.append(REQUEST_ID_HEADER, timing.request_id)
+			await send(message)
+
+		try:
+			await self.app(scope, receive, send_with_timing)
+		finally:
+			request_timing.reset(token)
+			if self.access_log:
+				access_logger.info(
+					"%s %s %s",
+					scope["method"],
+					scope["path"],
+					status_code,
+					extra={
+						"request_id": timing.request_id,
+						"method": scope["method"],
+						"path": scope["path"],
+						"status": status_code,
+						"timings_ms": timing.milliseconds(),
+					},
+				)
@@ -0,0 +1,60 @@
+"""
+A module for shutdown in the app.middlewares package.
+"""
+
+import orjson
+from fastapi import status
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.shutdown import ShutdownCoordinator
+
+
+class ShutdownMiddleware:
+	"""
+	ASGI middleware that refuses requests once the worker is draining.
+
+	The server stops accepting connections on its stop signal, but a
+	request can still arrive on a kept-alive connection before it is
+	closed. Such a request is refused with 503 and Connection: close, so
+	the client retries on another worker while the in-flight requests
+	complete.
+	"""
+
+	def __init__(self, app: ASGIApp, coordinator: ShutdownCoordinator) -> None:
+		self.app: ASGIApp = app
+		self.coordinator: ShutdownCoordinator = coordinator
+
+	async def _refuse(self, send: Send) -> None:
+		"""
+		Reject the request with 503 Service Unavailable
+
+		Args:
+			send (Send): The ASGI send callable
+
+		Returns:
+			NoneType: None
+		"""
+		body: bytes = orjson.dumps({"detail": "Server is shutting down"})
+		await send(
+			{
+				"type": "http.response.start",
+				"status": status.HTTP_503_SERVICE_UNAVAILABLE,
+				"headers": [
+					(b"content-type", b"application/json"),
+					(b"content-length", str(len(body)).encode()),
+					(b"connection", b"close"),
+				],
+			}
+		)
+		await send({"type": "http.response.body", "body": body})
+
+	async def __call__(
+		self, scope: Scope, receive: Receive, send: Send
+	) -> None:
+		if scope["type"] != "http":
+			await self.app(scope, receive, send)
+			return
+		if self.coordinator.draining:
+			await self._refuse(send)
+			return
+		await self.app(scope, receive, send)
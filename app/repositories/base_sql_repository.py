@@ -4,11 +4,24 @@ Base repository implementation module in app.repositories.
 Provides reusable async CRUD operations for SQLAlchemy ORM models.
 """
 
+from collections.abc import AsyncIterator, Sequence
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import Result, Select, select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import (
+	BindParameter,
+	ColumnElement,
+	Result,
+	Select,
+	Table,
+	any_,
+	bindparam,
+	select,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncResult, AsyncSession
+from sqlalchemy.orm import load_only
 
 from app.core.interfaces.repository_interface import IRepository, T
 
@@ -33,17 +46,39 @@ class BaseRepository(IRepository[T]):
 		self.model: type[T] = model
 		self.session: AsyncSession = session
 
-	async def get(self, _id: UUID) -> T | None:
+	def _select(self, fields: Sequence[str] | None = None) -> Select[Any]:
+		"""
+		Build a select for the model, optionally narrowed to some columns.
+
+		Args:
+			fields (Sequence[str] | None): The attributes to load. Default
+			to None, which loads every column.
+
+		Returns:
+			Select[Any]: The select statement.
+		"""
+		stmt: Select[Any] = select(self.model)
+		if fields:
+			stmt = stmt.options(
+				load_only(*[getattr(self.model, name) for name in fields])
+			)
+		return stmt
+
+	async def get(
+		self, _id: UUID, fields: Sequence[str] | None = None
+	) -> T | None:
 		"""
 		Retrieve an object by its primary key.
 
 		Args:
 			_id (UUID): The primary key of the object.
+			fields (Sequence[str] | None): The attributes to load. Default
+			to None, which loads every column.
 
 		Returns:
 			T | None: The object if found, otherwise None.
 		"""
-		stmt: Select = select(self.model).where(self.model.id == _id)  # type: ignore
+		stmt: Select = self._select(fields).where(self.model.id == _id)  # type: ignore
 		result: Result = await self.session.execute(stmt)
 		return result.scalar_one_or_none()
 
@@ -58,6 +93,94 @@ class BaseRepository(IRepository[T]):
 		result: Result[tuple[Any]] = await self.session.execute(stmt)
 		return list(result.scalars().all())
 
+	async def fetch_rows(
+		self, columns: Sequence[str], *criteria: ColumnElement[bool]
+	) -> list[dict[str, Any]]:
+		"""
+		Retrieve plain rows through a Core select on explicit columns.
+
+		The statement runs on the session's connection, so no ORM objects
+		are built and nothing is added to the identity map. The mappings
+		can be handed straight to the JSON encoder.
+
+		Args:
+			columns (Sequence[str]): The column names to select.
+			*criteria (ColumnElement[bool]): Optional WHERE clauses.
+
+		Returns:
+			list[dict[str, Any]]: A list of mappings keyed by column name.
+		"""
+		table: Table = self.model.__table__  # type: ignore
+		stmt: Select[Any] = select(*[table.c[name] for name in columns]).where(
+			*criteria
+		)
+		connection: AsyncConnection = await self.session.connection()
+		result: Result[Any] = await connection.execute(stmt)
+		return [dict(row) for row in result.mappings()]
+
+	async def stream_rows(
+		self,
+		columns: Sequence[str],
+		*criteria: ColumnElement[bool],
+		chunk_size: int = 1000,
+		order_by: Sequence[str] = (),
+	) -> AsyncIterator[list[dict[str, Any]]]:
+		"""
+		Stream plain rows in chunks through a server-side cursor.
+
+		Only one chunk is held in memory at a time, so the whole table can
+		be read. The cursor stays open on the session's connection until
+		the iteration ends.
+
+		Args:
+			columns (Sequence[str]): The column names to select.
+			*criteria (ColumnElement[bool]): Optional WHERE clauses.
+			chunk_size (int): The rows fetched per round trip. Default
+			to 1000.
+			order_by (Sequence[str]): The column names to sort by. Default
+			to no ordering.
+
+		Yields:
+			AsyncIterator[list[dict[str, Any]]]: Lists of mappings keyed
+			by column name.
+		"""
+		table: Table = self.model.__table__  # type: ignore
+		stmt: Select[Any] = (
+			select(*[table.c[name] for name in columns])
+			.where(*criteria)
+			.order_by(*[table.c[name] for name in order_by])
+			.execution_options(yield_per=chunk_size)
+		)
+		connection: AsyncConnection = await self.session.connection()
+		result: AsyncResult[Any] = await connection.stream(stmt)
+		async for partition in result.mappings().partitions():
+			yield [dict(row) for row in partition]
+
+	async def fetch_rows_by_ids(
+		self, columns: Sequence[str], ids: Sequence[UUID]
+	) -> list[dict[str, Any]]:
+		"""
+		Retrieve plain rows for several primary keys in a single query.
+
+		The IDs are bound as one array parameter (`id = ANY(:ids)`), so the
+		statement text is the same for any number of IDs.
+
+		Args:
+			columns (Sequence[str]): The column names to select.
+			ids (Sequence[UUID]): The primary keys to look up.
+
+		Returns:
+			list[dict[str, Any]]: The rows found, in no particular order.
+		"""
+		ids_type: ARRAY[UUID] = ARRAY(PG_UUID(as_uuid=True))
+		ids_param: BindParameter[Sequence[UUID]] = bindparam(
+			"ids", value=list(ids), type_=ids_type
+		)
+		return await self.fetch_rows(
+			columns,
+			self.model.id == any_(ids_param),  # type: ignore
+		)
+
 	async def create(self, obj: T) -> T:
 		"""
 		Insert a new object into the database.
@@ -2,6 +2,8 @@
 Provides CRUD operations for the OrderItem model.
 """
 
+from collections.abc import Sequence
+
 from pydantic import UUID4
 from sqlalchemy import Result, Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -22,17 +24,21 @@ class OrderItemRepository(BaseRepository[OrderItem]):
 		"""
 		super().__init__(OrderItem, session)
 
-	async def get(self, _id: UUID4) -> OrderItem | None:
+	async def get(
+		self, _id: UUID4, fields: Sequence[str] | None = None
+	) -> OrderItem | None:
 		"""
 		Retrieve an Order Item by their UUID4.
 
 		Args:
 			_id (UUID4): The Order Item's UUID.
+			fields (Sequence[str] | None): The attributes to load. Default
+			to None, which loads every column.
 
 		Returns:
 			Order Item | None: The Order Item instance or None if not found.
 		"""
-		return await super().get(_id)
+		return await super().get(_id, fields)
 
 	async def delete(self, _id: UUID4) -> bool:
 		"""
@@ -2,6 +2,7 @@
 Provides CRUD operations for the Order model.
 """
 
+from collections.abc import Sequence
 from uuid import UUID
 
 from fastapi import HTTPException, status
@@ -26,17 +27,21 @@ class OrderRepository(BaseRepository[Order]):
 		"""
 		super().__init__(Order, session)
 
-	async def get(self, _id: UUID4) -> Order | None:
+	async def get(
+		self, _id: UUID4, fields: Sequence[str] | None = None
+	) -> Order | None:
 		"""
 		Retrieve an Order by their UUID4.
 
 		Args:
 			_id (UUID4): The Order's UUID.
+			fields (Sequence[str] | None): The attributes to load. Default
+			to None, which loads every column.
 
 		Returns:
 			Order | None: The Order instance or None if not found.
 		"""
-		return await super().get(_id)
+		return await super().get(_id, fields)
 
 	async def delete(self, _id: UUID4) -> bool:
 		"""
@@ -2,8 +2,10 @@
 Provides CRUD operations for the Product model.
 """
 
+from collections.abc import Sequence
+
 from pydantic import UUID4
-from sqlalchemy import CursorResult, Executable, Result, Select, select, update
+from sqlalchemy import CursorResult, Executable, Result, Select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.structured.product import Product
@@ -22,17 +24,21 @@ class ProductRepository(BaseRepository[Product]):
 		"""
 		super().__init__(Product, session)
 
-	async def get(self, _id: UUID4) -> Product | None:
+	async def get(
+		self, _id: UUID4, fields: Sequence[str] | None = None
+	) -> Product | None:
 		"""
 		Retrieve a Product by their UUID4.
 
 		Args:
 			_id (UUID4): The Product's UUID.
+			fields (Sequence[str] | None): The attributes to load. Default
+			to None, which loads every column.
 
 		Returns:
 			Product | None: The Product instance or None if not found.
 		"""
-		return await super().get(_id)
+		return await super().get(_id, fields)
 
 	async def delete(self, _id: UUID4) -> bool:
 		"""
@@ -46,17 +52,21 @@ class ProductRepository(BaseRepository[Product]):
 		"""
 		return await super().delete(_id)
 
-	async def get_by_name(self, name: str) -> Product | None:
+	async def get_by_name(
+		self, name: str, fields: Sequence[str] | None = None
+	) -> Product | None:
 		"""
 		Retrieve a product by its name.
 
 		Args:
 			name (str): The name of the product.
+			fields (Sequence[str] | None): The attributes to load. Default
+			to None, which loads every column.
 
 		Returns:
 			Product | None: The product if found, otherwise None.
 		"""
-		stmt: Select = select(self.model).where(self.model.name == name)
+		stmt: Select = self._select(fields).where(self.model.name == name)
 		result: Result = await self.session.execute(stmt)
 		return result.scalar_one_or_none()
 
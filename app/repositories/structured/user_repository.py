@@ -2,8 +2,10 @@
 Provides CRUD operations for the User model.
 """
 
+from collections.abc import Sequence
+
 from pydantic import UUID4
-from sqlalchemy import Result, Select, select
+from sqlalchemy import Result, Select, exists, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.structured.user import User
@@ -22,17 +24,21 @@ class UserRepository(BaseRepository[User]):
 		"""
 		super().__init__(User, session)
 
-	async def get(self, _id: UUID4) -> User | None:
+	async def get(
+		self, _id: UUID4, fields: Sequence[str] | None = None
+	) -> User | None:
 		"""
 		Retrieve a User by their UUID4.
 
 		Args:
 			_id (UUID4): The User's UUID.
+			fields (Sequence[str] | None): The attributes to load. Default
+			to None, which loads every column.
 
 		Returns:
 			User | None: The User instance or None if not found.
 		"""
-		return await super().get(_id)
+		return await super().get(_id, fields)
 
 	async def delete(self, _id: UUID4) -> bool:
 		"""
@@ -59,3 +65,35 @@ class UserRepository(BaseRepository[User]):
 		stmt: Select = select(self.model).where(self.model.username == username)
 		result: Result = await self.session.execute(stmt)
 		return result.scalar_one_or_none()
+
+	async def username_exists(self, username: str) -> bool:
+		"""
+		Check whether a username is registered.
+
+		Args:
+			username (str): The username.
+
+		Returns:
+			bool: True if a user has the username.
+		"""
+		stmt: Select[tuple[bool]] = select(
+			exists().where(self.model.username == username)
+		)
+		result: Result[tuple[bool]] = await self.session.execute(stmt)
+		return bool(result.scalar())
+
+	async def email_exists(self, email: str) -> bool:
+		"""
+		Check whether an email is registered.
+
+		Args:
+			email (str): The email.
+
+		Returns:
+			bool: True if a user has the email.
+		"""
+		stmt: Select[tuple[bool]] = select(
+			exists().where(self.model.email == email)
+		)
+		result: Result[tuple[bool]] = await self.session.execute(stmt)
+		return bool(result.scalar())
@@ -0,0 +1,21 @@
+"""
+A module for batch in the app.schemas package.
+"""
+
+from pydantic import UUID4, BaseModel, Field
+
+
+class BatchResponse[T](BaseModel):
+	"""Response schema for a batch lookup by IDs."""
+
+	items: list[T | None] = Field(
+		...,
+		title="Items",
+		description="Results in request order, null where the ID was not"
+		" found.",
+	)
+	not_found: list[UUID4] = Field(
+		default_factory=list,
+		title="Not found",
+		description="Requested IDs that do not exist.",
+	)
@@ -0,0 +1,40 @@
+"""
+A module for email in the app.schemas package.
+"""
+
+import time
+from datetime import datetime
+from uuid import UUID, uuid4
+
+from pydantic import BaseModel, EmailStr, Field, NonNegativeInt
+
+
+class EmailMessage(BaseModel):
+	"""Schema for an email waiting in the delivery queue."""
+
+	id: UUID = Field(
+		default_factory=uuid4,
+		description="Message ID, stable across retries to avoid duplicates",
+	)
+	email_to: EmailStr = Field(..., description="Email of the recipient")
+	subject: str = Field(..., description="Subject of the email")
+	html: str = Field(..., description="Body of the email in HTML format")
+	queued_at: float = Field(
+		default_factory=time.time,
+		description="Unix time the message was queued at",
+	)
+
+
+class CampaignCheckpoint(BaseModel):
+	"""Schema for the progress of an email campaign, saved after each batch."""
+
+	created_at: datetime | None = Field(
+		None, description="Creation time of the last user processed"
+	)
+	user_id: UUID | None = Field(
+		None, description="ID of the last user processed"
+	)
+	sent: NonNegativeInt = Field(0, description="Number of emails sent")
+	failed: NonNegativeInt = Field(
+		0, description="Number of emails dead-lettered"
+	)
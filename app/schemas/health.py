@@ -0,0 +1,30 @@
+"""
+A module for health in the app.schemas package.
+"""
+
+from datetime import datetime
+
+from pydantic import BaseModel, Field, NonNegativeFloat
+
+
+class DependencyHealth(BaseModel):
+	"""Schema for the last probe result of a dependency."""
+
+	healthy: bool = Field(..., description="Whether the last probe passed")
+	critical: bool = Field(
+		..., description="Whether readiness depends on this dependency"
+	)
+	latency_ms: NonNegativeFloat = Field(
+		..., description="Duration of the last probe in milliseconds"
+	)
+	error: str | None = Field(None, description="Error of the last probe")
+	checked_at: datetime = Field(..., description="Time of the last probe")
+
+
+class HealthResponse(BaseModel):
+	"""Schema for the health of the application and its dependencies."""
+
+	status: str = Field(..., description="Overall status")
+	dependencies: dict[str, DependencyHealth] = Field(
+		default_factory=dict, description="Last probe result by dependency"
+	)
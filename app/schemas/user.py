@@ -162,3 +162,18 @@ class UserResponse(UserBase):
 		title="Updated at",
 		description="Datetime of the most recent update, if any.",
 	)
+
+
+class UserAvailability(BaseModel):
+	"""Schema for the availability of a username and an email."""
+
+	username: bool | None = Field(
+		default=None,
+		title="Username available",
+		description="Whether the username is free, if it was checked.",
+	)
+	email: bool | None = Field(
+		default=None,
+		title="Email available",
+		description="Whether the email is free, if it was checked.",
+	)
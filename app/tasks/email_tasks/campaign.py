@@ -0,0 +1,271 @@
+"""
+A module for campaign in the app.tasks.email tasks package.
+
+Send a template to every active user, resuming after a crash, with:
+	python -m app.tasks.email_tasks.campaign <name> <template> <subject>
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+from pathlib import Path
+from typing import Any, Final
+from uuid import UUID, uuid5
+
+from jinja2 import Template
+from pydantic import PositiveFloat, PositiveInt
+from sqlalchemy import ColumnElement, literal, tuple_
+
+from app.config.config import get_auth_settings, get_init_settings, get_settings
+from app.config.settings import Settings
+from app.db.session import AsyncSessionLocal, async_engine
+from app.models.structured.user import User
+from app.repositories.structured.user_repository import UserRepository
+from app.schemas.email import CampaignCheckpoint, EmailMessage
+from app.tasks.email_tasks.email_queue import EmailQueue, get_email_queue
+from app.tasks.email_tasks.template import get_template_environment
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# Namespace of the message IDs, so each campaign and user pair has one ID
+CAMPAIGN_NAMESPACE: Final[UUID] = UUID("5d3f5b8e-8b0a-4c1e-9a57-1f0e6c2b7a94")
+RECIPIENT_COLUMNS: Final[tuple[str, ...]] = (
+	"id",
+	"username",
+	"email",
+	"first_name",
+	"created_at",
+)
+
+
+class EmailCampaign:
+	"""
+	Sends one template to every active user through the email queue.
+
+	The users are streamed in creation order from a server-side cursor, so
+	only one chunk is held in memory, and each body is rendered from the
+	same compiled template. Messages are submitted one batch of the sender
+	at a time, paced to the rate, and the last user of each delivered batch
+	is saved to the checkpoint file. A resumed campaign starts after it.
+
+	Message IDs are derived from the campaign and the user, so the batch in
+	flight during a crash is rebuilt with the same IDs, and thus the same
+	idempotency key, and the provider drops it if it was already sent. That
+	holds while the queue is not shared with other messages, as in the
+	command line job.
+	"""
+
+	def __init__(
+		self,
+		name: str,
+		template: Template,
+		subject: str,
+		context: dict[str, Any],
+		queue: EmailQueue,
+		rate: PositiveFloat,
+		chunk_size: PositiveInt,
+		checkpoint_path: Path,
+	):
+		self.name: str = name
+		self.template: Template = template
+		self.subject: str = subject
+		self.context: dict[str, Any] = context
+		self.queue: EmailQueue = queue
+		self.rate: PositiveFloat = rate
+		self.chunk_size: PositiveInt = chunk_size
+		self.checkpoint_path: Path = checkpoint_path
+		self.checkpoint: CampaignCheckpoint = CampaignCheckpoint()
+
+	def load_checkpoint(self) -> CampaignCheckpoint:
+		"""
+		Read the progress of a previous run, if any
+
+		Returns:
+			CampaignCheckpoint: The saved progress or an empty one
+		"""
+		try:
+			self.checkpoint = CampaignCheckpoint.model_validate_json(
+				self.checkpoint_path.read_bytes()
+			)
+		except FileNotFoundError:
+			self.checkpoint = CampaignCheckpoint()
+		return self.checkpoint
+
+	def save_checkpoint(self) -> None:
+		"""
+		Replace the checkpoint file, so a crash leaves the old or the new one
+
+		Returns:
+			NoneType: None
+		"""
+		self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+		temporary: Path = self.checkpoint_path.with_suffix(".tmp")
+		temporary.write_text(self.checkpoint.model_dump_json())
+		os.replace(temporary, self.checkpoint_path)
+
+	def build_message(self, recipient: dict[str, Any]) -> EmailMessage:
+		"""
+		Render the email of a recipient
+
+		Args:
+			recipient (dict[str, Any]): The user row
+
+		Returns:
+			EmailMessage: The message with an ID stable across runs
+		"""
+		return EmailMessage(
+			id=uuid5(CAMPAIGN_NAMESPACE, f"{self.name}:{recipient['id']}"),
+			email_to=recipient["email"],
+			subject=self.subject,
+			html=self.template.render(
+				self.context,
+				first_name=recipient["first_name"],
+				username=recipient["username"],
+			),
+		)
+
+	async def _send(self, batch: list[dict[str, Any]]) -> None:
+		"""
+		Submit a batch, wait for its delivery and save the progress
+
+		Args:
+			batch (list[dict[str, Any]]): The user rows of the batch
+
+		Returns:
+			NoneType: None
+		"""
+		futures: list[asyncio.Future[bool]] = [
+			await self.queue.submit(self.build_message(recipient))
+			for recipient in batch
+		]
+		results: list[bool] = await asyncio.gather(*futures)
+		sent: int = sum(results)
+		self.checkpoint.sent += sent
+		self.checkpoint.failed += len(results) - sent
+		self.checkpoint.created_at = batch[-1]["created_at"]
+		self.checkpoint.user_id = batch[-1]["id"]
+		await asyncio.to_thread(self.save_checkpoint)
+		logger.info(
+			"Campaign %s: %d sent, %d failed",
+			self.name,
+			self.checkpoint.sent,
+			self.checkpoint.failed,
+		)
+
+	async def run(self) -> CampaignCheckpoint:
+		"""
+		Send the campaign to the active users left
+
+		Returns:
+			CampaignCheckpoint: The final progress
+		"""
+		checkpoint: CampaignCheckpoint = await asyncio.to_thread(
+			self.load_checkpoint
+		)
+		criteria: list[ColumnElement[bool]] = [User.is_active.is_(True)]
+		if checkpoint.user_id is not None:
+			criteria.append(
+				tuple_(User.created_at, User.id)
+				> tuple_(
+					literal(checkpoint.created_at, User.created_at.type),
+					literal(checkpoint.user_id, User.id.type),
+				)
+			)
+			logger.info(
+				"Resuming campaign %s after %d emails",
+				self.name,
+				checkpoint.sent + checkpoint.failed,
+			)
+		batch_size: PositiveInt = self.queue.sender.max_batch_size
+		loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+		# Batches do not follow the chunks, so a resumed run forms them alike
+		pending: list[dict[str, Any]] = []
+		async with AsyncSessionLocal() as session:
+			rows: list[dict[str, Any]]
+			async for rows in UserRepository(session).stream_rows(
+				RECIPIENT_COLUMNS,
+				*criteria,
+				chunk_size=self.chunk_size,
+				order_by=("created_at", "id"),
+			):
+				pending.extend(rows)
+				while len(pending) >= batch_size:
+					batch: list[dict[str, Any]] = pending[:batch_size]
+					del pending[:batch_size]
+					started_at: float = loop.time()
+					await self._send(batch)
+					await asyncio.sleep(
+						started_at + len(batch) / self.rate - loop.time()
+					)
+			if pending:
+				await self._send(pending)
+		return self.checkpoint
+
+
+async def main(name: str, template_name: str, subject: str, link: str) -> None:
+	"""
+	Run a campaign with its own email queue and release the resources
+
+	Args:
+		name (str): The campaign name, which keys the checkpoint and IDs
+		template_name (str): The template file
+		subject (str): The subject of the emails
+		link (str): The link of the email button
+
+	Returns:
+		NoneType: None
+	"""
+	settings: Settings = get_settings()
+	queue: EmailQueue = get_email_queue()
+	queue.start()
+	try:
+		campaign: EmailCampaign = EmailCampaign(
+			name,
+			get_template_environment().get_template(template_name),
+			subject,
+			{
+				"project_name": get_init_settings().PROJECT_NAME,
+				"link": link,
+			},
+			queue,
+			settings.CAMPAIGN_RATE_PER_SECOND,
+			settings.CAMPAIGN_CHUNK_SIZE,
+			settings.CAMPAIGN_CHECKPOINT_DIR / f"{name}.json",
+		)
+		checkpoint: CampaignCheckpoint = await campaign.run()
+		logger.info(
+			"Campaign %s done: %d sent, %d failed",
+			name,
+			checkpoint.sent,
+			checkpoint.failed,
+		)
+	finally:
+		await queue.stop()
+		await async_engine.dispose()
+
+
+if __name__ == "__main__":
+	parser: argparse.ArgumentParser = argparse.ArgumentParser(
+		description="Email every active user"
+	)
+	parser.add_argument("name", help="Campaign name, reuse it to resume")
+	parser.add_argument(
+		"template", help="Template file, e.g. terms_update.html"
+	)
+	parser.add_argument("subject", help="Subject of the emails")
+	parser.add_argument(
+		"--link",
+		default=str(get_auth_settings().SERVER_URL),
+		help="Link of the email button",
+	)
+	arguments: argparse.Namespace = parser.parse_args()
+	logging.basicConfig(level=logging.INFO)
+	asyncio.run(
+		main(
+			arguments.name,
+			arguments.template,
+			arguments.subject,
+			arguments.link,
+		)
+	)
@@ -0,0 +1,385 @@
+"""
+A module for email queue in the app.tasks.email tasks package.
+"""
+
+import asyncio
+import hashlib
+import logging
+import random
+import time
+from collections.abc import Sequence
+from functools import lru_cache
+from pathlib import Path
+
+import orjson
+from pydantic import PositiveFloat, PositiveInt
+
+from app.config.config import get_settings
+from app.config.settings import Settings
+from app.core.interfaces.email_sender_interface import IEmailSender
+from app.core.metrics import (
+	EMAILS_PROCESSED,
+	EMAIL_DELIVERY_LATENCY,
+	EMAIL_QUEUE_DEPTH,
+)
+from app.exceptions.exceptions import EmailDeliveryError
+from app.schemas.email import EmailMessage
+from app.tasks.email_tasks.senders import LogEmailSender, ResendEmailSender
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+type QueuedEmail = tuple[EmailMessage, asyncio.Future[bool]]
+
+
+def write_dead_letters(
+	path: Path, messages: Sequence[EmailMessage], reason: str
+) -> None:
+	"""
+	Append undelivered messages to the dead-letter file as JSON lines
+
+	Args:
+		path (Path): The dead-letter file
+		messages (Sequence[EmailMessage]): The undelivered messages
+		reason (str): Why they were not delivered
+
+	Returns:
+		NoneType: None
+	"""
+	failed_at: float = time.time()
+	lines: bytes = b"".join(
+		orjson.dumps(
+			{
+				"reason": reason,
+				"failed_at": failed_at,
+				**message.model_dump(mode="json"),
+			},
+			option=orjson.OPT_APPEND_NEWLINE,
+		)
+		for message in messages
+	)
+	path.parent.mkdir(parents=True, exist_ok=True)
+	# A single append keeps the lines of concurrent writers whole
+	with open(path, "ab") as file:
+		file.write(lines)
+
+
+def _resolve_unsent(future: asyncio.Future[bool]) -> None:
+	"""
+	Resolve the future of a message that was not sent
+
+	Args:
+		future (asyncio.Future[bool]): The future of the message
+
+	Returns:
+		NoneType: None
+	"""
+	if not future.done():
+		future.set_result(False)
+
+
+class EmailQueue:
+	"""
+	Delivers emails in the background with a bounded pool of workers.
+
+	Each worker takes the messages that arrive within the batch wait, up
+	to the batch size of the sender, and delivers them with one request. A
+	batch failing for a transient reason is retried with jittered
+	exponential backoff under the same idempotency key, then written to the
+	dead-letter file. A rejected batch is split in halves until the
+	rejected messages are found, so only those are dead-lettered. Messages
+	that cannot be queued, or are still queued at shutdown, go there too.
+	Submitting returns a future that tells whether the message was sent.
+	"""
+
+	def __init__(
+		self,
+		sender: IEmailSender,
+		workers: PositiveInt,
+		max_size: PositiveInt,
+		batch_wait: PositiveFloat,
+		max_attempts: PositiveInt,
+		retry_base: PositiveFloat,
+		drain_timeout: PositiveFloat,
+		dead_letter_path: Path,
+	):
+		self.sender: IEmailSender = sender
+		self.workers: PositiveInt = workers
+		self.batch_wait: PositiveFloat = batch_wait
+		self.max_attempts: PositiveInt = max_attempts
+		self.retry_base: PositiveFloat = retry_base
+		self.drain_timeout: PositiveFloat = drain_timeout
+		self.dead_letter_path: Path = dead_letter_path
+		self._queue: asyncio.Queue[QueuedEmail] = asyncio.Queue(max_size)
+		self._tasks: list[asyncio.Task[None]] = []
+		self._background: set[asyncio.Task[None]] = set()
+		self._closing: bool = False
+
+	async def _dead_letter(
+		self, batch: Sequence[QueuedEmail], reason: str
+	) -> None:
+		"""
+		Write messages to the dead-letter file and resolve them as unsent
+
+		Args:
+			batch (Sequence[QueuedEmail]): The messages and their futures
+			reason (str): Why they were not delivered
+
+		Returns:
+			NoneType: None
+		"""
+		await asyncio.to_thread(self._dead_letter_now, batch, reason)
+
+	def _dead_letter_now(
+		self, batch: Sequence[QueuedEmail], reason: str
+	) -> None:
+		"""
+		Write messages to the dead-letter file without leaving the thread
+		and resolve them as unsent
+
+		Args:
+			batch (Sequence[QueuedEmail]): The messages and their futures
+			reason (str): Why they were not delivered
+
+		Returns:
+			NoneType: None
+		"""
+		messages: list[EmailMessage] = [message for message, _ in batch]
+		try:
+			write_dead_letters(self.dead_letter_path, messages, reason)
+		except OSError as exc:
+			logger.error(
+				"Lost %d emails, dead-letter write failed: %r",
+				len(messages),
+				exc,
+			)
+		EMAILS_PROCESSED.labels(result="dead_lettered").inc(len(messages))
+		logger.warning("Dead-lettered %d emails: %s", len(messages), reason)
+		for _, future in batch:
+			if not future.done():
+				future.get_loop().call_soon_threadsafe(_resolve_unsent, future)
+
+	def submit_nowait(self, message: EmailMessage) -> asyncio.Future[bool]:
+		"""
+		Queue a message without waiting, dead-lettering it if the queue is
+		full or closed
+
+		Args:
+			message (EmailMessage): The message to deliver
+
+		Returns:
+			asyncio.Future[bool]: Resolves to True once the message is sent
+		"""
+		future: asyncio.Future[bool] = (
+			asyncio.get_running_loop().create_future()
+		)
+		if not self._closing:
+			try:
+				self._queue.put_nowait((message, future))
+			except asyncio.QueueFull:
+				pass
+			else:
+				EMAIL_QUEUE_DEPTH.set(self._queue.qsize())
+				return future
+		task: asyncio.Task[None] = asyncio.create_task(
+			self._dead_letter(
+				[(message, future)],
+				"queue closed" if self._closing else "queue full",
+			)
+		)
+		self._background.add(task)
+		task.add_done_callback(self._background.discard)
+		return future
+
+	async def submit(self, message: EmailMessage) -> asyncio.Future[bool]:
+		"""
+		Queue a message, waiting for room when the queue is full
+
+		Args:
+			message (EmailMessage): The message to deliver
+
+		Returns:
+			asyncio.Future[bool]: Resolves to True once the message is sent
+		"""
+		future: asyncio.Future[bool] = (
+			asyncio.get_running_loop().create_future()
+		)
+		if self._closing:
+			await self._dead_letter([(message, future)], "queue closed")
+			return future
+		await self._queue.put((message, future))
+		EMAIL_QUEUE_DEPTH.set(self._queue.qsize())
+		return future
+
+	async def _collect(self) -> list[QueuedEmail]:
+		"""
+		Wait for a message, then take those arriving within the batch wait
+
+		Returns:
+			list[QueuedEmail]: The batch of messages and their futures
+		"""
+		batch: list[QueuedEmail] = [await self._queue.get()]
+		loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+		deadline: float = loop.time() + self.batch_wait
+		while len(batch) < self.sender.max_batch_size:
+			if not self._queue.empty():
+				batch.append(self._queue.get_nowait())
+				continue
+			remaining: float = deadline - loop.time()
+			if remaining <= 0:
+				break
+			try:
+				async with asyncio.timeout(remaining):
+					batch.append(await self._queue.get())
+			except TimeoutError:
+				break
+		EMAIL_QUEUE_DEPTH.set(self._queue.qsize())
+		return batch
+
+	async def _deliver(self, batch: Sequence[QueuedEmail]) -> None:
+		"""
+		Send a batch, retrying transient failures with backoff before
+		dead-lettering it, and splitting it when rejected
+
+		Args:
+			batch (Sequence[QueuedEmail]): The messages and their futures
+
+		Returns:
+			NoneType: None
+		"""
+		messages: list[EmailMessage] = [message for message, _ in batch]
+		idempotency_key: str = hashlib.sha256(
+			b"".join(message.id.bytes for message in messages)
+		).hexdigest()
+		error: EmailDeliveryError | None = None
+		for attempt in range(self.max_attempts):
+			if attempt:
+				EMAILS_PROCESSED.labels(result="retried").inc(len(messages))
+				await asyncio.sleep(
+					self.retry_base
+					* 2 ** (attempt - 1)
+					* random.uniform(0.5, 1)
+				)
+			try:
+				await self.sender.send_batch(messages, idempotency_key)
+			except EmailDeliveryError as exc:
+				logger.warning(
+					"Email batch attempt %d/%d failed: %s",
+					attempt + 1,
+					self.max_attempts,
+					exc,
+				)
+				error = exc
+				if exc.transient:
+					continue
+				break
+			sent_at: float = time.time()
+			for message, future in batch:
+				EMAIL_DELIVERY_LATENCY.observe(sent_at - message.queued_at)
+				if not future.done():
+					future.set_result(True)
+			EMAILS_PROCESSED.labels(result="sent").inc(len(messages))
+			return
+		if error is not None and not error.transient and len(batch) > 1:
+			# One bad message fails the whole request, so find it by halving
+			middle: int = len(batch) // 2
+			await self._deliver(batch[:middle])
+			await self._deliver(batch[middle:])
+			return
+		await self._dead_letter(batch, str(error))
+
+	async def _work(self) -> None:
+		"""
+		Deliver batches forever
+
+		Returns:
+			NoneType: None
+		"""
+		while True:
+			batch: list[QueuedEmail] = await self._collect()
+			try:
+				await self._deliver(batch)
+			except asyncio.CancelledError:
+				# Stopped mid-delivery, so the rest may or may not be sent
+				unsent: list[QueuedEmail] = [
+					queued for queued in batch if not queued[1].done()
+				]
+				if unsent:
+					self._dead_letter_now(unsent, "interrupted")
+				raise
+			finally:
+				for _ in batch:
+					self._queue.task_done()
+
+	def start(self) -> None:
+		"""
+		Start the workers
+
+		Returns:
+			NoneType: None
+		"""
+		self._closing = False
+		self._tasks = [
+			asyncio.create_task(self._work(), name=f"email-worker-{index}")
+			for index in range(self.workers)
+		]
+
+	async def stop(self) -> None:
+		"""
+		Stop accepting messages, deliver the queued ones up to the drain
+		timeout and dead-letter the rest
+
+		Returns:
+			NoneType: None
+		"""
+		self._closing = True
+		try:
+			async with asyncio.timeout(self.drain_timeout):
+				await self._queue.join()
+		except TimeoutError:
+			logger.warning(
+				"Email queue drain timed out with %d queued",
+				self._queue.qsize(),
+			)
+		for task in self._tasks:
+			task.cancel()
+		await asyncio.gather(
+			*self._tasks, *self._background, return_exceptions=True
+		)
+		self._tasks = []
+		left: list[QueuedEmail] = []
+		while not self._queue.empty():
+			left.append(self._queue.get_nowait())
+			self._queue.task_done()
+		if left:
+			await self._dead_letter(left, "shutdown")
+		EMAIL_QUEUE_DEPTH.set(0)
+
+
+@lru_cache
+def get_email_queue() -> EmailQueue:
+	"""
+	Get the email queue of the worker
+
+	Returns:
+		EmailQueue: The email queue instance
+	"""
+	settings: Settings = get_settings()
+	sender: IEmailSender
+	if settings.EMAIL_SENDER == "resend":
+		sender = ResendEmailSender(
+			settings.RESEND_API_KEY,
+			f"{settings.EMAILS_FROM_NAME} <{settings.EMAILS_FROM_EMAIL}>",
+			settings.EMAIL_TIMEOUT_SECONDS,
+		)
+	else:
+		sender = LogEmailSender()
+	return EmailQueue(
+		sender,
+		settings.EMAIL_QUEUE_WORKERS,
+		settings.EMAIL_QUEUE_MAX_SIZE,
+		settings.EMAIL_BATCH_WAIT_SECONDS,
+		settings.EMAIL_MAX_ATTEMPTS,
+		settings.EMAIL_RETRY_BASE_SECONDS,
+		settings.EMAIL_DRAIN_TIMEOUT_SECONDS,
+		settings.EMAIL_DEAD_LETTER_PATH,
+	)
@@ -0,0 +1,129 @@
+"""
+A module for senders in the app.tasks.email tasks package.
+"""
+
+import asyncio
+import logging
+from collections.abc import Sequence
+from typing import Final
+
+import resend
+from pydantic import PositiveFloat, PositiveInt
+from resend.exceptions import ResendError
+
+from app.core.interfaces.email_sender_interface import IEmailSender
+from app.exceptions.exceptions import EmailDeliveryError
+from app.schemas.email import EmailMessage
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# Limit of the Resend batch endpoint
+RESEND_MAX_BATCH_SIZE: Final[PositiveInt] = 100
+
+
+def _is_transient(error: ResendError) -> bool:
+	"""
+	Tell whether Resend may accept the same request later
+
+	Args:
+		error (ResendError): The error returned by Resend
+
+	Returns:
+		bool: True for rate limits, server errors and unknown codes, False
+		when Resend rejected the request itself
+	"""
+	code: str = str(error.code)
+	if not code.isdigit():
+		return True
+	return int(code) == 429 or int(code) >= 500
+
+
+class ResendEmailSender(IEmailSender):
+	"""
+	Delivers batches through the Resend batch endpoint.
+
+	The client is synchronous, so each batch is sent in a worker thread.
+	Resend drops a request whose idempotency key it has already seen, so a
+	retried batch is not delivered twice.
+	"""
+
+	max_batch_size: PositiveInt = RESEND_MAX_BATCH_SIZE
+
+	def __init__(self, api_key: str, sender: str, timeout: PositiveFloat):
+		resend.api_key = api_key
+		self.sender: str = sender
+		self.timeout: PositiveFloat = timeout
+
+	async def send_batch(
+		self, messages: Sequence[EmailMessage], idempotency_key: str
+	) -> None:
+		"""
+		Deliver a batch of messages with a single request
+
+		Args:
+			messages (Sequence[EmailMessage]): The messages to deliver
+			idempotency_key (str): The same for every retry of the batch
+
+		Returns:
+			NoneType: None
+
+		Raises:
+			EmailDeliveryError: If the request failed or timed out, not
+			transient when Resend rejected it
+		"""
+		params: list[resend.Emails.SendParams] = [
+			{
+				"from": self.sender,
+				"to": [message.email_to],
+				"subject": message.subject,
+				"html": message.html,
+			}
+			for message in messages
+		]
+		try:
+			async with asyncio.timeout(self.timeout):
+				await asyncio.to_thread(
+					resend.Batch.send,
+					params,
+					{"idempotency_key": idempotency_key},
+				)
+		except ResendError as exc:
+			raise EmailDeliveryError(
+				f"Resend batch of {len(messages)} failed: {exc!r}",
+				transient=_is_transient(exc),
+			) from exc
+		except (OSError, TimeoutError) as exc:
+			raise EmailDeliveryError(
+				f"Resend batch of {len(messages)} failed: {exc!r}"
+			) from exc
+
+
+class LogEmailSender(IEmailSender):
+	"""
+	Logs the messages instead of delivering them, for local development
+	and tests.
+	"""
+
+	max_batch_size: PositiveInt = RESEND_MAX_BATCH_SIZE
+
+	async def send_batch(
+		self, messages: Sequence[EmailMessage], idempotency_key: str
+	) -> None:
+		"""
+		Log a batch of messages
+
+		Args:
+			messages (Sequence[EmailMessage]): The messages to log
+			idempotency_key (str): The key of the batch
+
+		Returns:
+			NoneType: None
+		"""
+		for message in messages:
+			logger.info(
+				"Email %s to %s: %s",
+				message.id,
+				message.email_to,
+				message.subject,
+				extra={"idempotency_key": idempotency_key},
+			)
@@ -3,81 +3,130 @@ A module for template in the app.tasks.email tasks package.
 """
 
 import logging
-from typing import Annotated, Any
-
-from fastapi import Depends
-from jinja2 import Template
-from pydantic import FilePath
-
-from app.config.config import get_init_settings
+import os
+import re
+from collections.abc import Callable
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Final
+
+from jinja2 import (
+	Environment,
+	FileSystemBytecodeCache,
+	FileSystemLoader,
+	select_autoescape,
+)
+
+from app.config.config import get_init_settings, get_settings
 from app.config.init_settings import InitSettings
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+# A stylesheet of the application linked from a template
+STYLESHEET_LINK: Final[re.Pattern[str]] = re.compile(
+	r'<link\s+href="/[^"]*?(?P<file>[\w.-]+\.css)"\s+rel="stylesheet"\s*/>'
+)
+
 
-def render_template(
-	template: str,
-	css: str | None,
-	environment: dict[str, Any],
-) -> str:
+class InlineStylesLoader(FileSystemLoader):
 	"""
-	Renders the given template with the given environment variables and inlines
-	CSS.
+	Template loader that inlines the stylesheets linked from a template.
 
-	Args:
-		template (str): The body of the email in HTML format
-		css (str | None): The CSS css as a string
-		environment (dict[str, Any]): A dictionary of variables used in the email templates
+	Email clients ignore linked stylesheets, so each one is replaced with
+	the file in a <style> element before the template is compiled. With
+	auto reload, a template is compiled again once it or one of its
+	stylesheets changes.
+	"""
+
+	def __init__(self, searchpath: Path, css_directory: Path, encoding: str):
+		super().__init__(searchpath, encoding)
+		self.css_directory: Path = css_directory
+
+	def get_source(
+		self, environment: Environment, template: str
+	) -> tuple[str, str, Callable[[], bool]]:
+		"""
+		Get the source of a template with its stylesheets inlined
+
+		Args:
+			environment (Environment): The environment loading the template
+			template (str): The template name
+
+		Returns:
+			tuple[str, str, Callable[[], bool]]: The source, the file name
+			and the function telling whether it is up to date
+		"""
+		source, filename, uptodate = super().get_source(environment, template)
+		stylesheets: dict[Path, float] = {}
+
+		def inline(match: re.Match[str]) -> str:
+			path: Path = self.css_directory / match["file"]
+			stylesheets[path] = path.stat().st_mtime
+			return f"<style>\n{path.read_text(self.encoding)}</style>"
+
+		source = STYLESHEET_LINK.sub(inline, source)
+
+		def is_uptodate() -> bool:
+			try:
+				return uptodate() and all(
+					os.path.getmtime(path) == mtime
+					for path, mtime in stylesheets.items()
+				)
+			except OSError:
+				return False
+
+		return source, filename, is_uptodate
+
+
+@lru_cache
+def get_template_environment() -> Environment:
+	"""
+	Get the Jinja2 environment shared by the whole process.
+
+	Compiled templates are kept in memory and their bytecode on disk, so
+	other workers and restarts skip the compilation too. Templates are only
+	checked for changes on disk with SERVER_RELOAD.
 
 	Returns:
-		str: Rendered template with environment variables and inline CSS
+		Environment: The template environment
 	"""
-	rendered_html: str = Template(template).render(environment)
-	logger.info("Rendered HTML")
-	if not css:
-		return rendered_html
-	html_with_css: str = rendered_html.replace(
-		'<link href="/assets/css/css.css" rel="stylesheet" />',
-		f"<style>\n{css}\n\t</style>",
+	init_settings: InitSettings = get_init_settings()
+	return Environment(
+		loader=InlineStylesLoader(
+			init_settings.EMAIL_TEMPLATES_DIR,
+			init_settings.CSS_DIRECTORY,
+			init_settings.ENCODING,
+		),
+		autoescape=select_autoescape(("html",)),
+		auto_reload=get_settings().SERVER_RELOAD,
+		bytecode_cache=FileSystemBytecodeCache(),
 	)
-	logger.info("HTML with CSS added")
-	return html_with_css
 
 
-def read_template_file(
-	template_path: FilePath,
-	init_settings: Annotated[InitSettings, Depends(get_init_settings)],
-) -> str:
+def precompile_templates() -> int:
 	"""
-	Read the template file
-
-	Args:
-		template_path (FilePath): Path to the template
-		init_settings (InitSettings): Dependency method for cached init setting object
+	Compile every HTML template ahead of the first render
 
 	Returns:
-		str: Template string
+		int: The number of templates compiled
 	"""
-	with open(template_path, encoding=init_settings.ENCODING) as file:
-		template: str = file.read()
-	return template
+	environment: Environment = get_template_environment()
+	names: list[str] = environment.list_templates(extensions=("html",))
+	for name in names:
+		environment.get_template(name)
+	logger.info("Compiled %d templates", len(names))
+	return len(names)
 
 
-def read_css_file(
-	css_path: FilePath,
-	init_settings: Annotated[InitSettings, Depends(get_init_settings)],
-) -> str:
+def render_template(name: str, context: dict[str, Any]) -> str:
 	"""
-	Read the CSS file
+	Render a compiled template in memory
 
 	Args:
-		css_path (FilePath): Path to the CSS file
-		init_settings (InitSettings): Dependency method for cached init setting object
+		name (str): The template name
+		context (dict[str, Any]): The variables used in the template
 
 	Returns:
-		str: CSS string
+		str: The rendered template with its styles inline
 	"""
-	with open(css_path, encoding=init_settings.ENCODING) as file:
-		css_lines: list[str] = file.readlines()
-	indented_css: str = "".join(["\t  " + line for line in css_lines])
-	return indented_css
+	return get_template_environment().get_template(name).render(context)
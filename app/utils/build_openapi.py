@@ -0,0 +1,46 @@
+"""
+Build the minified OpenAPI document served by the API.
+
+Run it from the project root after changing any route or schema with:
+	python -m app.utils.build_openapi
+"""
+
+import logging
+
+from app.config.config import (
+	get_auth_settings,
+	get_init_settings,
+	get_settings,
+	init_setting,
+)
+from app.utils.openapi_utils import (
+	custom_openapi,
+	serialize_schema,
+	write_schema_to_file,
+)
+from main import app
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+	"""
+	Generate the OpenAPI document and write it minified to disk
+
+	Returns:
+		NoneType: None
+	"""
+	app.state.settings = get_settings()
+	app.state.init_settings = get_init_settings()
+	app.state.auth_settings = get_auth_settings()
+	schema: bytes = serialize_schema(custom_openapi(app))
+	file_path: str = init_setting.OPENAPI_FILE_PATH[1:]
+	write_schema_to_file(schema, file_path)
+	logger.info(
+		"OpenAPI document written to %s (%s bytes)", file_path, len(schema)
+	)
+
+
+if __name__ == "__main__":
+	logging.basicConfig(level=logging.INFO)
+	main()
@@ -3,10 +3,12 @@ A module for image utils in the app.utils package.
 """
 
 import base64
+from functools import lru_cache
 
 from pydantic import FilePath
 
 
+@lru_cache
 def convert_image_to_base64(image_path: FilePath) -> str:
 	"""
 	Converts an image to base64 format
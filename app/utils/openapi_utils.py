@@ -2,9 +2,9 @@
 A module for openapi utils in the app.utils package.
 """
 
-import json
 from typing import Any
 
+import orjson
 from fastapi import FastAPI
 from fastapi.openapi.utils import get_openapi
 from fastapi.routing import APIRoute
@@ -80,36 +80,53 @@ def custom_generate_unique_id(route: APIRoute) -> str:
 		"redirect_to_docs",
 		"custom_swagger_ui_html",
 		"check_health",
+		"check_liveness",
+		"check_readiness",
+		"get_metrics",
+		"get_openapi_schema",
 	):
 		return str(route.name)
 	return f"{route.tags[0]}-{route.name}"
 
 
-def write_schema_to_file(
-	schema: dict[str, dict[str, Any]], file_path: str, encoding: str
-) -> None:
+def serialize_schema(schema: dict[str, Any]) -> bytes:
 	"""
-	Writes the given OpenAPI schema to a file in JSON format.
+	Serializes the OpenAPI schema to minified JSON with sorted keys.
+
+	Sorting the keys keeps the output, and so its ETag, stable across builds.
+
+	Args:
+		schema (dict[str, Any]): The OpenAPI schema to serialize.
+
+	Returns:
+		bytes: The minified JSON document.
+	"""
+	return orjson.dumps(schema, option=orjson.OPT_SORT_KEYS)
+
+
+def write_schema_to_file(schema: bytes, file_path: str) -> None:
+	"""
+	Writes the given serialized OpenAPI schema to a file.
 
 	Args:
-		schema (dict[str, dict[str, Any]]): The OpenAPI schema to write.
+		schema (bytes): The serialized OpenAPI schema to write.
 		file_path (str): The file path where the schema should be saved.
-		encoding (str): The file encoding to use.
 
 	Returns:
 		NoneType: None
 	"""
-	with open(file_path, mode="w", encoding=encoding) as out_file:
-		out_file.write(json.dumps(schema, indent=4))
+	with open(file_path, mode="wb") as out_file:
+		out_file.write(schema)
 
 
 def custom_openapi(app: FastAPI) -> dict[str, Any]:
 	"""
 	Generates and caches a custom OpenAPI schema for the FastAPI application.
 
-	This function uses FastAPI's default OpenAPI generation, applies custom
-	modifications, and writes the schema to a file. The schema is cached for
-	future use to avoid regeneration on every request.
+	This function uses FastAPI's default OpenAPI generation and applies custom
+	modifications. The schema is cached for future use to avoid regeneration.
+	It is served from the prebuilt artifact, so this only runs at build time
+	and at startup when no artifact is available.
 
 	Args:
 		app (FastAPI): The FastAPI application instance.
@@ -136,9 +153,4 @@ def custom_openapi(app: FastAPI) -> dict[str, Any]:
 	)
 	openapi_schema = modify_json_data(openapi_schema)
 	app.openapi_schema = openapi_schema
-	write_schema_to_file(
-		openapi_schema,
-		f"{app.state.init_settings.OPENAPI_FILE_PATH}"[1:],
-		app.state.init_settings.ENCODING,
-	)
 	return app.openapi_schema
@@ -0,0 +1,124 @@
+"""
+A module for sparse fieldsets in the app.utils package.
+"""
+
+import logging
+from functools import lru_cache
+from typing import Annotated, Any
+
+from fastapi import HTTPException, Query, status
+from pydantic import BaseModel, ConfigDict, create_model
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=256)
+def get_partial_model(
+	schema: type[BaseModel], fields: tuple[str, ...]
+) -> type[BaseModel]:
+	"""
+	Derive a response model that only declares the selected fields.
+
+	The derived class is cached per schema and field combination, so the
+	validator is built once and reused by every later request.
+
+	Args:
+		schema (type[BaseModel]): The full response schema
+		fields (tuple[str, ...]): The selected field names in schema order
+
+	Returns:
+		type[BaseModel]: The partial response model
+	"""
+	field_definitions: dict[str, Any] = {
+		name: (info.annotation, info)
+		for name, info in schema.model_fields.items()
+		if name in fields
+	}
+	return create_model(
+		f"{schema.__name__}Partial",
+		__config__=ConfigDict(from_attributes=True),
+		**field_definitions,
+	)
+
+
+class FieldSelector:
+	"""Dependency that parses the `fields` query parameter for a schema"""
+
+	def __init__(self, schema: type[BaseModel]):
+		self.schema: type[BaseModel] = schema
+		self.allowed_fields: tuple[str, ...] = tuple(schema.model_fields)
+
+	def __call__(
+		self,
+		fields: Annotated[
+			str | None,
+			Query(
+				title="Fields",
+				description="Comma-separated list of fields to include in"
+				" the response",
+				examples=["id,name,price"],
+			),
+		] = None,
+	) -> tuple[str, ...] | None:
+		"""
+		Parse the requested fields into a tuple ordered as in the schema.
+
+		Args:
+			fields (str | None): The comma-separated field names
+
+		Returns:
+			tuple[str, ...] | None: The selected fields or None for all
+
+		Raises:
+			HTTPException: If any of the fields is not part of the schema
+		"""
+		if not fields:
+			return None
+		requested: set[str] = {
+			field.strip() for field in fields.split(",") if field.strip()
+		}
+		if not requested:
+			return None
+		unknown: set[str] = requested.difference(self.allowed_fields)
+		if unknown:
+			msg: str = f"Unknown fields: {', '.join(sorted(unknown))}"
+			logger.warning("Unknown fields: %s", ", ".join(sorted(unknown)))
+			raise HTTPException(
+				status_code=status.HTTP_400_BAD_REQUEST, detail=msg
+			)
+		return tuple(name for name in self.allowed_fields if name in requested)
+
+
+def dump_fields(
+	schema: type[BaseModel], fields: tuple[str, ...], obj: Any
+) -> dict[str, Any]:
+	"""
+	Serialize an object with only the selected fields of a schema.
+
+	Args:
+		schema (type[BaseModel]): The full response schema
+		fields (tuple[str, ...]): The selected field names in schema order
+		obj (Any): The ORM object to read the attributes from
+
+	Returns:
+		dict[str, Any]: The partial representation of the object
+	"""
+	return get_partial_model(schema, fields).model_validate(obj).model_dump()
+
+
+def select_fields(
+	row: dict[str, Any] | None, fields: tuple[str, ...] | None
+) -> dict[str, Any] | None:
+	"""
+	Narrow a plain row to the selected fields.
+
+	Args:
+		row (dict[str, Any] | None): The row to narrow
+		fields (tuple[str, ...] | None): The selected fields or None for all
+
+	Returns:
+		dict[str, Any] | None: The narrowed row, or None if there is no row
+	"""
+	if row is None or not fields:
+		return row
+	return {name: row[name] for name in fields}
@@ -23,7 +23,7 @@ def validate_password(password: str | None) -> str:
 	msg: str
 	if not password:
 		msg = "Password cannot be empty or None"
-		logger.exception(msg)
+		logger.error(msg)
 		raise ServiceException("Password cannot be empty or None")
 	if not (
 		re.search("[A-Z]", password)
@@ -0,0 +1,107 @@
+"""
+Benchmark of the worker memory after forking from a preloaded master.
+
+It imports the application once, forks workers with and without
+gc.freeze() and reports how much of each worker stays shared with the
+master. Linux only, since it reads /proc/<pid>/smaps_rollup.
+
+Run it from the project root with:
+	python -m benchmarks.fork_memory_benchmark
+"""
+
+import gc
+import os
+import signal
+import time
+
+WORKERS: int = 4
+FIELDS: tuple[str, ...] = ("Rss", "Pss", "Shared_Clean", "Private_Dirty")
+
+
+def read_memory(pid: int) -> dict[str, int]:
+	"""
+	Read the memory summary of a process
+
+	Args:
+		pid (int): The process ID
+
+	Returns:
+		dict[str, int]: The memory fields in kB
+	"""
+	memory: dict[str, int] = {}
+	with open(f"/proc/{pid}/smaps_rollup", encoding="utf-8") as rollup:
+		for line in rollup:
+			name, _, value = line.partition(":")
+			if name in FIELDS:
+				memory[name] = int(value.split()[0])
+	return memory
+
+
+def fork_worker() -> tuple[int, int]:
+	"""
+	Fork a worker that runs full collections, as a busy worker would
+
+	Returns:
+		tuple[int, int]: The worker PID and the read end of its ready pipe
+	"""
+	read_fd, write_fd = os.pipe()
+	pid: int = os.fork()
+	if pid == 0:
+		os.close(read_fd)
+		for _ in range(3):
+			gc.collect()
+		os.write(write_fd, b"1")
+		time.sleep(60)
+		os._exit(0)
+	os.close(write_fd)
+	return pid, read_fd
+
+
+def measure(freeze: bool) -> None:
+	"""
+	Fork the workers and print their memory
+
+	Args:
+		freeze (bool): Whether to call gc.freeze() before forking
+
+	Returns:
+		NoneType: None
+	"""
+	gc.collect()
+	if freeze:
+		gc.freeze()
+	workers: list[tuple[int, int]] = [fork_worker() for _ in range(WORKERS)]
+	for _, read_fd in workers:
+		os.read(read_fd, 1)
+		os.close(read_fd)
+	print(f"gc.freeze() {'on' if freeze else 'off'}")
+	print(f"  {'process':<10}" + "".join(f"{field:>15}" for field in FIELDS))
+	for name, pid in [("master", os.getpid())] + [
+		(f"worker {index}", pid) for index, (pid, _) in enumerate(workers)
+	]:
+		memory: dict[str, int] = read_memory(pid)
+		print(
+			f"  {name:<10}"
+			+ "".join(f"{memory[field] / 1024:>12.1f} MB" for field in FIELDS)
+		)
+	for pid, _ in workers:
+		os.kill(pid, signal.SIGKILL)
+		os.waitpid(pid, 0)
+	gc.unfreeze()
+
+
+def main() -> None:
+	"""
+	Run the fork memory benchmark
+
+	Returns:
+		NoneType: None
+	"""
+	import main as application  # noqa: F401
+
+	measure(freeze=False)
+	measure(freeze=True)
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,156 @@
+"""
+Benchmark of the event-loop time spent logging per request.
+
+Each simulated request makes the log calls of a 404 on the order item
+route: the two security header logs, the not found log and the SQL echo of
+the query. The blocking setup writes from the event loop, the queued setup
+only enqueues and leaves the formatting and the writes to the listener.
+
+Run it from the project root with:
+	python -m benchmarks.logging_benchmark
+"""
+
+import asyncio
+import logging
+import tempfile
+import time
+from collections.abc import Callable
+from logging.handlers import QueueListener
+from typing import TextIO
+
+from app.config.init_settings import InitSettings
+from app.config.settings import Settings
+from app.core.structured_logging import configure_logging, stop_logging
+
+REQUESTS: int = 20000
+middleware_logger: logging.Logger = logging.getLogger(
+	"app.middlewares.security_headers_middleware"
+)
+router_logger: logging.Logger = logging.getLogger(
+	"app.api.api_v1.router.order_item"
+)
+engine_logger: logging.Logger = logging.getLogger("sqlalchemy.engine.Engine")
+
+
+def previous_log_calls(index: int) -> None:
+	"""
+	Log like a request did before: info headers, traceback and SQL echo
+
+	Args:
+		index (int): The request number
+
+	Returns:
+		NoneType: None
+	"""
+	middleware_logger.info("Applying default CSP")
+	engine_logger.info("BEGIN (implicit)")
+	engine_logger.info("SELECT order_item.id FROM order_item WHERE id = $1")
+	engine_logger.info("[cached since %.4gs ago] (%s,)", 1.5, index)
+	engine_logger.info("ROLLBACK")
+	router_logger.exception(f"OrderItem with ID {index} not found")
+	middleware_logger.info("Applying default CSP")
+
+
+def current_log_calls(index: int) -> None:
+	"""
+	Log like a request does now: debug headers and a plain not found log
+
+	Args:
+		index (int): The request number
+
+	Returns:
+		NoneType: None
+	"""
+	middleware_logger.debug("Applying default CSP")
+	router_logger.info("OrderItem with ID %s not found", index)
+	middleware_logger.debug("Applying default CSP")
+
+
+async def measure(log_calls: Callable[[int], None]) -> float:
+	"""
+	Time the log calls of every simulated request on the event loop
+
+	Args:
+		log_calls (Callable[[int], None]): The log calls of one request
+
+	Returns:
+		float: The mean event-loop time per request in microseconds
+	"""
+	busy: float = 0.0
+	for index in range(REQUESTS):
+		started_at: float = time.perf_counter()
+		log_calls(index)
+		busy += time.perf_counter() - started_at
+		await asyncio.sleep(0)
+	return busy / REQUESTS * 1e6
+
+
+def run_blocking(
+	log_calls: Callable[[int], None], stream: TextIO
+) -> tuple[float, float]:
+	"""
+	Run the requests with a stream handler writing from the event loop
+
+	Args:
+		log_calls (Callable[[int], None]): The log calls of one request
+		stream (TextIO): The log output
+
+	Returns:
+		tuple[float, float]: The loop time per request in microseconds and
+		the time to flush the remaining records in milliseconds
+	"""
+	handler: logging.StreamHandler[TextIO] = logging.StreamHandler(stream)
+	handler.setFormatter(logging.Formatter(InitSettings().LOG_FORMAT))
+	root_logger: logging.Logger = logging.getLogger()
+	root_logger.handlers = [handler]
+	root_logger.setLevel(logging.INFO)
+	return asyncio.run(measure(log_calls)), 0.0
+
+
+def run_queued(
+	log_calls: Callable[[int], None], stream: TextIO
+) -> tuple[float, float]:
+	"""
+	Run the requests through the queue to the JSON listener thread
+
+	Args:
+		log_calls (Callable[[int], None]): The log calls of one request
+		stream (TextIO): The log output
+
+	Returns:
+		tuple[float, float]: The loop time per request in microseconds and
+		the time to flush the remaining records in milliseconds
+	"""
+	settings: Settings = Settings.model_construct(
+		SERVER_LOG_LEVEL="info", LOG_QUEUE_SIZE=REQUESTS * 10
+	)
+	listener: QueueListener = configure_logging(
+		settings, InitSettings(LOG_FORMAT="json"), stream
+	)
+	loop_time: float = asyncio.run(measure(log_calls))
+	started_at: float = time.perf_counter()
+	stop_logging(listener)
+	return loop_time, (time.perf_counter() - started_at) * 1000
+
+
+def main() -> None:
+	"""
+	Print the loop time per request for each logging setup
+
+	Returns:
+		NoneType: None
+	"""
+	print(f"{REQUESTS} requests, log level INFO")
+	print(f"  {'setup':<34}{'loop us/req':>12}{'flush ms':>10}")
+	for title, run, log_calls in (
+		("blocking handler, previous calls", run_blocking, previous_log_calls),
+		("queued JSON, previous calls", run_queued, previous_log_calls),
+		("queued JSON, current calls", run_queued, current_log_calls),
+	):
+		with tempfile.TemporaryFile(mode="w+") as stream:
+			loop_time, flush_time = run(log_calls, stream)
+		print(f"  {title:<34}{loop_time:>12.1f}{flush_time:>10.1f}")
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,121 @@
+"""
+Benchmark of orjson against MessagePack for the API payloads.
+
+Run it from the project root with:
+	python -m benchmarks.serialization_benchmark
+"""
+
+import timeit
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import Any
+from uuid import uuid4
+
+import orjson
+
+from app.core.content_negotiation import packb, unpackb
+
+ROWS: int = 500
+REPEAT: int = 200
+
+
+def build_orders(rows: int) -> list[dict[str, Any]]:
+	"""
+	Build order rows shaped like the ones returned by GET /order
+
+	Args:
+		rows (int): The number of rows to build
+
+	Returns:
+		list[dict[str, Any]]: The order rows
+	"""
+	return [
+		{
+			"id": uuid4(),
+			"user_id": uuid4(),
+			"total_amount": 1234.56 + index,
+			"created_at": datetime.now(UTC),
+		}
+		for index in range(rows)
+	]
+
+
+def build_products(rows: int) -> list[dict[str, Any]]:
+	"""
+	Build product rows shaped like the ones returned by GET /product
+
+	Args:
+		rows (int): The number of rows to build
+
+	Returns:
+		list[dict[str, Any]]: The product rows
+	"""
+	return [
+		{
+			"id": uuid4(),
+			"name": f"Product {index}",
+			"description": "A product description. " * 8,
+			"price": 19.99 + index,
+			"stock": index,
+			"category": "general",
+			"is_active": True,
+			"created_at": datetime.now(UTC),
+			"updated_at": None,
+		}
+		for index in range(rows)
+	]
+
+
+def measure(function: Callable[[], Any]) -> float:
+	"""
+	Measure the mean time of a call in microseconds
+
+	Args:
+		function (Callable[[], Any]): The call to measure
+
+	Returns:
+		float: The mean time per call in microseconds
+	"""
+	return timeit.timeit(function, number=REPEAT) / REPEAT * 1_000_000
+
+
+def compare(name: str, payload: list[dict[str, Any]]) -> None:
+	"""
+	Print encode time, decode time and size for both encodings
+
+	Args:
+		name (str): The payload name
+		payload (list[dict[str, Any]]): The rows to encode
+
+	Returns:
+		NoneType: None
+	"""
+	json_bytes: bytes = orjson.dumps(payload)
+	msgpack_bytes: bytes = packb(payload)
+	print(f"{name} ({len(payload)} rows)")
+	print(f"  {'codec':<8}{'encode us':>12}{'decode us':>12}{'bytes':>10}")
+	print(
+		f"  {'orjson':<8}{measure(lambda: orjson.dumps(payload)):>12.1f}"
+		f"{measure(lambda: orjson.loads(json_bytes)):>12.1f}"
+		f"{len(json_bytes):>10}"
+	)
+	print(
+		f"  {'msgpack':<8}{measure(lambda: packb(payload)):>12.1f}"
+		f"{measure(lambda: unpackb(msgpack_bytes)):>12.1f}"
+		f"{len(msgpack_bytes):>10}"
+	)
+
+
+def main() -> None:
+	"""
+	Run the serialization benchmark
+
+	Returns:
+		NoneType: None
+	"""
+	compare("orders", build_orders(ROWS))
+	compare("products", build_products(ROWS))
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,108 @@
+"""
+Benchmark of the worker import time, with a per-module breakdown.
+
+The lifespan phases need the databases, so each worker logs them at
+startup and exports them as startup_phase_duration_seconds instead.
+
+Run it from the project root with:
+	python -m benchmarks.startup_benchmark
+"""
+
+import statistics
+import subprocess
+import sys
+import time
+
+MODULE: str = "main"
+RUNS: int = 5
+TOP: int = 20
+
+
+def import_module_in_subprocess(module: str) -> tuple[float, str]:
+	"""
+	Import a module in a fresh interpreter with import timing enabled
+
+	Args:
+		module (str): The module to import
+
+	Returns:
+		tuple[float, str]: The wall time in seconds and the importtime log
+	"""
+	started_at: float = time.perf_counter()
+	completed: subprocess.CompletedProcess[str] = subprocess.run(
+		[sys.executable, "-X", "importtime", "-c", f"import {module}"],
+		capture_output=True,
+		check=True,
+		text=True,
+	)
+	return time.perf_counter() - started_at, completed.stderr
+
+
+def parse_import_times(log: str) -> list[tuple[str, int, int]]:
+	"""
+	Parse the output of python -X importtime
+
+	Args:
+		log (str): The importtime log
+
+	Returns:
+		list[tuple[str, int, int]]: The module name, self time and
+		cumulative time in microseconds
+	"""
+	import_times: list[tuple[str, int, int]] = []
+	for line in log.splitlines():
+		if not line.startswith("import time:") or "self [us]" in line:
+			continue
+		self_us, cumulative_us, name = line.removeprefix("import time:").split(
+			"|"
+		)
+		import_times.append((name.strip(), int(self_us), int(cumulative_us)))
+	return import_times
+
+
+def print_top(
+	title: str, import_times: list[tuple[str, int, int]], index: int
+) -> None:
+	"""
+	Print the slowest modules by one of the timings
+
+	Args:
+		title (str): The table title
+		import_times (list[tuple[str, int, int]]): The parsed import times
+		index (int): 1 to sort by self time, 2 by cumulative time
+
+	Returns:
+		NoneType: None
+	"""
+	print(title)
+	print(f"  {'module':<60}{'self ms':>10}{'cumul ms':>10}")
+	for name, self_us, cumulative_us in sorted(
+		import_times, key=lambda row: row[index], reverse=True
+	)[:TOP]:
+		print(
+			f"  {name:<60}{self_us / 1000:>10.1f}{cumulative_us / 1000:>10.1f}"
+		)
+
+
+def main() -> None:
+	"""
+	Run the startup benchmark
+
+	Returns:
+		NoneType: None
+	"""
+	runs: list[tuple[float, str]] = [
+		import_module_in_subprocess(MODULE) for _ in range(RUNS)
+	]
+	wall_times: list[float] = [wall_time for wall_time, _ in runs]
+	print(
+		f"import {MODULE}: median {statistics.median(wall_times) * 1000:.0f} ms,"
+		f" min {min(wall_times) * 1000:.0f} ms over {RUNS} runs"
+	)
+	import_times: list[tuple[str, int, int]] = parse_import_times(runs[-1][1])
+	print_top("Slowest modules by self time", import_times, 1)
+	print_top("Slowest modules by cumulative time", import_times, 2)
+
+
+if __name__ == "__main__":
+	main()
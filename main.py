@@ -1,31 +1,49 @@
 import base64
 from functools import partial
-from typing import Annotated
+from typing import Any
 
 import uvicorn
-from fastapi import Depends, FastAPI, status
+from fastapi import FastAPI, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.requests import Request
-from fastapi.responses import HTMLResponse, ORJSONResponse, RedirectResponse
+from fastapi.responses import (
+	HTMLResponse,
+	ORJSONResponse,
+	RedirectResponse,
+	Response,
+)
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from pydantic import PositiveInt
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.api_v1.api import api_router
 from app.config.config import auth_setting, init_setting, setting
+from app.core.content_negotiation import NegotiatedResponse
+from app.core.health_monitor import HealthMonitor
 from app.core.lifecycle import lifespan
-from app.db.session import check_db_health, get_session
+from app.core.metrics import render_metrics
+from app.core.openapi_artifact import OpenAPIArtifact
+from app.core.shutdown import get_shutdown_coordinator
+from app.middlewares.admission_control_middleware import (
+	AdmissionControlMiddleware,
+)
+from app.middlewares.metrics_middleware import MetricsMiddleware
+from app.middlewares.profiling_middleware import ProfilingMiddleware
 from app.middlewares.security_headers_middleware import (
 	SecurityHeadersMiddleware,
 )
+from app.middlewares.server_timing_middleware import ServerTimingMiddleware
+from app.middlewares.shutdown_middleware import ShutdownMiddleware
+from app.schemas.health import HealthResponse
+from app.tasks.email_tasks.template import get_template_environment
 from app.utils.openapi_utils import custom_generate_unique_id, custom_openapi
 
+openapi_path: str = f"{auth_setting.API_V1_STR}{init_setting.OPENAPI_FILE_PATH}"
 app: FastAPI = FastAPI(
-	openapi_url=f"{auth_setting.API_V1_STR}{init_setting.OPENAPI_FILE_PATH}",
+	openapi_url=None,
 	debug=True,
-	default_response_class=ORJSONResponse,
+	default_response_class=NegotiatedResponse,
 	lifespan=lifespan,
 	generate_unique_id_function=custom_generate_unique_id,
 	docs_url=None,
@@ -37,9 +55,28 @@ app.add_middleware(
 	allow_methods=["*"],
 	allow_headers=["*"],
 	allow_credentials=True,
+	expose_headers=["Server-Timing", "X-Request-ID"],
 )
 app.add_middleware(SecurityHeadersMiddleware)
 app.add_middleware(GZipMiddleware)
+app.add_middleware(
+	AdmissionControlMiddleware,
+	max_in_flight=setting.ADMISSION_MAX_IN_FLIGHT,
+	max_queue=setting.ADMISSION_MAX_QUEUE,
+	queue_timeout=setting.ADMISSION_QUEUE_TIMEOUT_SECONDS,
+	retry_after=setting.ADMISSION_RETRY_AFTER_SECONDS,
+	bypass_paths=setting.ADMISSION_BYPASS_PATHS,
+)
+app.add_middleware(ShutdownMiddleware, coordinator=get_shutdown_coordinator())
+app.add_middleware(ServerTimingMiddleware, access_log=setting.ACCESS_LOG)
+app.add_middleware(MetricsMiddleware)
+if setting.PROFILING_ENABLED:
+	app.add_middleware(
+		ProfilingMiddleware,
+		secret_key=auth_setting.SECRET_KEY,
+		max_validity=setting.PROFILING_MAX_VALIDITY_SECONDS,
+		interval=setting.PROFILING_INTERVAL_SECONDS,
+	)
 
 app.mount(
 	init_setting.ASSETS_DIR,
@@ -48,9 +85,7 @@ app.mount(
 	),
 	name=init_setting.ASSETS_APP,
 )
-templates: Jinja2Templates = Jinja2Templates(
-	directory=init_setting.TEMPLATES_DIR, autoescape=False, auto_reload=True
-)
+templates: Jinja2Templates = Jinja2Templates(env=get_template_environment())
 app.include_router(api_router, prefix=auth_setting.API_V1_STR)
 
 
@@ -70,6 +105,21 @@ async def redirect_to_docs() -> RedirectResponse:
 	return RedirectResponse("/docs")
 
 
+@app.get(openapi_path, include_in_schema=False)
+async def get_openapi_schema(request: Request) -> Response:
+	"""
+	Serve the prebuilt OpenAPI document from memory
+
+	Args:
+		request (Request): The FastAPI request from the server
+
+	Returns:
+		Response: The document in the best encoding the client accepts
+	"""
+	artifact: OpenAPIArtifact = request.app.state.openapi_artifact
+	return artifact.response(request)
+
+
 @app.get("/docs", include_in_schema=False)
 async def custom_swagger_ui_html(request: Request) -> HTMLResponse:
 	"""
@@ -82,7 +132,7 @@ async def custom_swagger_ui_html(request: Request) -> HTMLResponse:
 		HTMLResponse: The response in HTML
 	"""
 	root_path = request.scope.get("root_path", "").rstrip("/")
-	openapi_url = root_path + app.openapi_url
+	openapi_url = root_path + openapi_path
 	oauth2_redirect_url = app.swagger_ui_oauth2_redirect_url
 	if oauth2_redirect_url:
 		oauth2_redirect_url = root_path + oauth2_redirect_url
@@ -119,30 +169,109 @@ async def custom_swagger_ui_html(request: Request) -> HTMLResponse:
 	    """)  # noqa: E101
 
 
+def _health_report(request: Request) -> HealthResponse | None:
+	"""
+	Get the cached dependency health of this worker
+
+	Args:
+		request (Request): The FastAPI request from the server
+
+	Returns:
+		HealthResponse | None: The report, or None before the first probe
+	"""
+	monitor: HealthMonitor | None = getattr(
+		request.app.state, "health_monitor", None
+	)
+	return monitor.report() if monitor else None
+
+
 @app.get("/health")
-async def check_health(
-	session: Annotated[AsyncSession, Depends(get_session)],
-) -> ORJSONResponse:
+async def check_health(request: Request) -> ORJSONResponse:
 	"""
 	**Check the health of the application backend.**
 
+	The dependencies are probed in the background, so this only reads the
+	latest results and their latency.
+
 	## Returns:
 		ORJSONResponse: The JSON response from the health check
 
 	\f
 	Args:
-		session (AsyncSession): The database session as a dependency injection
+		request (Request): The FastAPI request from the server
+	"""
+	report: HealthResponse | None = _health_report(request)
+	if report is None:
+		return ORJSONResponse(
+			{"status": "unhealthy"},
+			status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+		)
+	status_code: PositiveInt = (
+		status.HTTP_503_SERVICE_UNAVAILABLE
+		if report.status == "unhealthy"
+		else status.HTTP_200_OK
+	)
+	return ORJSONResponse(
+		report.model_dump(mode="json"), status_code=status_code
+	)
+
+
+@app.get("/health/live")
+async def check_liveness() -> ORJSONResponse:
+	"""
+	**Check whether this worker process is alive.**
+
+	It never depends on the backing services, so an outage of one of them
+	does not get healthy workers restarted.
+
+	## Returns:
+		ORJSONResponse: The JSON response from the liveness check
+	"""
+	return ORJSONResponse({"status": "alive"})
+
+
+@app.get("/health/ready")
+async def check_readiness(request: Request) -> ORJSONResponse:
+	"""
+	**Check whether this worker is ready to receive traffic.**
+
+	The worker is ready once its connection pools are warmed up and its
+	critical dependencies passed their last background probe, and stops
+	being ready as soon as it starts shutting down.
+
+	## Returns:
+		ORJSONResponse: The JSON response from the readiness check
+
+	\f
+	Args:
+		request (Request): The FastAPI request from the server
+	"""
+	report: HealthResponse | None = _health_report(request)
+	dependencies: dict[str, Any] = (
+		report.model_dump(mode="json")["dependencies"] if report else {}
+	)
+	if (
+		getattr(request.app.state, "ready", False)
+		and report is not None
+		and report.status != "unhealthy"
+	):
+		return ORJSONResponse({"status": "ready", "dependencies": dependencies})
+	return ORJSONResponse(
+		{"status": "not ready", "dependencies": dependencies},
+		status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+	)
+
+
+@app.get("/metrics", include_in_schema=False)
+async def get_metrics() -> Response:
+	"""
+	Expose the application metrics in the Prometheus text format
+
+	Returns:
+		Response: The metrics payload
 	"""
-	print("ok")
-	print(session)
-	health_status: dict[str, str] = {
-		"status": "healthy",
-	}
-	status_code: PositiveInt = status.HTTP_200_OK
-	if not await check_db_health(session):
-		health_status["status"] = "unhealthy"
-		status_code = status.HTTP_503_SERVICE_UNAVAILABLE
-	return ORJSONResponse(health_status, status_code=status_code)
+	payload, content_type = render_metrics()
+	return Response(payload, media_type=content_type)
 
 
 if __name__ == "__main__":
@@ -152,4 +281,5 @@ if __name__ == "__main__":
 		port=setting.PORT,
 		reload=setting.SERVER_RELOAD,
 		log_level=setting.SERVER_LOG_LEVEL,
+		timeout_graceful_shutdown=int(setting.SHUTDOWN_DRAIN_TIMEOUT_SECONDS),
 	)
@@ -0,0 +1,11 @@
+"""
+Shared configuration of the test suite.
+"""
+
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+# The settings are read from the environment when the app is imported, so
+# the sample values fill in whatever the environment does not set
+load_dotenv(Path(__file__).parents[1] / ".env.sample", override=False)
@@ -0,0 +1,135 @@
+"""
+Tests for the bearer token verification and the password login.
+"""
+
+import base64
+import time
+from typing import Any
+from uuid import uuid4
+
+import orjson
+import pytest
+from authlib.jose import JsonWebToken
+
+from app.config.auth_settings import AuthSettings
+from app.config.config import get_auth_settings
+from app.core.enums.toke_type import TokenType
+from app.core.security.authentication import authenticate_user, verify_token
+from app.core.security.jwt import create_access_token
+from app.core.security.password import PasswordHasher, get_password_hasher
+from app.exceptions.exceptions import InvalidTokenError
+from app.models.structured.user import User
+from app.repositories.structured.user_repository import UserRepository
+from app.schemas.external.token_payload import TokenPayload
+
+
+@pytest.fixture
+def auth_settings() -> AuthSettings:
+	return get_auth_settings()
+
+
+@pytest.fixture
+def claims(auth_settings: AuthSettings) -> dict[str, Any]:
+	now: int = int(time.time())
+	return {
+		"iss": str(auth_settings.SERVER_URL),
+		"sub": f"username:{uuid4()}",
+		"aud": str(auth_settings.AUDIENCE),
+		"exp": now + 600,
+		"nbf": now,
+		"iat": now,
+		"jti": str(uuid4()),
+		"email": "someone@example.com",
+		"nickname": "Someone",
+		"preferred_username": "someone",
+		"scope": TokenType.ACCESS_TOKEN,
+	}
+
+
+def _b64(data: dict[str, Any]) -> str:
+	return base64.urlsafe_b64encode(orjson.dumps(data)).rstrip(b"=").decode()
+
+
+def test_accepts_signed_token(
+	auth_settings: AuthSettings, claims: dict[str, Any]
+) -> None:
+	token: str = create_access_token(TokenPayload(**claims), auth_settings)
+	assert verify_token(token, auth_settings).sub == claims["sub"]
+
+
+def test_rejects_unsigned_token(
+	auth_settings: AuthSettings, claims: dict[str, Any]
+) -> None:
+	token: str = f"{_b64({'alg': 'none', 'typ': 'JWT'})}.{_b64(claims)}."
+	with pytest.raises(InvalidTokenError):
+		verify_token(token, auth_settings)
+
+
+@pytest.mark.parametrize("algorithm", ["HS384", "HS512"])
+def test_rejects_other_algorithm(
+	auth_settings: AuthSettings, claims: dict[str, Any], algorithm: str
+) -> None:
+	token: str = (
+		JsonWebToken([algorithm])
+		.encode({"alg": algorithm}, claims, auth_settings.SECRET_KEY)
+		.decode()
+	)
+	with pytest.raises(InvalidTokenError):
+		verify_token(token, auth_settings)
+
+
+@pytest.mark.parametrize(
+	("claim", "value"),
+	[("iss", "https://issuer.example.com/"), ("aud", "someone-else")],
+)
+def test_rejects_foreign_token(
+	auth_settings: AuthSettings, claims: dict[str, Any], claim: str, value: str
+) -> None:
+	token: str = create_access_token(
+		TokenPayload(**{**claims, claim: value}), auth_settings
+	)
+	with pytest.raises(InvalidTokenError):
+		verify_token(token, auth_settings)
+
+
+def test_rejects_refresh_token_as_access(
+	auth_settings: AuthSettings, claims: dict[str, Any]
+) -> None:
+	token: str = create_access_token(
+		TokenPayload(**{**claims, "scope": TokenType.REFRESH_TOKEN}),
+		auth_settings,
+	)
+	with pytest.raises(InvalidTokenError):
+		verify_token(token, auth_settings)
+
+
+@pytest.mark.asyncio
+async def test_unknown_username_still_verifies_a_password(
+	monkeypatch: pytest.MonkeyPatch,
+) -> None:
+	operations: list[str] = []
+
+	async def get_by_username(*_: Any) -> User | None:
+		return None
+
+	async def run(_self: PasswordHasher, operation: str, *_args: Any) -> Any:
+		operations.append(operation)
+		return "dummy-hash" if operation == "hash" else (False, None)
+
+	monkeypatch.setattr(UserRepository, "get_by_username", get_by_username)
+	monkeypatch.setattr(PasswordHasher, "_run", run)
+	get_password_hasher.cache_clear()
+	try:
+		for _ in range(2):
+			assert (
+				await authenticate_user(
+					f"nobody-{uuid4()}",
+					"password",
+					None,  # type: ignore[arg-type]
+				)
+				is None
+			)
+	finally:
+		get_password_hasher.cache_clear()
+	# The dummy hash is made once, then each login verifies against it
+	assert operations == ["hash", "verify", "verify"]
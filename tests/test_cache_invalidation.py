@@ -0,0 +1,169 @@
+"""
+Tests for the cache invalidation of the update endpoints.
+"""
+
+import time
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from typing import Any, cast
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.api_v1.router.product import update_product
+from app.api.api_v1.router.user import update_user
+from app.core.entity_cache import EntityCache, get_many_through_cache
+from app.core.security.authentication import get_user_cache
+from app.repositories.structured.product_repository import ProductRepository
+from app.repositories.structured.user_repository import UserRepository
+from app.schemas.product import ProductResponse, ProductUpdate
+from app.schemas.user import UserResponse, UserUpdate
+
+
+class FakeMemcached:
+	"""Stores the values in a dictionary, ignoring their expiry."""
+
+	def __init__(self) -> None:
+		self.values: dict[str, bytes] = {}
+
+	def get_multi(self, keys: list[str]) -> dict[str, bytes]:
+		return {key: self.values[key] for key in keys if key in self.values}
+
+	def set_multi(self, mappings: dict[str, bytes], time: int) -> None:
+		self.values.update(mappings)
+
+	def delete(self, key: str) -> None:
+		self.values.pop(key, None)
+
+
+class FakeSession:
+	"""
+	Keeps the committed rows apart from the flushed ones, and runs the
+	reads racing the write right before the commit.
+	"""
+
+	def __init__(self, rows: dict[UUID, dict[str, Any]]):
+		self.committed: dict[UUID, dict[str, Any]] = rows
+		self.flushed: dict[UUID, dict[str, Any]] = {}
+		self.racing_reads: list[Callable[[], Awaitable[None]]] = []
+
+	async def commit(self) -> None:
+		for read in self.racing_reads:
+			await read()
+		self.racing_reads = []
+		self.committed.update(self.flushed)
+		self.flushed = {}
+
+
+@pytest.fixture
+def fake_repositories(monkeypatch: pytest.MonkeyPatch) -> None:
+	async def get(self: Any, _id: UUID, *_: Any) -> dict[str, Any] | None:
+		row: dict[str, Any] | None = self.session.committed.get(_id)
+		return row
+
+	async def update(
+		self: Any, obj: dict[str, Any], new_data: dict[str, Any]
+	) -> dict[str, Any]:
+		row: dict[str, Any] = {**obj, **new_data}
+		self.session.flushed[row["id"]] = row
+		return row
+
+	async def fetch_rows_by_ids(
+		self: Any, _columns: Any, ids: list[UUID]
+	) -> list[dict[str, Any]]:
+		return [self.session.committed[_id] for _id in ids]
+
+	for repository in (ProductRepository, UserRepository):
+		monkeypatch.setattr(repository, "get", get)
+		monkeypatch.setattr(repository, "update", update)
+		monkeypatch.setattr(repository, "fetch_rows_by_ids", fetch_rows_by_ids)
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("fake_repositories")
+async def test_product_update_is_not_undone_by_a_racing_read() -> None:
+	product_id: UUID = uuid4()
+	session: FakeSession = FakeSession(
+		{
+			product_id: {
+				"id": product_id,
+				"name": "Old name",
+				"price": 1.0,
+				"stock": 1,
+				"created_at": datetime.now(UTC),
+			}
+		}
+	)
+	cache: EntityCache = EntityCache(FakeMemcached(), "product", 300)
+
+	async def read() -> None:
+		await get_many_through_cache(
+			[product_id],
+			cache,
+			ProductRepository(cast(AsyncSession, session)),
+			ProductResponse,
+		)
+
+	session.racing_reads.append(read)
+	await update_product(
+		product_id,
+		ProductUpdate(name="New name"),
+		cache,
+		cast(AsyncSession, session),
+	)
+	items: list[dict[str, Any] | None] = await get_many_through_cache(
+		[product_id],
+		cache,
+		ProductRepository(cast(AsyncSession, session)),
+		ProductResponse,
+	)
+	assert items[0] is not None
+	assert items[0]["name"] == "New name"
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("fake_repositories")
+async def test_user_update_is_not_undone_by_a_racing_read() -> None:
+	user_id: UUID = uuid4()
+	old_user: dict[str, Any] = {
+		"id": user_id,
+		"username": "someone",
+		"email": "someone@example.com",
+		"first_name": "Some",
+		"last_name": "One",
+		"is_active": True,
+		"is_superuser": False,
+		"created_at": datetime.now(UTC),
+	}
+	session: FakeSession = FakeSession({user_id: old_user})
+	cache: EntityCache = EntityCache(FakeMemcached(), "user", 300)
+
+	async def read() -> None:
+		await get_many_through_cache(
+			[user_id],
+			cache,
+			UserRepository(cast(AsyncSession, session)),
+			UserResponse,
+		)
+		# As get_current_user refills the user cache of the worker
+		get_user_cache().set(
+			user_id, UserResponse.model_validate(old_user), time.time() + 60
+		)
+
+	session.racing_reads.append(read)
+	await update_user(
+		user_id,
+		UserUpdate(is_active=False),
+		cache,
+		cast(AsyncSession, session),
+	)
+	items: list[dict[str, Any] | None] = await get_many_through_cache(
+		[user_id],
+		cache,
+		UserRepository(cast(AsyncSession, session)),
+		UserResponse,
+	)
+	assert items[0] is not None
+	assert items[0]["is_active"] is False
+	assert get_user_cache().get(user_id) is None
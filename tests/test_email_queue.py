@@ -0,0 +1,228 @@
+"""
+Tests for the background email queue.
+"""
+
+import asyncio
+import random
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+import orjson
+import pytest
+from pydantic import PositiveInt
+
+from app.config.config import (
+	get_auth_settings,
+	get_init_settings,
+	get_settings,
+)
+from app.core.interfaces.email_sender_interface import IEmailSender
+from app.exceptions.exceptions import EmailDeliveryError
+from app.schemas.email import EmailMessage
+from app.tasks.email_tasks import email_tasks
+from app.tasks.email_tasks.email_queue import EmailQueue
+
+
+class FakeEmailSender(IEmailSender):
+	"""
+	Records the batches it is given, failing the first ones on demand and
+	rejecting every batch with a bad recipient.
+	"""
+
+	def __init__(
+		self,
+		max_batch_size: PositiveInt = 100,
+		transient_failures: int = 0,
+		rejected: frozenset[str] = frozenset(),
+		delay: float = 0,
+	):
+		self.max_batch_size = max_batch_size
+		self.transient_failures: int = transient_failures
+		self.rejected: frozenset[str] = rejected
+		self.delay: float = delay
+		self.calls: list[tuple[list[str], str]] = []
+		self.sent: list[str] = []
+
+	async def send_batch(
+		self, messages: Sequence[EmailMessage], idempotency_key: str
+	) -> None:
+		recipients: list[str] = [message.email_to for message in messages]
+		self.calls.append((recipients, idempotency_key))
+		if self.delay:
+			await asyncio.sleep(self.delay)
+		if self.transient_failures:
+			self.transient_failures -= 1
+			raise EmailDeliveryError("Service unavailable")
+		if self.rejected.intersection(recipients):
+			raise EmailDeliveryError("Invalid recipient", transient=False)
+		self.sent.extend(recipients)
+
+
+def _message(index: int) -> EmailMessage:
+	return EmailMessage(
+		email_to=f"user{index}@example.com", subject="Hello", html="<p>Hi</p>"
+	)
+
+
+def _queue(sender: IEmailSender, tmp_path: Path, **options: Any) -> EmailQueue:
+	settings: dict[str, Any] = {
+		"workers": 1,
+		"max_size": 100,
+		"batch_wait": 0.01,
+		"max_attempts": 3,
+		"retry_base": 0.01,
+		"drain_timeout": 5,
+	}
+	settings.update(options)
+	return EmailQueue(
+		sender, dead_letter_path=tmp_path / "dead.jsonl", **settings
+	)
+
+
+def _dead_letters(tmp_path: Path) -> list[dict[str, Any]]:
+	path: Path = tmp_path / "dead.jsonl"
+	if not path.exists():
+		return []
+	return [orjson.loads(line) for line in path.read_bytes().splitlines()]
+
+
+@pytest.mark.asyncio
+async def test_sends_messages_in_batches_of_the_sender(tmp_path: Path) -> None:
+	sender: FakeEmailSender = FakeEmailSender(max_batch_size=2)
+	queue: EmailQueue = _queue(sender, tmp_path)
+	futures: list[asyncio.Future[bool]] = [
+		queue.submit_nowait(_message(index)) for index in range(5)
+	]
+	queue.start()
+	assert await asyncio.gather(*futures) == [True] * 5
+	await queue.stop()
+	assert [len(recipients) for recipients, _ in sender.calls] == [2, 2, 1]
+	assert len({key for _, key in sender.calls}) == 3
+	assert _dead_letters(tmp_path) == []
+
+
+@pytest.mark.asyncio
+async def test_retries_transient_failures_with_backoff(
+	monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+	delays: list[float] = []
+	sleep = asyncio.sleep
+
+	async def record_sleep(delay: float) -> None:
+		delays.append(delay)
+		await sleep(0)
+
+	monkeypatch.setattr(asyncio, "sleep", record_sleep)
+	monkeypatch.setattr(random, "uniform", lambda _, high: high)
+	sender: FakeEmailSender = FakeEmailSender(transient_failures=2)
+	queue: EmailQueue = _queue(sender, tmp_path)
+	queue.start()
+	assert await (await queue.submit(_message(0))) is True
+	await queue.stop()
+	assert delays == [0.01, 0.02]
+	# Every attempt reuses the key, so the provider drops duplicates
+	assert len(sender.calls) == 3
+	assert len({key for _, key in sender.calls}) == 1
+
+
+@pytest.mark.asyncio
+async def test_dead_letters_after_the_last_attempt(tmp_path: Path) -> None:
+	sender: FakeEmailSender = FakeEmailSender(transient_failures=10)
+	queue: EmailQueue = _queue(sender, tmp_path, retry_base=0.001)
+	futures: list[asyncio.Future[bool]] = [
+		queue.submit_nowait(_message(index)) for index in range(2)
+	]
+	queue.start()
+	assert await asyncio.gather(*futures) == [False, False]
+	await queue.stop()
+	assert len(sender.calls) == 3
+	assert [line["email_to"] for line in _dead_letters(tmp_path)] == [
+		"user0@example.com",
+		"user1@example.com",
+	]
+	assert _dead_letters(tmp_path)[0]["reason"] == "Service unavailable"
+
+
+@pytest.mark.asyncio
+async def test_dead_letters_only_the_rejected_message(tmp_path: Path) -> None:
+	sender: FakeEmailSender = FakeEmailSender(
+		rejected=frozenset(("user2@example.com",))
+	)
+	queue: EmailQueue = _queue(sender, tmp_path)
+	futures: list[asyncio.Future[bool]] = [
+		queue.submit_nowait(_message(index)) for index in range(5)
+	]
+	queue.start()
+	assert await asyncio.gather(*futures) == [True, True, False, True, True]
+	await queue.stop()
+	assert sorted(sender.sent) == [
+		"user0@example.com",
+		"user1@example.com",
+		"user3@example.com",
+		"user4@example.com",
+	]
+	# A rejection is not retried, the batch is split instead
+	assert [recipients for recipients, _ in sender.calls].count(
+		["user2@example.com"]
+	) == 1
+	assert [line["email_to"] for line in _dead_letters(tmp_path)] == [
+		"user2@example.com"
+	]
+
+
+@pytest.mark.asyncio
+async def test_stop_drains_the_queued_messages(tmp_path: Path) -> None:
+	sender: FakeEmailSender = FakeEmailSender(max_batch_size=2, delay=0.01)
+	queue: EmailQueue = _queue(sender, tmp_path)
+	queue.start()
+	futures: list[asyncio.Future[bool]] = [
+		await queue.submit(_message(index)) for index in range(5)
+	]
+	await queue.stop()
+	assert [future.result() for future in futures] == [True] * 5
+	closed: asyncio.Future[bool] = await queue.submit(_message(5))
+	assert await closed is False
+	assert [line["reason"] for line in _dead_letters(tmp_path)] == [
+		"queue closed"
+	]
+
+
+@pytest.mark.asyncio
+async def test_stop_dead_letters_what_the_drain_timeout_leaves(
+	tmp_path: Path,
+) -> None:
+	sender: FakeEmailSender = FakeEmailSender(max_batch_size=1, delay=1)
+	queue: EmailQueue = _queue(sender, tmp_path, drain_timeout=0.05)
+	queue.start()
+	futures: list[asyncio.Future[bool]] = [
+		await queue.submit(_message(index)) for index in range(3)
+	]
+	await queue.stop()
+	assert [await future for future in futures] == [False] * 3
+	assert sorted(line["reason"] for line in _dead_letters(tmp_path)) == [
+		"interrupted",
+		"shutdown",
+		"shutdown",
+	]
+
+
+@pytest.mark.asyncio
+async def test_confirmation_email_is_queued_from_the_loop(
+	monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+	sender: FakeEmailSender = FakeEmailSender()
+	queue: EmailQueue = _queue(sender, tmp_path)
+	monkeypatch.setattr(email_tasks, "get_email_queue", lambda: queue)
+	queue.start()
+	await email_tasks.send_new_account_confirmation_email(
+		"someone@example.com",
+		"Someone",
+		"Welcome",
+		get_settings(),
+		get_auth_settings(),
+		get_init_settings(),
+	)
+	await queue.stop()
+	assert sender.sent == ["someone@example.com"]
+	assert _dead_letters(tmp_path) == []
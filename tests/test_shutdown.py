@@ -0,0 +1,61 @@
+"""
+Tests for the graceful shutdown of a worker.
+"""
+
+import signal
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+from starlette.types import Message, Receive, Scope, Send
+from uvicorn import Config
+
+from app.core.prefork_server import DrainingServer
+from app.core.shutdown import ShutdownCoordinator, get_shutdown_coordinator
+from app.middlewares.shutdown_middleware import ShutdownMiddleware
+
+
+@pytest.fixture
+def coordinator() -> Iterator[ShutdownCoordinator]:
+	coordinator: ShutdownCoordinator = get_shutdown_coordinator()
+	coordinator.draining = False
+	yield coordinator
+	coordinator.draining = False
+
+
+async def _app(_scope: Scope, _receive: Receive, send: Send) -> None:
+	await send({"type": "http.response.start", "status": 200, "headers": []})
+	await send({"type": "http.response.body", "body": b"ok"})
+
+
+async def _request(middleware: ShutdownMiddleware) -> list[Message]:
+	messages: list[Message] = []
+
+	async def receive() -> Message:
+		return {"type": "http.request", "body": b""}
+
+	async def send(message: Message) -> None:
+		messages.append(message)
+
+	scope: dict[str, Any] = {"type": "http", "method": "GET", "path": "/"}
+	await middleware(scope, receive, send)
+	return messages
+
+
+def test_stop_signal_starts_draining(coordinator: ShutdownCoordinator) -> None:
+	server: DrainingServer = DrainingServer(Config(_app))
+	server.handle_exit(signal.SIGTERM, None)
+	assert server.should_exit
+	assert coordinator.draining
+
+
+@pytest.mark.asyncio
+async def test_draining_worker_refuses_new_requests(
+	coordinator: ShutdownCoordinator,
+) -> None:
+	middleware: ShutdownMiddleware = ShutdownMiddleware(_app, coordinator)
+	assert (await _request(middleware))[0]["status"] == 200
+	coordinator.start_draining()
+	start: Message = (await _request(middleware))[0]
+	assert start["status"] == 503
+	assert (b"connection", b"close") in start["headers"]